@@ -0,0 +1,5 @@
+from django.apps import AppConfig
+
+
+class ArticleBodiesConfig(AppConfig):
+    name = 'article_bodies'
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.article_bodies.models import ArticleBody
+from authors.apps.articles.models import Article
+
+
+class Command(BaseCommand):
+    """
+        Move the bodies of articles saved before ArticleBody existed out
+        of the articles table. Run it once after migrating, which keeps
+        the `body` column and its data; articles read their body from the
+        column until this command empties it. Running it again moves
+        nothing.
+    """
+    help = "Move article bodies from the articles table into ArticleBody"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Number of articles moved per transaction")
+
+    def handle(self, *args, **options):
+        articles = Article.objects.exclude(body='').order_by(
+            'pk').only('pk', 'body')
+        last_pk, moved = 0, 0
+        while True:
+            batch = list(articles.filter(pk__gt=last_pk)[
+                :options['batch_size']])
+            if not batch:
+                break
+            with transaction.atomic():
+                # bodies saved since migrating are already in ArticleBody
+                stored = set(ArticleBody.objects.filter(
+                    article__in=batch).values_list('article_id', flat=True))
+                ArticleBody.objects.bulk_create(
+                    ArticleBody(article_id=article.pk,
+                                **ArticleBody.pack(article.body))
+                    for article in batch if article.pk not in stored)
+                # update() leaves updated_at, and so exports, alone
+                Article.objects.filter(pk__in=[
+                    article.pk for article in batch]).update(body='')
+            moved += len(batch)
+            last_pk = batch[-1].pk
+        self.stdout.write("Moved {} article bodies".format(moved))
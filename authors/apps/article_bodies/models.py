@@ -0,0 +1,57 @@
+"""
+    Article bodies, stored one-to-one with the articles they belong to.
+
+    List queries scan the articles table for titles, excerpts and
+    counters; keeping the bodies in their own table keeps those rows
+    small. The body is read only when `Article.body_text` is used, which the
+    article detail view does with select_related('content').
+"""
+import zlib
+
+from django.conf import settings
+from django.db import models
+
+from authors.apps.articles.models import Article
+
+# bodies of at least this many bytes are stored zlib-compressed. None
+# keeps every body plain, which the substring filters need to search
+# bodies when the full-text index is not available.
+BODY_COMPRESS_AT = getattr(settings, 'ARTICLE_BODY_COMPRESS_AT', None)
+
+
+class ArticleBody(models.Model):
+    """
+        The body of an article. Bodies of at least BODY_COMPRESS_AT
+        bytes are stored zlib-compressed in place of the text.
+    """
+    # no foreign key constraint: on SQLite 3.26+ Django 2.1.4 leaves
+    # constraints on the articles table dangling when the articles
+    # migrations rebuild it. Deleting an article still deletes its body.
+    article = models.OneToOneField(
+        Article, primary_key=True, related_name='content',
+        on_delete=models.CASCADE, db_constraint=False)
+    text = models.TextField(blank=True, default='')
+    compressed = models.BinaryField(null=True)
+
+    @staticmethod
+    def pack(body):
+        """
+            The column values storing body
+        """
+        body = body or ''
+        if BODY_COMPRESS_AT is not None:
+            data = body.encode()
+            if len(data) >= BODY_COMPRESS_AT:
+                compressed = zlib.compress(data)
+                if len(compressed) < len(data):
+                    return {'text': '', 'compressed': compressed}
+        return {'text': body, 'compressed': None}
+
+    @property
+    def body(self):
+        """
+            The stored body, decompressed
+        """
+        if self.compressed is None:
+            return self.text
+        return zlib.decompress(bytes(self.compressed)).decode()
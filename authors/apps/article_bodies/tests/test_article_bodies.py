@@ -0,0 +1,100 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.articles.models import Article
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+from ..models import ArticleBody
+
+
+class ArticleBodyTest(APITestCase):
+    """
+        Article bodies are stored in their own table
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.writer = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                                JWTokens.create_token(self, user=self.writer))
+        self.article = Article.objects.create(
+            title="Stored apart", slug="stored-apart", author=self.writer,
+            body="one two three")
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in queries.captured_queries]
+
+    def test_body_is_stored_apart(self):
+        stored = ArticleBody.objects.get(article=self.article)
+        self.assertEqual(stored.text, "one two three")
+        self.assertIsNone(stored.compressed)
+        self.assertEqual(Article.objects.values_list(
+            'body', flat=True).get(), '')
+        self.assertEqual(Article.objects.get().body_text, "one two three")
+
+    def test_old_body_column_is_not_indexed(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, Article._meta.db_table)
+        self.assertFalse([name for name, constraint in constraints.items()
+                          if constraint['index'] and
+                          constraint['columns'] == ['body']])
+
+    def test_only_the_detail_reads_the_body(self):
+        _, queries = self.get(reverse("articles:articles"))
+        self.assertFalse(any('article_bodies' in sql for sql in queries))
+        response, queries = self.get(
+            reverse("articles:specific_article", args=["stored-apart"]))
+        self.assertEqual(response.data['body'], "one two three")
+        # read along with the article
+        self.assertFalse(any(sql.startswith('SELECT') and
+                             'FROM "article_bodies' in sql
+                             for sql in queries))
+
+    def test_update_rewrites_the_body(self):
+        response = self.client.put(
+            reverse("articles:specific_article", args=["stored-apart"]),
+            {"body": "four five"}, format="json")
+        self.assertEqual(response.status_code, 201)
+        article = Article.objects.get()
+        self.assertEqual(article.body_text, "four five")
+        self.assertEqual(article.word_count, 2)
+        self.assertEqual(ArticleBody.objects.count(), 1)
+
+    def test_large_bodies_are_compressed(self):
+        body = "Lorem ipsum dolor sit amet. " * 100
+        with mock.patch('authors.apps.article_bodies.models.BODY_COMPRESS_AT',
+                        1024):
+            Article.objects.create(title="Long", slug="long",
+                                   author=self.writer, body=body)
+        stored = ArticleBody.objects.get(article__slug="long")
+        self.assertEqual(stored.text, '')
+        self.assertLess(len(stored.compressed), len(body))
+        self.assertEqual(Article.objects.get(slug="long").body_text, body)
+        self.assertIsNone(ArticleBody.objects.get(
+            article=self.article).compressed)
+
+    def test_move_article_bodies(self):
+        # an article saved before the bodies moved
+        ArticleBody.objects.all().delete()
+        Article.objects.update(body="one two three")
+        self.assertEqual(Article.objects.get().body_text, "one two three")
+        out = StringIO()
+        call_command('move_article_bodies', stdout=out)
+        self.assertIn("Moved 1 article bodies", out.getvalue())
+        self.assertEqual(ArticleBody.objects.get().body, "one two three")
+        self.assertEqual(Article.objects.values_list(
+            'body', flat=True).get(), '')
+        call_command('move_article_bodies', stdout=out)
+        self.assertIn("Moved 0 article bodies", out.getvalue())
@@ -0,0 +1,198 @@
+"""
+    Read-through cache for the article detail payload.
+
+    The cached entry holds the part of the serialized article that is the
+    same for every reader and is keyed on the slug plus a version number.
+    Writes that change the payload bump the version instead of deleting
+    keys, so a reader can never pick up an entry older than the last
+    write. The author's nested favorites are covered by a second version
+    per author, stored in the entry and checked on read.
+
+    Versions are the time of the last bump in microseconds, so they also
+    serve as the ETag and Last-Modified of the article, comment and
+    profile reads. View counts change too often to bump a version for,
+    so they are cached under keys of their own that are dropped when
+    new views are added.
+
+    Nothing is cached, and no ETags are built from the versions, unless
+    settings.ARTICLE_CACHE_ENABLED says the cache is shared by every
+    worker.
+"""
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# fields that depend on who is reading, filled in per request
+VIEWER_FIELDS = ('like_status', 'my_rating')
+TIMEOUT = getattr(settings, 'ARTICLE_CACHE_TIMEOUT', 60 * 60)
+
+
+def enabled():
+    """
+        Whether payloads may be cached and versions used as ETags
+    """
+    return getattr(settings, 'ARTICLE_CACHE_ENABLED', False)
+
+
+def _new_version():
+    # a fresh version must not collide with one that was evicted
+    return int(time.time() * 1000000)
+
+
+def _version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def _bump(key):
+    # a bump is never older than the version it replaces
+    cache.set(key, max(_new_version(), (cache.get(key) or 0) + 1), None)
+
+
+def _bump_now_and_on_commit(key):
+    # bump again after commit so readers racing the open transaction
+    # cannot keep what they cached from the old rows
+    _bump(key)
+    transaction.on_commit(lambda: _bump(key))
+
+
+def version_time(version):
+    """
+        When a version was bumped, as an aware datetime
+    """
+    return datetime.fromtimestamp(version / 1000000, timezone.utc)
+
+
+def article_version(slug):
+    """
+        Version of an article, its tags and its engagement counters
+    """
+    return _version('article-version:' + slug)
+
+
+def article_key(slug):
+    """
+        Cache key of the current version of an article. Read it before
+        loading the article so a write racing the load makes the entry
+        stale rather than cached under the new version.
+    """
+    return 'article:{}:{}'.format(slug, article_version(slug))
+
+
+def author_version(author_id):
+    """
+        Version of the author's nested payload, read before serializing it.
+        Covers the user, their profile, favorites and follows.
+    """
+    return _version('author-version:{}'.format(author_id))
+
+
+def comments_version(article_id):
+    """
+        Version of the comments on an article and their likes
+    """
+    return _version('comments-version:{}'.format(article_id))
+
+
+def articles_version():
+    """
+        Version of every article at once, bumped along with each of them
+    """
+    return _version('articles-version')
+
+
+def get_payload(key):
+    """
+        The cached viewer-independent payload of an article, or None
+    """
+    if not enabled():
+        return None
+    entry = cache.get(key)
+    if entry is None or \
+            entry['author_version'] != author_version(entry['author_id']):
+        return None
+    return entry['data']
+
+
+def cached_author_id(key):
+    """
+        The author of the article cached under key, or None on a miss
+    """
+    entry = cache.get(key)
+    return entry and entry['author_id']
+
+
+def cached_article_id(key):
+    """
+        The id of the article cached under key, or None on a miss
+    """
+    entry = cache.get(key)
+    return entry and entry['data']['id']
+
+
+def set_payload(key, author_id, author_version, data):
+    """
+        Cache a serialized article without its viewer-specific fields
+    """
+    if not enabled():
+        return
+    data = data.copy()
+    for field in VIEWER_FIELDS:
+        data[field] = None
+    cache.set(key, {
+        'author_id': author_id,
+        'author_version': author_version,
+        'data': data,
+    }, TIMEOUT)
+
+
+def get_view_count(article_id):
+    """
+        The view count of an article last read from the database, or None
+    """
+    return cache.get('article-views:{}'.format(article_id))
+
+
+def set_view_count(article_id, count):
+    if not enabled():
+        return
+    cache.set('article-views:{}'.format(article_id), count, TIMEOUT)
+
+
+def forget_view_counts(article_ids):
+    # the counts changed, without touching the versions of the articles
+    cache.delete_many(['article-views:{}'.format(article_id)
+                       for article_id in article_ids])
+
+
+def authors_version():
+    """
+        Version of every author at once, bumped along with each of them
+    """
+    return _version('authors-version')
+
+
+def invalidate(slug):
+    _bump_now_and_on_commit('article-version:' + slug)
+    invalidate_feed()
+
+
+def invalidate_feed():
+    # enough on its own for articles that were never cached
+    _bump_now_and_on_commit('articles-version')
+
+
+def invalidate_author(author_id):
+    _bump_now_and_on_commit('author-version:{}'.format(author_id))
+    _bump_now_and_on_commit('authors-version')
+    _bump_now_and_on_commit('articles-version')
+
+
+def invalidate_comments(article_id):
+    _bump_now_and_on_commit('comments-version:{}'.format(article_id))
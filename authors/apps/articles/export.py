@@ -0,0 +1,75 @@
+"""
+    NDJSON export of the article corpus.
+
+    Articles are read in keyset batches ordered by (updated_at, id), so
+    memory stays flat whatever the size of the corpus and each batch can
+    prefetch its tags, which `QuerySet.iterator()` cannot do on this
+    version of Django. Passing the highest `updated_at` of one export as
+    `updated_since` of the next makes exports incremental. An article
+    saved while an export runs moves ahead of the cursor and is exported
+    again rather than missed.
+"""
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Article
+
+BATCH_SIZE = 500
+FIELDS = ('id', 'slug', 'title', 'body', 'image_path', 'created_at',
+          'updated_at') + Article.COUNTERS + Article.READING_METADATA
+
+
+def parse_since(value):
+    """
+        Parse an ISO 8601 `updated_since`, read as UTC when it has no
+        offset. Raises ValueError when it is not a date and time.
+    """
+    since = parse_datetime(value)
+    if since is None:
+        raise ValueError(value)
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, timezone.utc)
+    return since
+
+
+def articles(updated_since=None, batch_size=BATCH_SIZE):
+    """
+        Yield every article updated at or after updated_since
+    """
+    queryset = Article.objects.select_related(
+        'author', 'content').prefetch_related(
+        'tags').order_by('updated_at', 'id')
+    if updated_since is not None:
+        queryset = queryset.filter(updated_at__gte=updated_since)
+    batch = list(queryset[:batch_size])
+    while batch:
+        yield from batch
+        last = batch[-1]
+        # the bare range keeps the (updated_at, id) index usable
+        batch = list(queryset.filter(
+            Q(updated_at__gt=last.updated_at) |
+            Q(updated_at=last.updated_at, id__gt=last.id),
+            updated_at__gte=last.updated_at)[:batch_size])
+
+
+def document(article):
+    """
+        The exported fields of an article
+    """
+    row = {field: getattr(article, field) for field in FIELDS}
+    row['body'] = article.body_text
+    row['author'] = article.author.username
+    row['tags'] = [tag.tag for tag in article.tags.all()]
+    return row
+
+
+def ndjson(updated_since=None, batch_size=BATCH_SIZE):
+    """
+        Yield the export one line at a time
+    """
+    for article in articles(updated_since, batch_size):
+        yield json.dumps(document(article), cls=DjangoJSONEncoder) + '\n'
@@ -9,7 +9,7 @@ class ArticleFilter(filter.FilterSet):
         lookup_expr='icontains'
     )
     body = filter.CharFilter(
-        field_name='body',
+        field_name='content__text',
         lookup_expr='icontains'
     )
 
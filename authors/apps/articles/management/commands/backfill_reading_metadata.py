@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.articles import cache as article_cache
+from authors.apps.articles.models import Article, reading_metadata
+
+
+class Command(BaseCommand):
+    """
+        Compute the stored word count, read time and excerpt of articles
+        saved before those fields existed
+    """
+    help = "Backfill word count, read time and excerpt on articles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Number of articles updated per transaction")
+
+    def handle(self, *args, **options):
+        articles = Article.objects.order_by('pk').select_related(
+            'content').only('pk', 'slug', 'body', 'content__text',
+                            'content__compressed')
+        last_pk, updated = 0, 0
+        while True:
+            batch = list(articles.filter(pk__gt=last_pk)[
+                :options['batch_size']])
+            if not batch:
+                break
+            with transaction.atomic():
+                for article in batch:
+                    word_count, read_time, excerpt = reading_metadata(
+                        article.body_text)
+                    # update() skips save() and the search index signals
+                    Article.objects.filter(pk=article.pk).update(
+                        word_count=word_count, read_time=read_time,
+                        excerpt=excerpt)
+                    article_cache.invalidate(article.slug)
+            updated += len(batch)
+            last_pk = batch[-1].pk
+        self.stdout.write("Backfilled {} articles".format(updated))
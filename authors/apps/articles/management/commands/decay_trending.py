@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.articles.models import Article
+
+# hours after which a read, like or rating counts half as much
+HALF_LIFE = getattr(settings, 'TRENDING_HALF_LIFE_HOURS', 24)
+
+
+class Command(BaseCommand):
+    """
+        Decay the trending scores of articles. Schedule it to run every
+        --hours hours (hourly by default) so that the score of an event
+        halves every TRENDING_HALF_LIFE_HOURS.
+    """
+    help = "Decay the trending score of articles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hours', type=float, default=1,
+            help="Hours since the previous run")
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help="Number of articles decayed per transaction")
+
+    def handle(self, *args, **options):
+        factor = 0.5 ** (options['hours'] / HALF_LIFE)
+        pks = Article.objects.filter(trending_score__gt=0).order_by(
+            'pk').values_list('pk', flat=True)
+        last_pk, decayed = 0, 0
+        while True:
+            batch = list(pks.filter(pk__gt=last_pk)[:options['batch_size']])
+            if not batch:
+                break
+            with transaction.atomic():
+                decayed += Article.objects.filter(
+                    pk__in=batch).decay_trending(factor)
+            last_pk = batch[-1]
+        self.stdout.write("Decayed {} articles by {:.4f}".format(
+            decayed, factor))
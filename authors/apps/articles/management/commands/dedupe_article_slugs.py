@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.serializers import ArticleSerializer
+
+
+class Command(BaseCommand):
+    """
+        Give every article a distinct slug. Run it before migrating an
+        existing database to the unique index on Article.slug; the oldest
+        article keeps each duplicated slug.
+    """
+    help = "Rename duplicated article slugs"
+
+    def handle(self, *args, **options):
+        duplicated = Article.objects.values('slug').annotate(
+            total=Count('pk')).filter(total__gt=1).values_list(
+            'slug', flat=True)
+        renamed = 0
+        for slug in duplicated:
+            with transaction.atomic():
+                # only the columns articles had before the migration
+                for pk, title in Article.objects.filter(
+                        slug=slug).order_by('pk').values_list(
+                            'pk', 'title')[1:]:
+                    Article.objects.filter(pk=pk).update(
+                        slug=ArticleSerializer().create_slug(title))
+                    renamed += 1
+        self.stdout.write("Renamed {} articles".format(renamed))
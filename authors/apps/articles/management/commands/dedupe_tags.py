@@ -0,0 +1,43 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.articles.models import Article, Tags
+from authors.apps.articles.tags import normalize
+
+
+class Command(BaseCommand):
+    """
+        Merge tags whose names normalize to the same name and store the
+        normalized name. Run it before migrating an existing database to
+        the unique index on Tags.tag; the oldest tag of each group keeps
+        its id and takes over the articles of the others. Only the
+        columns the tags had before the migration are used: run
+        `manage.py reconcile_counters` after migrating to count the
+        articles per tag, and rebuild the search index.
+    """
+    help = "Merge duplicated tags"
+
+    def handle(self, *args, **options):
+        groups = defaultdict(list)
+        for pk, name in Tags.objects.order_by('pk').values_list('pk', 'tag'):
+            groups[normalize(name)].append((pk, name))
+        through = Article.tags.through.objects
+        merged = 0
+        for name, tags in groups.items():
+            (keep, kept_name), duplicates = tags[0], [pk for pk, _ in tags[1:]]
+            if not duplicates and kept_name == name:
+                continue
+            with transaction.atomic():
+                for duplicate in duplicates:
+                    tagged = through.filter(tags_id=keep).values('article_id')
+                    # articles carrying both tags would be linked twice
+                    through.filter(tags_id=duplicate,
+                                   article_id__in=tagged).delete()
+                    through.filter(tags_id=duplicate).update(tags_id=keep)
+                Tags.objects.filter(pk__in=duplicates).only(
+                    'pk', 'tag').delete()
+                Tags.objects.filter(pk=keep).update(tag=name)
+            merged += len(duplicates)
+        self.stdout.write("Merged {} tags".format(merged))
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from authors.apps.articles import export
+
+
+class Command(BaseCommand):
+    """
+        Write every article, or those updated since a given time, as
+        newline delimited JSON. Pass the highest `updated_at` of one
+        export as --updated-since of the next to export incrementally.
+    """
+    help = "Export articles as NDJSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--output', default='-',
+            help="File to write, standard output by default")
+        parser.add_argument(
+            '--updated-since',
+            help="Only export articles updated at or after this ISO 8601 time")
+        parser.add_argument(
+            '--batch-size', type=int, default=export.BATCH_SIZE,
+            help="Number of articles read per query")
+
+    def handle(self, *args, **options):
+        updated_since = options['updated_since']
+        if updated_since:
+            try:
+                updated_since = export.parse_since(updated_since)
+            except ValueError:
+                raise CommandError("--updated-since must be an ISO 8601 time")
+        if options['output'] == '-':
+            output = self.stdout
+            # the lines carry their own newline
+            output.ending = ''
+        else:
+            output = open(options['output'], 'w', encoding='utf-8')
+        exported = 0
+        try:
+            for line in export.ndjson(updated_since or None,
+                                      options['batch_size']):
+                output.write(line)
+                exported += 1
+        finally:
+            if output is not self.stdout:
+                output.close()
+        self.stderr.write("Exported {} articles".format(exported))
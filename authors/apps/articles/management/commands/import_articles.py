@@ -0,0 +1,222 @@
+import csv
+import json
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
+from django.template.defaultfilters import slugify
+
+from authors.apps.article_bodies.models import ArticleBody
+from authors.apps.articles import cache as article_cache
+from authors.apps.articles import tags as tag_resolver
+from authors.apps.articles.models import Article, Tags, reading_metadata
+from authors.apps.articles.search import search_backend
+from authors.apps.articles.serializers import RESERVED_SLUGS
+from authors.apps.authentication.models import User
+from authors.apps.feed.models import FeedEntry
+
+# how many times to reallocate the slugs of a batch that raced the API
+SLUG_ATTEMPTS = 3
+TAG_PATTERN = re.compile(r'^[a-zA-Z0-9][ A-Za-z0-9_-]*$')
+
+
+class InvalidRow(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """
+        Import articles from an NDJSON or CSV file, one article per line
+        or row with `title`, `body`, `author` (a username), optional
+        `image_path` and `tags` (a list in NDJSON, comma separated in
+        CSV). The file is streamed and written in batches, each batch
+        resolving its authors, tags and slugs with a handful of queries,
+        so memory stays flat whatever the size of the file.
+    """
+    help = "Bulk import articles from an NDJSON or CSV file"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path', help="File to import, or - to read standard input")
+        parser.add_argument(
+            '--format', choices=('ndjson', 'csv'),
+            help="Input format, guessed from the file extension by default")
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Number of articles written per transaction")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or (
+            'csv' if path.lower().endswith('.csv') else 'ndjson')
+        source = sys.stdin if path == '-' else open(
+            path, newline='', encoding='utf-8')
+        self.backend = search_backend()
+        imported, skipped = 0, 0
+        started = time.time()
+        try:
+            rows = self.read(source, file_format)
+            while True:
+                batch = list(islice(rows, options['batch_size']))
+                if not batch:
+                    break
+                articles = self.prepare(batch)
+                skipped += len(batch) - len(articles)
+                if articles:
+                    self.write(articles)
+                imported += len(articles)
+                self.stdout.write(
+                    "Imported {} articles ({:.0f} rows/s)".format(
+                        imported, imported / self.elapsed(started)))
+        finally:
+            if source is not sys.stdin:
+                source.close()
+        elapsed = self.elapsed(started)
+        self.stdout.write(
+            "Imported {} articles, skipped {} rows in {:.1f}s "
+            "({:.0f} rows/s)".format(
+                imported, skipped, elapsed, imported / elapsed))
+
+    @staticmethod
+    def elapsed(started):
+        return max(time.time() - started, 1e-6)
+
+    def read(self, source, file_format):
+        """
+            Yield the rows of the input as dicts
+        """
+        if file_format == 'csv':
+            for row in csv.DictReader(source):
+                row['tags'] = (row.get('tags') or '').split(',')
+                yield row
+            return
+        for line_number, line in enumerate(source, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            if not isinstance(row, dict):
+                raise CommandError(
+                    "Line {} is not a JSON object".format(line_number))
+            yield row
+
+    def prepare(self, batch):
+        """
+            Validate a batch of rows and build unsaved articles for it,
+            resolving authors and reading metadata. Invalid rows are
+            reported and dropped.
+        """
+        authors = dict(User.objects.filter(
+            username__in={row.get('author') for row in batch}).values_list(
+                'username', 'pk'))
+        articles = []
+        for row in batch:
+            try:
+                articles.append(self.build(row, authors))
+            except InvalidRow as error:
+                self.stderr.write("Skipped {!r}: {}".format(
+                    row.get('title'), error))
+        return articles
+
+    def build(self, row, authors):
+        title, body = row.get('title'), row.get('body')
+        if not title or not body:
+            raise InvalidRow("title and body are required")
+        if not slugify(title):
+            raise InvalidRow("title has no characters usable in a slug")
+        if row.get('author') not in authors:
+            raise InvalidRow("unknown author {!r}".format(row.get('author')))
+        tags = row.get('tags') or []
+        if isinstance(tags, str):
+            tags = tags.split(',')
+        tags = [str(tag).strip() for tag in tags if str(tag).strip()]
+        for tag in tags:
+            if not TAG_PATTERN.match(tag):
+                raise InvalidRow("invalid tag {!r}".format(tag))
+        word_count, read_time, excerpt = reading_metadata(body)
+        article = Article(
+            title=title, body_text=body, image_path=row.get('image_path'),
+            author_id=authors[row['author']], word_count=word_count,
+            read_time=read_time, excerpt=excerpt)
+        # tags are stored the way the article serializer stores them
+        article.tag_names = [tag_resolver.normalize(tag) for tag in tags]
+        return article
+
+    def write(self, articles):
+        for attempt in range(SLUG_ATTEMPTS):
+            try:
+                # API writers may take one of the slugs first
+                with transaction.atomic():
+                    self.allocate_slugs(articles)
+                    Article.objects.bulk_create(articles)
+                    self.link_tags(articles)
+                break
+            except IntegrityError:
+                if attempt == SLUG_ATTEMPTS - 1:
+                    raise
+        article_cache.invalidate_feed()
+
+    def allocate_slugs(self, articles):
+        """
+            Give each article a free slug, following the rules of
+            ArticleSerializer.create_slug: one query for the batch, plus
+            one per title that is already taken
+        """
+        bases = [slugify(article.title)[:240] for article in articles]
+        taken = set(Article.objects.filter(slug__in=bases).values_list(
+            'slug', flat=True)) | RESERVED_SLUGS
+        suffixes = {}
+        for article, base in zip(articles, bases):
+            if base not in taken:
+                slug = base
+            else:
+                if base not in suffixes:
+                    suffixes[base] = Article.objects.slug_usage(base)[1]
+                slug = base
+                while slug in taken:
+                    suffixes[base] += 1
+                    slug = '{}-{}'.format(base, suffixes[base])
+            taken.add(slug)
+            article.slug = slug
+
+    def link_tags(self, articles):
+        """
+            Resolve the tags of a batch and link them to its articles,
+            which bulk_create leaves without primary keys on sqlite,
+            store their bodies and copy them into feeds
+        """
+        tags = {tag.tag: tag.pk for tag in tag_resolver.resolve(
+            name for article in articles for name in article.tag_names)}
+        saved = {article.slug: article for article in Article.objects.filter(
+            slug__in=[article.slug for article in articles]).select_related(
+                'author')}
+        # bulk_create skips Article.save(), which stores the body
+        ArticleBody.objects.bulk_create(
+            ArticleBody(article_id=saved[article.slug].pk,
+                        **ArticleBody.pack(article.body_text))
+            for article in articles)
+        for article in articles:
+            saved[article.slug].body_text = article.body_text
+        links = [Article.tags.through(article_id=saved[article.slug].pk,
+                                      tags_id=tags[name])
+                 for article in articles for name in set(article.tag_names)]
+        Article.tags.through.objects.bulk_create(links)
+        # bulk_create skips the signals that count the articles per tag
+        deltas = defaultdict(list)
+        for tag_id, delta in Counter(link.tags_id for link in links).items():
+            deltas[delta].append(tag_id)
+        for delta, tag_ids in deltas.items():
+            Tags.objects.filter(pk__in=tag_ids).update_article_counts(delta)
+        saved = list(saved.values())
+        # bulk_create skips the signal that copies new articles into feeds
+        FeedEntry.objects.fan_out(*saved)
+        prefetch_related_objects(saved, 'tags')
+        # bulk_create skips the signals that keep the search index current
+        self.backend.index(saved)
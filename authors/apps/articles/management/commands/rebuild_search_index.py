@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.search import search_backend
+
+
+class Command(BaseCommand):
+    """
+        Rebuild the full-text search index from the articles table, e.g.
+        after bulk writes that bypass the model signals
+    """
+    help = "Rebuild the full-text search index for articles"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help="Number of articles indexed per transaction")
+
+    def handle(self, *args, **options):
+        backend = search_backend()
+        backend.install()
+        articles = Article.objects.order_by('pk').select_related(
+            'author', 'content').prefetch_related('tags')
+        last_pk, indexed = 0, 0
+        while True:
+            batch = list(articles.filter(pk__gt=last_pk)[
+                :options['batch_size']])
+            if not batch:
+                break
+            with transaction.atomic():
+                backend.index(batch)
+            indexed += len(batch)
+            last_pk = batch[-1].pk
+        self.stdout.write("Indexed {} articles with {}".format(
+            indexed, backend.__class__.__name__))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from authors.apps.articles.models import Article, Tags
+
+
+class Command(BaseCommand):
+    """
+        Recompute the like, dislike, rating and comment counters stored on
+        each article and the article counts stored on each tag, and fix
+        the ones that have drifted from the source tables
+    """
+    help = "Recompute and reconcile the counters on articles and tags"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help="Number of rows checked per transaction")
+
+    def handle(self, *args, **options):
+        checked, corrected = self.reconcile(
+            Article, 'reconcile_counters', options['batch_size'])
+        self.stdout.write(
+            "Checked {} articles, corrected {}".format(checked, corrected))
+        checked, corrected = self.reconcile(
+            Tags, 'reconcile_article_counts', options['batch_size'])
+        self.stdout.write(
+            "Checked {} tags, corrected {}".format(checked, corrected))
+
+    def reconcile(self, model, method, batch_size):
+        pks = model.objects.order_by('pk').values_list('pk', flat=True)
+        last_pk, checked, corrected = 0, 0, 0
+        while True:
+            batch = list(pks.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            with transaction.atomic():
+                corrected += getattr(
+                    model.objects.filter(pk__in=batch), method)()
+            checked += len(batch)
+            last_pk = batch[-1]
+        return checked, corrected
@@ -8,6 +8,7 @@ error_msgs = {
     "invalid_tag": "Tag cannot have special characters",
     "email_format": "Please input a valid email",
     "no_email": "Please provide an email",
+    "invalid_datetime": "Provide an ISO 8601 date and time",
 }
 
 success_msg = {
@@ -1,23 +1,208 @@
+import math
+import re
 from datetime import datetime, timedelta
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericRelation
-from django.db import models
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models, transaction
+from django.db.models import (Case, CharField, Count, F, FloatField,
+                              IntegerField, Max, OuterRef, Q, Subquery, Sum,
+                              Value, When)
+from django.db.models.functions import Cast, Coalesce, Greatest, Substr
+from django.db.models.signals import (m2m_changed, post_delete, post_migrate,
+                                      post_save, pre_delete)
 from django.template.defaultfilters import slugify
 
 from authors.apps.authentication.models import User
 from authors.apps.like_dislike.models import LikeDislike
 from cloudinary.models import CloudinaryField
 
+from . import cache as article_cache
+from .search import search_backend
+
+
+READ_SPEED = 200  # words read per minute
+EXCERPT_LENGTH = 200
+# what a read, a like and a five star rating add to the trending score
+TRENDING_WEIGHTS = {'read': 1.0, 'like': 3.0, 'rating': 2.0}
+# scores decayed below this are dropped to zero and no longer decayed
+TRENDING_FLOOR = 0.01
+
+
+def reading_metadata(body):
+    """
+        Word count, estimated read time and excerpt of an article body
+    """
+    body = body or ''
+    word_count = len(re.findall(r'\w+', body))
+    read_time = timedelta(minutes=math.ceil(word_count / READ_SPEED))
+    excerpt = ' '.join(body.split())
+    if len(excerpt) > EXCERPT_LENGTH:
+        excerpt = excerpt[:EXCERPT_LENGTH].rsplit(' ', 1)[0] + '...'
+    return word_count, read_time, excerpt
+
+
+class ArticleQuerySet(models.QuerySet):
+    """
+        Queryset helpers for rendering lists of articles
+    """
+
+    def with_engagement(self, user=None, fieldset=None):
+        """
+            Prefetch the author, the author's favorites and the tags and
+            annotate the viewer's own like and rating on every article so
+            that serializing a page of articles costs a fixed number of
+            queries. Like, dislike and rating totals are read from the
+            counters stored on each article. Given a sparse fieldset,
+            only what it shows is loaded. Bodies are not loaded.
+        """
+        from authors.apps.rating.models import Rating
+
+        def shown(path):
+            return fieldset is None or fieldset.includes(path)
+
+        queryset = self.defer('body')
+        if shown('author'):
+            queryset = queryset.select_related('author')
+            if shown('author.favorites'):
+                queryset = queryset.prefetch_related('author__favorites')
+        if shown('tags'):
+            queryset = queryset.prefetch_related('tags')
+        if user is not None and user.is_authenticated:
+            content_type = ContentType.objects.get_for_model(self.model)
+            if shown('like_status'):
+                queryset = queryset.annotate(viewer_pref=Subquery(
+                    LikeDislike.objects.filter(
+                        content_type=content_type, object_id=OuterRef('pk'),
+                        user=user).values('pref')[:1],
+                    output_field=CharField()))
+            if shown('my_rating'):
+                queryset = queryset.annotate(viewer_rating=Subquery(
+                    Rating.objects.filter(
+                        article=OuterRef('pk'),
+                        user=user).values('your_rating')[:1],
+                    output_field=FloatField()))
+        return queryset
+
+    def update_counters(self, **deltas):
+        """
+            Atomically add the given deltas to the engagement counters,
+            e.g. update_counters(like_count=1, dislike_count=-1). Counters
+            never drop below zero: articles that predate them start at
+            zero until `manage.py reconcile_counters` has run.
+        """
+        return self.update(**{
+            field: F(field) + delta if delta >= 0 else
+            Greatest(F(field) + delta, 0)
+            for field, delta in deltas.items()
+        })
+
+    def add_views(self, counts):
+        """
+            Atomically add the view counts of a mapping of article ids to
+            counts, in one statement
+        """
+        added = Case(*[
+            When(pk=pk, then=Value(count)) for pk, count in counts.items()
+        ], default=Value(0), output_field=IntegerField())
+        return self.filter(pk__in=counts).update(
+            view_count=F('view_count') + added)
+
+    def bump_trending(self, weight):
+        """
+            Atomically add weight to the trending score
+        """
+        return self.update(trending_score=F('trending_score') + weight)
+
+    def decay_trending(self, factor):
+        """
+            Multiply the trending scores by factor, zeroing those that
+            fall below TRENDING_FLOOR. Returns the number of articles
+            decayed.
+        """
+        warm = self.filter(trending_score__gt=0)
+        warm.filter(trending_score__lt=TRENDING_FLOOR / factor).update(
+            trending_score=0)
+        return warm.update(trending_score=F('trending_score') * factor)
+
+    def reconcile_counters(self):
+        """
+            Recompute the engagement counters from the like, rating and
+            comment tables and store them on the articles that have drifted.
+            Returns the number of articles corrected.
+        """
+        from authors.apps.comments.models import Comments
+        from authors.apps.rating.models import Rating
+
+        content_type = ContentType.objects.get_for_model(self.model)
+        prefs = LikeDislike.objects.filter(
+            content_type=content_type, object_id=OuterRef('pk'))
+        ratings = Rating.objects.filter(article=OuterRef('pk'))
+        comments = Comments.objects.filter(article=OuterRef('pk'))
+        actual = {
+            'like_count': self._count(prefs.filter(pref='1'), 'object_id'),
+            'dislike_count': self._count(prefs.filter(pref='-1'),
+                                         'object_id'),
+            'rating_sum': Coalesce(Subquery(
+                ratings.order_by().values('article').annotate(
+                    total=Sum('your_rating')).values('total'),
+                output_field=FloatField()), 0),
+            'rating_count': self._count(ratings, 'article'),
+            'comment_count': self._count(comments, 'article'),
+        }
+        stale = self.annotate(**{
+            'actual_' + field: value for field, value in actual.items()
+        }).exclude(**{
+            field: F('actual_' + field) for field in actual
+        })
+        stale = dict(stale.values_list('pk', 'slug'))
+        if stale:
+            self.model.objects.filter(pk__in=stale).update(**actual)
+            for slug in stale.values():
+                article_cache.invalidate(slug)
+        return len(stale)
+
+    def slug_usage(self, slug):
+        """
+            Whether slug is taken and the highest numeric suffix used with
+            it, found with a single aggregate query over the unique slug
+            index
+        """
+        usage = self.filter(slug__startswith=slug).aggregate(
+            base=Count('pk', filter=Q(slug=slug)),
+            suffix=Max(Case(
+                When(slug__regex=r'^{}-[0-9]+$'.format(slug),
+                     then=Cast(Substr('slug', len(slug) + 2),
+                               IntegerField())),
+                output_field=IntegerField())))
+        return bool(usage['base']), usage['suffix'] or 0
+
+    @staticmethod
+    def _count(queryset, group_by):
+        """
+            Subquery counting the rows of queryset for the outer article
+        """
+        return Coalesce(Subquery(
+            queryset.order_by().values(group_by).annotate(
+                total=Count('pk')).values('total'),
+            output_field=IntegerField()), 0)
+
 
 class Article(models.Model):
     """
         Each Article model schema
     """
     image_path = models.CharField(max_length=255, blank=True, null=True)
-    slug = models.SlugField(max_length=255)
+    slug = models.SlugField(max_length=255, unique=True)
     title = models.CharField(db_index=True, max_length=255)
-    body = models.CharField(db_index=True, max_length=8055)
+    # bodies live in article_bodies.ArticleBody, read and written through
+    # `body_text` below. The column keeps its name so that migrating only
+    # drops its index and keeps the bodies saved before, until `manage.py
+    # move_article_bodies` moves them. A body assigned here is moved on
+    # save.
+    body = models.CharField(max_length=8055)
     tags = models.ManyToManyField('articles.Tags')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -25,12 +210,307 @@ class Article(models.Model):
     author = models.ForeignKey(
         User, related_name="author", on_delete=models.CASCADE)
     prefs = GenericRelation(LikeDislike, related_query_name='articles')
+    # engagement counters, maintained by the like, rating and comment views
+    # and reconciled by `manage.py reconcile_counters`
+    like_count = models.PositiveIntegerField(default=0)
+    dislike_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.FloatField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    # reading metadata, computed from the body whenever it is saved
+    word_count = models.PositiveIntegerField(default=0)
+    read_time = models.DurationField(default=timedelta(0))
+    excerpt = models.CharField(max_length=255, blank=True, default='')
+    # time-decayed blend of reads, likes and ratings, raised by the
+    # signals below and decayed by `manage.py decay_trending`
+    trending_score = models.FloatField(default=0)
+    # counted by each worker and added in batches, see view_counts.py
+    view_count = models.PositiveIntegerField(default=0)
+
+    objects = ArticleQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # serves the newest-first feed and its keyset pagination
+            models.Index(fields=['-created_at', '-id'],
+                         name='article_feed_idx'),
+            # serves /articles/trending/ in a single index scan
+            models.Index(fields=['-trending_score', '-id'],
+                         name='article_trending_idx'),
+            # serves the authors merged into following feeds on read
+            models.Index(fields=['author', '-created_at', '-id'],
+                         name='article_author_idx'),
+            # serves incremental exports, see export.py
+            models.Index(fields=['updated_at', 'id'],
+                         name='article_updated_idx'),
+        ]
+
+    COUNTERS = ('like_count', 'dislike_count', 'rating_sum', 'rating_count',
+                'comment_count')
+
+    READING_METADATA = ('word_count', 'read_time', 'excerpt')
+
+    _body_changed = False
+
+    @property
+    def body_text(self):
+        """
+            The article body, read from its ArticleBody on first use.
+            Load it along with the article with select_related('content').
+        """
+        if '_body_text' not in self.__dict__:
+            if self.__dict__.get('body'):
+                # assigned to the column
+                self._body_text = self.body
+            else:
+                try:
+                    self._body_text = self.content.body
+                except ObjectDoesNotExist:
+                    # not moved by `manage.py move_article_bodies` yet
+                    self._body_text = self.body
+        return self._body_text
+
+    @body_text.setter
+    def body_text(self, value):
+        self._body_text = value
+        self._body_changed = True
+
+    def save(self, *args, **kwargs):
+        from authors.apps.article_bodies.models import ArticleBody
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            write_body = self._state.adding or self._body_changed or \
+                bool(self.__dict__.get('body'))
+        else:
+            write_body = bool({'body', 'body_text'} & set(update_fields))
+        if write_body:
+            text = self.body_text
+            self.word_count, self.read_time, self.excerpt = \
+                reading_metadata(text)
+            self.body = ''
+            if update_fields is not None:
+                kwargs['update_fields'] = (
+                    set(update_fields) - {'body_text'}) | \
+                    set(self.READING_METADATA) | {'body'}
+        with transaction.atomic(using=kwargs.get('using')):
+            super().save(*args, **kwargs)
+            if write_body:
+                ArticleBody(article=self, **ArticleBody.pack(
+                    text)).save(using=kwargs.get('using'))
+        self._body_changed = False
+
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop('_body_text', None)
+        self._body_changed = False
+        super().refresh_from_db(*args, **kwargs)
+
+    @property
+    def average_rating(self):
+        """
+            Average rating computed from the stored counters
+        """
+        if not self.rating_count:
+            return 0
+        return self.rating_sum / self.rating_count
 
-    objects = models.Manager()
+
+class TagsQuerySet(models.QuerySet):
+    """
+        Queryset helpers for tags
+    """
+
+    def update_article_counts(self, delta):
+        """
+            Atomically add delta to the article count of every tag
+        """
+        return self.update(article_count=F('article_count') + delta)
+
+    def reconcile_article_counts(self):
+        """
+            Recompute the article counts from the article/tag links and
+            store them on the tags that have drifted. Returns the number
+            of tags corrected.
+        """
+        actual = ArticleQuerySet._count(
+            Article.tags.through.objects.filter(tags=OuterRef('pk')), 'tags')
+        stale = list(self.annotate(actual_count=actual).exclude(
+            article_count=F('actual_count')).values_list('pk', flat=True))
+        if stale:
+            self.model.objects.filter(pk__in=stale).update(
+                article_count=actual)
+        return len(stale)
 
 
 class Tags(models.Model):
-    tag = models.CharField(max_length=120)
+    # normalized by tags.normalize(), see `manage.py dedupe_tags`
+    tag = models.CharField(max_length=120, unique=True)
+    # number of articles carrying the tag, kept by the signals below
+    # and reconciled by `manage.py reconcile_counters`
+    article_count = models.PositiveIntegerField(default=0)
+
+    objects = TagsQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # serves the tag cloud, most used first
+            models.Index(fields=['-article_count', 'tag'],
+                         name='tag_popularity_idx'),
+        ]
 
     def __str__(self):
         return self.tag
+
+
+def install_search_index(sender, using='default', **kwargs):
+    # creates the full-text index table once the articles table exists
+    if sender.label == 'articles':
+        search_backend(using).install()
+
+
+def index_article(sender, instance, **kwargs):
+    # keeps the full-text index current when an article is saved
+    search_backend().index([instance])
+
+
+def index_article_tags(sender, instance, action, reverse, **kwargs):
+    # tags are saved after the article, so reindex once they change
+    if not reverse and action in ('post_add', 'post_remove', 'post_clear'):
+        search_backend().index([instance])
+
+
+def unindex_article(sender, instance, **kwargs):
+    # drops a deleted article from the full-text index
+    search_backend().remove([instance.pk])
+
+
+def count_tagged_articles(sender, instance, action, reverse, pk_set,
+                          **kwargs):
+    # keeps Tags.article_count in step with the article/tag links
+    if action in ('pre_remove', 'pre_clear'):
+        # pk_set may name tags the article does not carry
+        links = sender.objects.filter(
+            **{'tags' if reverse else 'article': instance})
+        if pk_set is not None:
+            links = links.filter(
+                **{'article__in' if reverse else 'tags__in': pk_set})
+        instance._unlinked_tags = list(links.values_list(
+            'article_id' if reverse else 'tags_id', flat=True))
+        return
+    if action == 'post_add':
+        changed, delta = pk_set, 1
+    elif action in ('post_remove', 'post_clear'):
+        changed, delta = instance._unlinked_tags, -1
+    else:
+        return
+    if not changed:
+        return
+    if reverse:
+        Tags.objects.filter(pk=instance.pk).update_article_counts(
+            delta * len(changed))
+    else:
+        Tags.objects.filter(pk__in=changed).update_article_counts(delta)
+
+
+def uncount_deleted_article(sender, instance, **kwargs):
+    # deleting an article drops its tag links without m2m signals
+    Tags.objects.filter(article=instance).update_article_counts(-1)
+
+
+def trend_article(sender, instance, created, update_fields=None, **kwargs):
+    # reads, likes and ratings raise the trending score as they arrive
+    if sender is LikeDislike:
+        liked = int(instance.pref) == LikeDislike.LIKE and (
+            created or 'pref' in (update_fields or ()))
+        if not liked or instance.content_type_id != \
+                ContentType.objects.get_for_model(Article).id:
+            return
+        article_id, weight = instance.object_id, TRENDING_WEIGHTS['like']
+    elif not created:
+        return
+    elif sender._meta.label == 'rating.Rating':
+        article_id = instance.article_id
+        weight = TRENDING_WEIGHTS['rating'] * float(instance.your_rating) / 5
+    else:
+        article_id, weight = instance.article_id, TRENDING_WEIGHTS['read']
+    Article.objects.filter(pk=article_id).bump_trending(weight)
+
+
+def invalidate_cached_article(sender, instance, **kwargs):
+    # the article itself or its tags changed
+    if not kwargs.get('reverse'):
+        article_cache.invalidate(instance.slug)
+
+
+def invalidate_engaged_article(sender, instance, **kwargs):
+    # likes, ratings and comments move the counters in the article payload
+    from authors.apps.comments.models import Comments
+
+    if sender is LikeDislike:
+        model = ContentType.objects.get_for_id(
+            instance.content_type_id).model_class()
+        if model is Comments:
+            article_id = Comments.objects.filter(
+                pk=instance.object_id).values_list(
+                    'article_id', flat=True).first()
+            if article_id is not None:
+                article_cache.invalidate_comments(article_id)
+            return
+        if model is not Article:
+            return
+        article_id = instance.object_id
+    else:
+        article_id = instance.article_id
+        if sender is Comments:
+            article_cache.invalidate_comments(article_id)
+    slug = Article.objects.filter(pk=article_id).values_list(
+        'slug', flat=True).first()
+    if slug is not None:
+        article_cache.invalidate(slug)
+
+
+def invalidate_author(sender, instance, **kwargs):
+    # the author, their profile and favorites are nested in the payloads
+    article_cache.invalidate_author(
+        instance.pk if sender is User else instance.user_id)
+
+
+def invalidate_follower(sender, instance, action, reverse, pk_set, **kwargs):
+    # profiles tell the reader whether they follow them
+    from authors.apps.profiles.models import Profile
+
+    if not reverse:
+        if action.startswith('post_'):
+            article_cache.invalidate_author(instance.user_id)
+        return
+    if action == 'pre_clear':
+        followers = Profile.objects.filter(is_following=instance)
+    elif action in ('post_add', 'post_remove'):
+        followers = Profile.objects.filter(pk__in=pk_set)
+    else:
+        return
+    for user_id in followers.values_list('user_id', flat=True):
+        article_cache.invalidate_author(user_id)
+
+
+post_migrate.connect(install_search_index)
+post_save.connect(index_article, sender=Article)
+post_delete.connect(unindex_article, sender=Article)
+m2m_changed.connect(index_article_tags, sender=Article.tags.through)
+m2m_changed.connect(count_tagged_articles, sender=Article.tags.through)
+pre_delete.connect(uncount_deleted_article, sender=Article)
+post_save.connect(invalidate_cached_article, sender=Article)
+post_delete.connect(invalidate_cached_article, sender=Article)
+m2m_changed.connect(invalidate_cached_article, sender=Article.tags.through)
+for engagement in ('like_dislike.LikeDislike', 'rating.Rating',
+                   'comments.Comments'):
+    post_save.connect(invalidate_engaged_article, sender=engagement)
+    post_delete.connect(invalidate_engaged_article, sender=engagement)
+for event in (LikeDislike, 'rating.Rating', 'reading_stats.ReadStats'):
+    post_save.connect(trend_article, sender=event)
+post_save.connect(invalidate_author, sender=User)
+post_save.connect(invalidate_author, sender='profiles.Profile')
+m2m_changed.connect(invalidate_follower,
+                    sender='profiles.Profile_is_following')
+post_save.connect(invalidate_author, sender='favorite.Favorite')
+post_delete.connect(invalidate_author, sender='favorite.Favorite')
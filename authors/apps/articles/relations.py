@@ -1,6 +1,8 @@
 import re
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 from authors.apps.articles.models import Tags
+from . import tags
 from .messages import error_msgs
 from rest_framework.exceptions import ValidationError
 
@@ -11,6 +13,17 @@ class TagsRelation(serializers.RelatedField):
     creating an article
     """
 
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        """
+            Resolve lists of tags with TagListField, in one batch
+        """
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return TagListField(**list_kwargs)
+
     def get_queryset(self):
         """
             Gets all tags from the tag model
@@ -23,20 +36,40 @@ class TagsRelation(serializers.RelatedField):
         """
         return value.tag
 
-    def to_internal_value(self, data):
+    def tag_name(self, data):
         """
-            Restores the datatype into its internal python representation.
-            This method should raise a serializers.ValidationError
-            if the data is invalid
+            Validates a tag and returns its normalized name, or None
+            for an empty tag
         """
         if len(data) == 0:
-            tag, created = Tags.objects.get_or_create(tag=data)
-            return tag
+            return None
 
         if not re.match(r'^[a-zA-Z0-9][ A-Za-z0-9_-]*$', data):
             raise ValidationError(
                 detail={'message': error_msgs['invalid_tag']})
 
-        capitalized_tag = str(data).title()
-        tag, created = Tags.objects.get_or_create(tag=capitalized_tag)
-        return tag
+        return tags.normalize(data)
+
+    def to_internal_value(self, data):
+        """
+            Restores the datatype into its internal python representation.
+            This method should raise a serializers.ValidationError
+            if the data is invalid
+        """
+        name = self.tag_name(data)
+        return tags.resolve([name])[0] if name else None
+
+
+class TagListField(serializers.ManyRelatedField):
+    """
+        List of tags validated one by one and resolved together
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        names = [self.child_relation.tag_name(item) for item in data]
+        return tags.resolve([name for name in names if name])
@@ -1,6 +1,5 @@
-import json
-
-from rest_framework.renderers import JSONRenderer
+from authors.apps.core import codec
+from authors.apps.core.renderers import JSONRenderer
 
 
 class ArticleJSONRenderer(JSONRenderer):
@@ -9,7 +8,7 @@ class ArticleJSONRenderer(JSONRenderer):
     def render(self, data, media_type=None, renderer_context=None):
 
         # Finally, we can render our data under the "user" namespace.
-        return json.dumps({
+        return codec.dumps({
             'articles': data
         })
         
\ No newline at end of file
@@ -0,0 +1,242 @@
+"""
+    Full-text search over articles.
+
+    Articles are indexed into an inverted index kept next to the
+    articles table: an FTS5 virtual table on sqlite and a GIN-indexed
+    tsvector table on Postgres. Other databases, or sqlite builds without
+    FTS5, fall back to `icontains` filters. The index is created after
+    migrations, kept current by the signals in `models.py` and can be
+    rebuilt with `manage.py rebuild_search_index`.
+"""
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+# search parameter -> indexed column
+FIELDS = ('title', 'body', 'author', 'tags')
+
+
+def tokens(value):
+    """
+        Split a search term into the words the index knows about
+    """
+    return re.findall(r'\w+', value or '')
+
+
+def document(article):
+    """
+        The text indexed for an article, one entry per indexed column
+    """
+    return (
+        article.title,
+        article.body_text,
+        article.author.username,
+        ' '.join(tag.tag for tag in article.tags.all()),
+    )
+
+
+class IcontainsSearch:
+    """
+        Substring search used when the database has no full-text index
+    """
+    lookups = {
+        'title': 'title__icontains',
+        'body': 'content__text__icontains',
+        'author': 'author__username__icontains',
+        'tags': 'tags__tag__icontains',
+    }
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def install(self):
+        pass
+
+    def index(self, articles):
+        pass
+
+    def remove(self, article_ids):
+        pass
+
+    def search(self, queryset, terms):
+        for field, value in terms.items():
+            if not value:
+                continue
+            if field is None:
+                condition = Q()
+                for lookup in self.lookups.values():
+                    condition |= Q(**{lookup: value})
+                queryset = queryset.filter(condition)
+            else:
+                queryset = queryset.filter(**{self.lookups[field]: value})
+        return queryset.distinct().order_by('-created_at', '-id')
+
+
+class FullTextSearch:
+    """
+        Shared plumbing of the inverted index backends
+    """
+    table = None
+    ranking = None
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def insert_sql(self):
+        """
+            Statement inserting one (id, title, body, author, tags) row
+        """
+        raise NotImplementedError
+
+    def match(self, terms):
+        """
+            Build the backend's query string, or None if nothing can match
+        """
+        raise NotImplementedError
+
+    def index(self, articles):
+        rows = [(article.pk,) + document(article) for article in articles]
+        self.remove([row[0] for row in rows])
+        with self.connection.cursor() as cursor:
+            cursor.executemany(self.insert_sql(), rows)
+
+    def search(self, queryset, terms):
+        terms = {field: value for field, value in terms.items() if value}
+        if not terms:
+            return queryset.order_by('-created_at', '-id')
+        query = self.match(terms)
+        if query is None:
+            return queryset.none()
+        return self.join(queryset, query).order_by(
+            self.ranking, '-created_at', '-id')
+
+
+class SqliteSearch(FullTextSearch):
+    """
+        SQLite FTS5 index ranked with the built-in bm25() function
+    """
+    table = 'articles_article_fts'
+    ranking = 'search_rank'
+
+    def install(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'CREATE VIRTUAL TABLE IF NOT EXISTS {} USING fts5({})'.format(
+                    self.table, ', '.join(FIELDS)))
+
+    def insert_sql(self):
+        return 'INSERT INTO {} (rowid, {}) VALUES (%s, %s, %s, %s, %s)'.format(
+            self.table, ', '.join(FIELDS))
+
+    def remove(self, article_ids):
+        with self.connection.cursor() as cursor:
+            cursor.executemany(
+                'DELETE FROM {} WHERE rowid = %s'.format(self.table),
+                [(pk,) for pk in article_ids])
+
+    def match(self, terms):
+        clauses = []
+        for field, value in terms.items():
+            words = tokens(value)
+            if not words:
+                return None
+            # the last word is a prefix so partial words still match
+            phrase = '"{}"*'.format(' '.join(words))
+            clauses.append(
+                phrase if field is None else '{} : {}'.format(field, phrase))
+        return ' AND '.join(clauses)
+
+    def join(self, queryset, query):
+        return queryset.extra(
+            tables=[self.table],
+            where=['{}.rowid = articles_article.id'.format(self.table),
+                   '{} MATCH %s'.format(self.table)],
+            params=[query],
+            select={'search_rank': 'bm25({})'.format(self.table)})
+
+
+class PostgresSearch(FullTextSearch):
+    """
+        Postgres tsvector index ranked with ts_rank_cd(). Each indexed
+        column is stored under its own weight so that field searches can
+        be restricted to it.
+    """
+    table = 'articles_article_search'
+    ranking = '-search_rank'
+    weights = {'title': 'A', 'author': 'B', 'tags': 'C', 'body': 'D'}
+
+    def install(self):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'CREATE TABLE IF NOT EXISTS {0} ('
+                'article_id integer PRIMARY KEY REFERENCES articles_article '
+                '(id) ON DELETE CASCADE DEFERRABLE INITIALLY DEFERRED, '
+                'document tsvector NOT NULL)'.format(self.table))
+            index = '{}_document_idx'.format(self.table)
+            cursor.execute('SELECT to_regclass(%s)', [index])
+            if cursor.fetchone()[0] is None:
+                cursor.execute(
+                    'CREATE INDEX {} ON {} USING GIN (document)'.format(
+                        index, self.table))
+
+    def insert_sql(self):
+        vector = ' || '.join(
+            "setweight(to_tsvector('simple', %s), '{}')".format(
+                self.weights[field]) for field in FIELDS)
+        return 'INSERT INTO {} (article_id, document) VALUES (%s, {})'.format(
+            self.table, vector)
+
+    def remove(self, article_ids):
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'DELETE FROM {} WHERE article_id = ANY(%s)'.format(self.table),
+                [list(article_ids)])
+
+    def match(self, terms):
+        clauses = []
+        for field, value in terms.items():
+            words = tokens(value)
+            if not words:
+                return None
+            weight = '' if field is None else self.weights[field]
+            clauses.extend(
+                "'{}':*{}".format(word.lower(), weight) for word in words)
+        return ' & '.join(clauses)
+
+    def join(self, queryset, query):
+        tsquery = "to_tsquery('simple', %s)"
+        return queryset.extra(
+            tables=[self.table],
+            where=['{}.article_id = articles_article.id'.format(self.table),
+                   '{}.document @@ {}'.format(self.table, tsquery)],
+            params=[query],
+            select={'search_rank': 'ts_rank_cd({}.document, {})'.format(
+                self.table, tsquery)},
+            select_params=[query])
+
+
+_fts5 = {}
+
+
+def has_fts5(connection):
+    """
+        Whether the sqlite library was built with FTS5, checked once
+    """
+    if connection.alias not in _fts5:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+            _fts5[connection.alias] = bool(cursor.fetchone()[0])
+    return _fts5[connection.alias]
+
+
+def search_backend(using='default'):
+    """
+        The search backend for the given database
+    """
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        return PostgresSearch(connection)
+    if connection.vendor == 'sqlite' and has_fts5(connection):
+        return SqliteSearch(connection)
+    return IcontainsSearch(connection)
@@ -1,7 +1,3 @@
-import re
-import math
-import datetime as dt
-
 from django.core.exceptions import ValidationError
 
 from authors.apps.like_dislike.serializers import PreferenceSerializer
@@ -12,76 +8,63 @@ from django.template.defaultfilters import slugify
 from django.contrib.contenttypes.models import ContentType
 
 from authors.apps.authentication.serializers import RegistrationSerializer
+from authors.apps.core.fieldsets import SparseFieldsMixin
 from .messages import error_msgs
 from .models import Article, Tags
 from ..authentication.serializers import RegistrationSerializer
 from .messages import error_msgs
 from ..rating.models import Rating
-from django.db.models import Avg
 from authors.apps.articles.relations import TagsRelation
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+# slugs that would be shadowed by other routes under /articles/
+RESERVED_SLUGS = {'feed', 'trending'}
+
+
+class ArticleSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
         Article model serializers
     """
     author = RegistrationSerializer(many=False, read_only=True, required=False)
     image_path = serializers.CharField(required=False, default=None)
     title = serializers.CharField(required=True)
-    body = serializers.CharField(required=True)
+    body = serializers.CharField(required=True, source='body_text')
     tags = TagsRelation(many=True, required=False)
-    like_count = serializers.SerializerMethodField(read_only=True)
-    dislike_count = serializers.SerializerMethodField(read_only=True)
+    like_count = serializers.IntegerField(read_only=True)
+    dislike_count = serializers.IntegerField(read_only=True)
     like_status = serializers.SerializerMethodField(read_only=True)
     rating = serializers.SerializerMethodField(read_only=True)
     my_rating = serializers.SerializerMethodField(read_only=True)
-    read_time = serializers.SerializerMethodField()
+    read_time = serializers.CharField(read_only=True)
 
     class Meta:
         model = Article
-        fields = "__all__"
-
-    def get_read_time(self, instance):
-        """
-            Here we get the body of the article instance we want to create
-            Then we check if the body has words
-            We then check the length of the words
-            Then we divide the length with 200
-            Then we stringify the output to get it in a time format
-        """
-        body = instance.body
-        matching_words = re.findall(r'\w+', body)
-        count = len(matching_words)
-        read_per_min = math.ceil(count/200.0)
-        read_time = str(dt.timedelta(minutes=read_per_min))
-        return read_time
+        # the trending score only orders /articles/trending/
+        exclude = ('trending_score',)
+        read_only_fields = ('slug', 'view_count') + Article.COUNTERS + \
+            Article.READING_METADATA
 
     def create_slug(self, title):
         """
-            Create a slag
+            Create a slug that is not taken yet. Duplicated titles get a
+            numeric suffix one above the highest one in use, found with a
+            single aggregate query over the unique slug index.
         """
-        a_slug = slugify(title)
-        origin = 1
-        unique_slug = a_slug
-        while Article.objects.filter(slug=unique_slug).exists():
-            unique_slug = '{}-{}'.format(a_slug, origin)
-            origin += 1
-        slug = unique_slug
-        return slug
-
-    def get_like_count(self, obj):
-        """ Return the number of likes"""
-
-        return obj.prefs.count('likes')
-
-    def get_dislike_count(self, obj):
-        """Return the nimber of dislikes"""
-
-        return obj.prefs.count('dislikes')
+        a_slug = slugify(title)[:240]
+        taken, suffix = Article.objects.slug_usage(a_slug)
+        if not taken and a_slug not in RESERVED_SLUGS:
+            return a_slug
+        return '{}-{}'.format(a_slug, suffix + 1)
 
     def get_like_status(self, obj):
         """Get my preference"""
         user = self.context['request'].user
+        if hasattr(obj, 'viewer_pref'):
+            # annotated by Article.objects.with_engagement()
+            if obj.viewer_pref is None:
+                return statusmessage['Null']
+            return statusmessage['Like'] if int(obj.viewer_pref) == 1 \
+                else statusmessage['Dislike']
         content_type = ContentType.objects.get_for_model(
             obj)
         try:
@@ -96,20 +79,17 @@ class ArticleSerializer(serializers.ModelSerializer):
         """
             Get article rating.
         """
-        average = Rating.objects.filter(
-            article__pk=obj.pk).aggregate(Avg('your_rating'))
-
-        if average['your_rating__avg'] is None:
-            average_rating = 0
-            return average_rating
-
-        return average['your_rating__avg']
+        return obj.average_rating
 
     def get_my_rating(self, obj):
         """
             Get my article rating.
         """
         user = self.context['request'].user
+        if hasattr(obj, 'viewer_rating'):
+            if obj.viewer_rating is None:
+                return statusmessage['Null']
+            return obj.viewer_rating
         try:
             current_rating = Rating.objects.get(
                 user=user, article=obj).your_rating
@@ -119,6 +99,17 @@ class ArticleSerializer(serializers.ModelSerializer):
                 return statusmessage['Null']
 
 
+class ArticleSummarySerializer(ArticleSerializer):
+    """
+        Article with its excerpt in place of its body, for lists of
+        articles, which never loads the bodies
+    """
+    body = None
+
+    class Meta(ArticleSerializer.Meta):
+        exclude = ArticleSerializer.Meta.exclude + ('body',)
+
+
 class TagSerializers(serializers.ModelSerializer):
     class Meta:
         model = Tags
@@ -126,3 +117,12 @@ class TagSerializers(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         return instance.tag
+
+
+class TagCountSerializer(serializers.ModelSerializer):
+    """
+        Tag with the number of articles carrying it
+    """
+    class Meta:
+        model = Tags
+        fields = ('tag', 'article_count')
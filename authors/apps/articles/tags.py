@@ -0,0 +1,109 @@
+"""
+    Resolve tag names to tags in batches.
+
+    Tag names are normalized to title case and stored once each under a
+    unique index. A list of names is resolved with one `IN` query for the
+    names this worker has not seen yet and one bulk insert for the names
+    that do not exist. Resolved name -> id pairs are kept in a bounded
+    LRU shared by every request in the worker. Pairs are only cached once
+    the transaction that read or created them commits, so a rolled back
+    insert can never leave a dangling id behind.
+"""
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models.signals import post_delete
+
+from .models import Tags
+
+CACHE_SIZE = getattr(settings, 'TAG_CACHE_SIZE', 1024)
+
+
+def normalize(name):
+    """
+        The stored form of a tag name
+    """
+    return ' '.join(str(name).split()).title()
+
+
+class LRUCache:
+    """
+        Thread-safe mapping that forgets its least recently used keys
+        past `size` entries
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_many(self, keys):
+        found = {}
+        with self.lock:
+            for key in keys:
+                if key in self.entries:
+                    self.entries.move_to_end(key)
+                    found[key] = self.entries[key]
+        return found
+
+    def set_many(self, mapping):
+        with self.lock:
+            for key, value in mapping.items():
+                self.entries[key] = value
+                self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def discard(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+cache = LRUCache(CACHE_SIZE)
+
+
+def _select(names):
+    return dict(Tags.objects.filter(tag__in=names).values_list('tag', 'pk'))
+
+
+def resolve(names):
+    """
+        The tags with the given names, in order and without duplicates,
+        created where missing. Names must already be normalized.
+    """
+    names = list(OrderedDict.fromkeys(names))
+    ids = cache.get_many(names)
+    missing = [name for name in names if name not in ids]
+    if missing:
+        found = _select(missing)
+        created = [name for name in missing if name not in found]
+        if created:
+            try:
+                with transaction.atomic():
+                    Tags.objects.bulk_create(
+                        Tags(tag=name) for name in created)
+            except IntegrityError:
+                # a concurrent request created some of them first
+                for name in created:
+                    Tags.objects.get_or_create(tag=name)
+            # sqlite does not return the ids of bulk inserted rows
+            found.update(_select(created))
+        transaction.on_commit(lambda: cache.set_many(found))
+        ids.update(found)
+    using = Tags.objects.db
+    return [Tags.from_db(using, ['id', 'tag'], [ids[name], name])
+            for name in names]
+
+
+def forget_tag(sender, instance, **kwargs):
+    # drop deleted tags so this worker stops linking to them
+    transaction.on_commit(lambda: cache.discard(instance.tag))
+
+
+post_delete.connect(forget_tag, sender=Tags)
@@ -0,0 +1,104 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+from authors.apps.rating.models import Rating
+
+from ..models import Article, Tags
+
+
+@override_settings(ARTICLE_CACHE_ENABLED=True)
+class ArticleDetailCacheTest(APITestCase):
+    """
+        GET /api/v1/articles/<slug>/ is served from the cache until a
+        write changes the article
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.article = Article.objects.create(
+            title="Cached", body="Lorem ipsum", slug="cached",
+            author=self.author)
+        self.url = reverse("articles:specific_article",
+                           kwargs={"slug": "cached"})
+
+    def headers(self, user):
+        token = JWTokens.create_token(self, user=user)
+        return {"HTTP_AUTHORIZATION": "Bearer " + token}
+
+    def get(self, **headers):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, **headers)
+        self.assertEqual(response.status_code, 200)
+        return response, len(context.captured_queries)
+
+    def test_second_read_is_cached(self):
+        _, cold = self.get()
+        response, warm = self.get()
+        self.assertLess(warm, cold)
+        self.assertEqual(warm, 0)
+        self.assertEqual(response.data['title'], "Cached")
+
+    def test_viewer_fields_are_per_reader(self):
+        self.article.prefs.create(user=self.reader, pref=1)
+        Rating.objects.create(
+            user=self.reader, article=self.article, your_rating=4)
+        self.get(**self.headers(self.author))
+        response, _ = self.get(**self.headers(self.reader))
+        self.assertEqual(response.data['like_status'], "Liked")
+        self.assertEqual(response.data['my_rating'], 4)
+        response, _ = self.get()
+        self.assertIsNone(response.data['my_rating'])
+
+    def test_update_invalidates(self):
+        self.get()
+        self.article.title = "Changed"
+        self.article.save()
+        response, _ = self.get()
+        self.assertEqual(response.data['title'], "Changed")
+
+    def test_tag_change_invalidates(self):
+        self.get()
+        self.article.tags.add(Tags.objects.create(tag="django"))
+        response, _ = self.get()
+        self.assertEqual(list(response.data['tags']), ["django"])
+
+    def test_like_invalidates(self):
+        self.get()
+        self.client.post(
+            reverse("like:article_like", kwargs={"slug": "cached"}),
+            **self.headers(self.reader))
+        response, _ = self.get()
+        self.assertEqual(response.data['like_count'], 1)
+
+    def test_rating_invalidates(self):
+        self.get()
+        self.client.post(
+            reverse("rating:rate", kwargs={"slug": "cached"}),
+            {"your_rating": 5}, format="json", **self.headers(self.reader))
+        response, _ = self.get()
+        self.assertEqual(response.data['rating'], 5)
+
+    def test_author_favorite_invalidates(self):
+        self.get()
+        self.client.post(
+            reverse("fav:favorite-article", kwargs={"slug": "cached"}),
+            **self.headers(self.author))
+        _, queries = self.get()
+        self.assertGreater(queries, 0)
+
+    def test_delete_invalidates(self):
+        self.get()
+        self.article.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 404)
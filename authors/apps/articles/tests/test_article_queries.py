@@ -0,0 +1,68 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+from authors.apps.rating.models import Rating
+
+from ..models import Article
+
+
+class ArticleListQueriesTest(APITestCase):
+    """
+        The article list should cost the same number of queries
+        whatever the page size
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("articles:articles")
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.token = JWTokens.create_token(self, user=self.reader)
+        for i in range(12):
+            article = Article.objects.create(
+                title="Article {}".format(i),
+                body="Lorem ipsum dolor sit amet",
+                slug="article-{}".format(i),
+                author=self.author
+            )
+            article.prefs.create(user=self.reader, pref=1)
+            Rating.objects.create(
+                user=self.reader, article=article, your_rating=4)
+        Article.objects.reconcile_counters()
+
+    def count_queries(self, page_size, **headers):
+        """
+            Fetch a page of articles and count the queries it took
+        """
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                self.url, {"page_size": page_size}, **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), page_size)
+        return len(context.captured_queries)
+
+    def test_query_count_is_constant_for_anonymous_users(self):
+        counts = [self.count_queries(size) for size in (1, 6, 12)]
+        self.assertEqual(len(set(counts)), 1)
+
+    def test_query_count_is_constant_for_authenticated_users(self):
+        headers = {"HTTP_AUTHORIZATION": "Bearer " + self.token}
+        counts = [self.count_queries(size, **headers) for size in (1, 6, 12)]
+        self.assertEqual(len(set(counts)), 1)
+
+    def test_annotated_values(self):
+        response = self.client.get(
+            self.url, HTTP_AUTHORIZATION="Bearer " + self.token)
+        article = response.data['results'][0]
+        self.assertEqual(article['like_count'], 1)
+        self.assertEqual(article['dislike_count'], 0)
+        self.assertEqual(article['like_status'], "Liked")
+        self.assertEqual(article['rating'], 4)
+        self.assertEqual(article['my_rating'], 4)
+        self.assertEqual(article['author']['username'], "writer")
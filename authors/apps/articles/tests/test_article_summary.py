@@ -0,0 +1,36 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.models import User
+
+from ..models import Article
+
+
+class ArticleSummaryTest(APITestCase):
+    """
+        Lists of articles carry excerpts, the detail carries the body
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.writer = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        Article.objects.create(
+            title="Long read", slug="long-read", author=self.writer,
+            body=" ".join(["word"] * 1500))
+
+    def test_list_has_excerpts_and_does_not_read_bodies(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("articles:articles"))
+        article, = response.data['results']
+        self.assertNotIn("body", article)
+        self.assertTrue(article['excerpt'].endswith("word..."))
+        self.assertFalse(any('"articles_article"."body"' in query['sql']
+                             for query in queries.captured_queries))
+
+    def test_detail_has_the_body(self):
+        response = self.client.get(
+            reverse("articles:specific_article", args=["long-read"]))
+        self.assertEqual(len(response.data['body']), 1500 * 5 - 1)
@@ -1,3 +1,6 @@
+from io import StringIO
+
+from django.core.management import call_command
 from rest_framework.test import APIClient, APITestCase
 from django.urls import reverse
 from django.template.defaultfilters import slugify
@@ -260,6 +263,44 @@ class ArticleTestCase(APITestCase):
         )
         self.assertEqual(response.status_code, 403)
 
+    def test_reading_metadata_is_stored(self):
+        """
+            Word count, read time and excerpt are computed on save
+        """
+        token = self.login(self.user_data)
+        article = dict(self.valid_article_data['article'],
+                       body=" ".join(["word"] * 450))
+        response = self.client.post(
+            self.all_article_url,
+            data=article,
+            format="json",
+            HTTP_AUTHORIZATION="Bearer {}".format(token)
+        )
+        self.assertEqual(response.data['read_time'], "0:03:00")
+        self.assertEqual(response.data['word_count'], 450)
+        self.assertTrue(response.data['excerpt'].endswith("..."))
+        self.assertLessEqual(len(response.data['excerpt']), 255)
+
+        stored = Article.objects.get(slug=response.data['slug'])
+        stored.body = "Short body"
+        stored.save(update_fields=['body'])
+        stored.refresh_from_db()
+        self.assertEqual(stored.word_count, 2)
+        self.assertEqual(stored.excerpt, "Short body")
+
+    def test_backfill_reading_metadata(self):
+        """
+            Rows saved without reading metadata are backfilled
+        """
+        self.login(self.user_data)
+        self.create_article(self.valid_article_data['article'])
+        Article.objects.update(word_count=0, excerpt='')
+        call_command("backfill_reading_metadata", batch_size=1,
+                     stdout=StringIO())
+        article = Article.objects.get()
+        self.assertEqual(article.word_count, 5)
+        self.assertEqual(article.excerpt, "Its a test article body")
+
     def tearDown(self):
         """
             Teardown method
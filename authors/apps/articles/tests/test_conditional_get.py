@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+from authors.apps.comments.models import Comments
+
+from ..models import Article
+
+
+@override_settings(ARTICLE_CACHE_ENABLED=True)
+class ConditionalGetTest(APITestCase):
+    """
+        Article and comment reads carry an ETag and Last-Modified and
+        answer a matching revalidation with 304
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.article = Article.objects.create(
+            title="Cached", body="Lorem ipsum", slug="cached",
+            author=self.author)
+        self.detail_url = reverse("articles:specific_article",
+                                  kwargs={"slug": "cached"})
+        self.list_url = reverse("articles:articles")
+        self.comments_url = reverse("comments:comment",
+                                    kwargs={"slug": "cached"})
+
+    def headers(self, user):
+        token = JWTokens.create_token(self, user=user)
+        return {"HTTP_AUTHORIZATION": "Bearer " + token}
+
+    def revalidate(self, url, response, **headers):
+        return self.client.get(
+            url, HTTP_IF_NONE_MATCH=response['ETag'], **headers)
+
+    def test_detail_not_modified(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Last-Modified', response)
+        # the view count is left out of the ETag
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        again = self.revalidate(self.detail_url, response)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again['ETag'], response['ETag'])
+        since = self.client.get(
+            self.detail_url,
+            HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(since.status_code, 304)
+
+    @override_settings(ARTICLE_CACHE_ENABLED=False)
+    def test_unconditional_without_a_shared_cache(self):
+        response = self.client.get(self.detail_url)
+        self.assertNotIn('ETag', response)
+        self.assertEqual(self.client.get(
+            self.detail_url, HTTP_IF_NONE_MATCH='*').status_code, 200)
+        self.assertNotIn('ETag', self.client.get(self.list_url))
+
+    def test_detail_changes_after_a_write(self):
+        response = self.client.get(self.detail_url)
+        self.article.prefs.create(user=self.reader, pref=1)
+        self.assertEqual(
+            self.revalidate(self.detail_url, response).status_code, 200)
+
+    def test_etag_depends_on_the_reader(self):
+        response = self.client.get(self.detail_url)
+        again = self.revalidate(
+            self.detail_url, response, **self.headers(self.reader))
+        self.assertEqual(again.status_code, 200)
+        self.assertIn('Authorization', response['Vary'])
+
+    def test_missing_article_is_not_conditional(self):
+        response = self.client.get(reverse(
+            "articles:specific_article", kwargs={"slug": "missing"}))
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn('ETag', response)
+
+    def test_list_not_modified_until_an_article_changes(self):
+        response = self.client.get(self.list_url)
+        self.assertEqual(
+            self.revalidate(self.list_url, response).status_code, 304)
+        self.article.title = "Changed"
+        self.article.save()
+        self.assertEqual(
+            self.revalidate(self.list_url, response).status_code, 200)
+
+    def test_comments_not_modified_until_commented(self):
+        headers = self.headers(self.reader)
+        response = self.client.get(self.comments_url, **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self.revalidate(
+                self.comments_url, response, **headers).status_code, 304)
+        Comments.objects.create(
+            article=self.article, author_profile=self.reader.profiles,
+            body="Nice")
+        self.assertEqual(
+            self.revalidate(
+                self.comments_url, response, **headers).status_code, 200)
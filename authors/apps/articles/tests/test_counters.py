@@ -0,0 +1,82 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+from authors.apps.rating.models import Rating
+
+from ..models import Article
+
+
+class ArticleCountersTest(APITestCase):
+    """
+        Engagement counters stored on the article
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.auth = {
+            "HTTP_AUTHORIZATION":
+                "Bearer " + JWTokens.create_token(self, user=self.reader)
+        }
+        self.article = Article.objects.create(
+            title="Counted", body="Lorem ipsum", slug="counted",
+            author=self.author)
+
+    def refresh(self):
+        self.article.refresh_from_db()
+        return self.article
+
+    def test_like_then_dislike_moves_the_counters(self):
+        like = reverse("likes:article_like", kwargs={"slug": "counted"})
+        dislike = reverse("likes:article_dislike", kwargs={"slug": "counted"})
+        response = self.client.post(like, **self.auth)
+        self.assertEqual(response.data['like_count'], 1)
+        self.client.post(dislike, **self.auth)
+        self.assertEqual(self.refresh().like_count, 0)
+        self.assertEqual(self.refresh().dislike_count, 1)
+        self.client.post(dislike, **self.auth)
+        self.assertEqual(self.refresh().dislike_count, 0)
+
+    def test_counters_do_not_go_below_zero(self):
+        # a like stored before the counters existed
+        self.article.prefs.create(user=self.reader, pref=1)
+        Article.objects.filter(pk=self.article.pk).update(like_count=0)
+        self.client.post(reverse("likes:article_like",
+                                 kwargs={"slug": "counted"}), **self.auth)
+        self.assertEqual(self.refresh().like_count, 0)
+
+    def test_rating_updates_sum_and_count(self):
+        url = reverse("rating:rate", kwargs={"slug": "counted"})
+        self.client.post(url, {"your_rating": 4}, format="json", **self.auth)
+        response = self.client.post(
+            url, {"your_rating": 2}, format="json", **self.auth)
+        self.assertEqual(response.data['data']['average_rating'], 2)
+        self.assertEqual(response.data['data']['rate_count'], 1)
+        self.client.delete(url, **self.auth)
+        article = self.refresh()
+        self.assertEqual((article.rating_sum, article.rating_count), (0, 0))
+
+    def test_reconcile_counters_command(self):
+        self.article.prefs.create(user=self.reader, pref=1)
+        Rating.objects.create(
+            user=self.reader, article=self.article, your_rating=3)
+        Article.objects.filter(pk=self.article.pk).update(comment_count=7)
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+        self.assertIn("corrected 1", out.getvalue())
+        article = self.refresh()
+        self.assertEqual(article.like_count, 1)
+        self.assertEqual(article.rating_sum, 3)
+        self.assertEqual(article.rating_count, 1)
+        self.assertEqual(article.comment_count, 0)
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+        self.assertIn("corrected 0", out.getvalue())
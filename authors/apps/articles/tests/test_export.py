@@ -0,0 +1,80 @@
+import json
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+from ..models import Article, Tags
+
+
+class ArticleExportTest(APITestCase):
+    """
+        GET /api/v1/articles/export.ndjson and manage.py export_articles
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("articles:export-articles")
+        self.admin = User.objects.create_superuser(
+            "admin", "admin@mail.com", "Admin@254")
+        self.writer = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        tag = Tags.objects.create(tag="Django")
+        for i in range(5):
+            article = Article.objects.create(
+                title="Article {}".format(i), body="Lorem ipsum",
+                slug="article-{}".format(i), author=self.writer)
+            article.tags.add(tag)
+        # pretend the first three were last saved a day ago
+        Article.objects.filter(slug__in=[
+            "article-0", "article-1", "article-2"]).update(
+                updated_at=timezone.now() - timedelta(days=1))
+
+    def login(self, user):
+        token = JWTokens.create_token(self, user=user)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+    def lines(self, response):
+        body = b''.join(response.streaming_content).decode()
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_export_streams_every_article(self):
+        self.login(self.admin)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = self.lines(response)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['author'], "writer")
+        self.assertEqual(rows[0]['tags'], ["Django"])
+        self.assertEqual(rows[-1]['slug'], "article-4")
+
+    def test_export_is_incremental(self):
+        self.login(self.admin)
+        since = (timezone.now() - timedelta(hours=1)).isoformat()
+        rows = self.lines(self.client.get(self.url, {"updated_since": since}))
+        self.assertEqual([row['slug'] for row in rows],
+                         ["article-3", "article-4"])
+
+    def test_invalid_updated_since(self):
+        self.login(self.admin)
+        response = self.client.get(self.url, {"updated_since": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_is_for_admins(self):
+        self.login(self.writer)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_command_walks_every_batch(self):
+        out, err = StringIO(), StringIO()
+        call_command('export_articles', '--batch-size=2',
+                     stdout=out, stderr=err)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len({row['id'] for row in rows}), 5)
+        self.assertIn("Exported 5 articles", err.getvalue())
@@ -0,0 +1,68 @@
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.models import User
+
+from ..models import Article
+
+
+class FeedCursorPaginationTest(APITestCase):
+    """
+        Keyset pagination of GET /api/v1/articles/?pagination=cursor
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("articles:articles")
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        for i in range(7):
+            self.create_article(i)
+
+    def create_article(self, i):
+        return Article.objects.create(
+            title="Article {}".format(i), body="Lorem ipsum",
+            slug="article-{}".format(i), author=self.author)
+
+    def slugs(self, response):
+        return [article['slug'] for article in response.data['results']]
+
+    def test_walk_forward_and_back(self):
+        first = self.client.get(
+            self.url, {"pagination": "cursor", "page_size": 3})
+        self.assertEqual(self.slugs(first),
+                         ["article-6", "article-5", "article-4"])
+        self.assertIsNone(first.data['previous'])
+
+        second = self.client.get(first.data['next'])
+        self.assertEqual(self.slugs(second),
+                         ["article-3", "article-2", "article-1"])
+
+        last = self.client.get(second.data['next'])
+        self.assertEqual(self.slugs(last), ["article-0"])
+        self.assertIsNone(last.data['next'])
+
+        back = self.client.get(last.data['previous'])
+        self.assertEqual(self.slugs(back), self.slugs(second))
+        back = self.client.get(back.data['previous'])
+        self.assertEqual(self.slugs(back), self.slugs(first))
+        self.assertIsNone(back.data['previous'])
+
+    def test_inserts_do_not_shift_pages(self):
+        first = self.client.get(
+            self.url, {"pagination": "cursor", "page_size": 3})
+        self.create_article(7)
+        second = self.client.get(first.data['next'])
+        self.assertEqual(self.slugs(second),
+                         ["article-3", "article-2", "article-1"])
+
+    def test_page_size_is_capped(self):
+        for i in range(7, 110):
+            self.create_article(i)
+        response = self.client.get(
+            self.url, {"pagination": "cursor", "page_size": 1000})
+        self.assertEqual(len(response.data['results']), 100)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
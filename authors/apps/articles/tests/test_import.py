@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from authors.apps.authentication.models import User
+from authors.apps.feed.models import FeedEntry
+
+from ..models import Article, Tags
+from ..search import search_backend
+
+
+class ImportArticlesTest(TestCase):
+    """
+        manage.py import_articles
+    """
+
+    def setUp(self):
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        Article.objects.create(
+            title="Taken title", body="Lorem ipsum", slug="taken-title",
+            author=self.author)
+        Tags.objects.create(tag="Django")
+
+    def write_file(self, suffix, content):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(handle, 'w') as source:
+            source.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def ndjson(self, rows):
+        return self.write_file(
+            '.ndjson', '\n'.join(json.dumps(row) for row in rows))
+
+    def run_import(self, path, *args):
+        out, err = StringIO(), StringIO()
+        call_command('import_articles', path, *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def rows(self, count, **extra):
+        return [dict({
+            "title": "Article {}".format(i), "body": "one two three",
+            "author": "writer", "tags": ["django", "python"]}, **extra)
+            for i in range(count)]
+
+    def test_import_ndjson(self):
+        out, _ = self.run_import(self.ndjson(self.rows(3)), '--batch-size=2')
+        self.assertIn("Imported 3 articles, skipped 0 rows", out)
+        self.assertIn("rows/s", out)
+        article = Article.objects.get(slug="article-1")
+        self.assertEqual(article.author, self.author)
+        self.assertEqual(article.word_count, 3)
+        self.assertEqual(article.excerpt, "one two three")
+        self.assertEqual(sorted(tag.tag for tag in article.tags.all()),
+                         ["Django", "Python"])
+        self.assertEqual(Tags.objects.filter(tag="Django").count(), 1)
+        self.assertEqual(Tags.objects.filter(tag="Python").count(), 1)
+        self.assertEqual(Tags.objects.get(tag="Python").article_count, 3)
+
+    def test_import_csv(self):
+        path = self.write_file(
+            '.csv', 'title,body,author,tags\n'
+                    'From csv,"Lorem, ipsum",writer,"django, news"\n')
+        self.run_import(path)
+        article = Article.objects.get(slug="from-csv")
+        self.assertEqual(article.body_text, "Lorem, ipsum")
+        self.assertEqual(sorted(tag.tag for tag in article.tags.all()),
+                         ["Django", "News"])
+
+    def test_duplicated_titles_get_suffixes(self):
+        rows = [{"title": "Taken title", "body": "Lorem", "author": "writer"}
+                for _ in range(2)]
+        self.run_import(self.ndjson(rows))
+        self.assertTrue(Article.objects.filter(slug="taken-title-1").exists())
+        self.assertTrue(Article.objects.filter(slug="taken-title-2").exists())
+
+    def test_invalid_rows_are_skipped(self):
+        rows = self.rows(1) + [
+            {"title": "No author", "body": "Lorem", "author": "nobody"},
+            {"title": "", "body": "Lorem", "author": "writer"},
+            {"title": "Bad tag", "body": "Lorem", "author": "writer",
+             "tags": ["#nope"]},
+        ]
+        out, err = self.run_import(self.ndjson(rows))
+        self.assertIn("Imported 1 articles, skipped 3 rows", out)
+        self.assertIn("unknown author", err)
+        self.assertFalse(Article.objects.filter(title="Bad tag").exists())
+
+    def test_imported_articles_are_searchable(self):
+        self.run_import(self.ndjson(self.rows(2)))
+        found = search_backend().search(
+            Article.objects.all(), {'title': 'Article'})
+        self.assertEqual(found.count(), 2)
+
+    def test_imported_articles_reach_the_feeds(self):
+        reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        reader.profiles.follow(self.author)
+        self.run_import(self.ndjson(self.rows(2)))
+        self.assertEqual(set(FeedEntry.objects.filter(
+            user=reader).values_list('article__slug', flat=True)),
+            {"taken-title", "article-0", "article-1"})
+
+    def test_queries_per_batch_do_not_grow_with_its_size(self):
+        Tags.objects.create(tag="Python")
+        counts = []
+        for size in (2, 20):
+            path = self.ndjson([dict(row, title="Batch {} {}".format(
+                size, i)) for i, row in enumerate(self.rows(size))])
+            with CaptureQueriesContext(connection) as context:
+                self.run_import(path, '--batch-size=50')
+            counts.append(len(context.captured_queries))
+        self.assertEqual(counts[0], counts[1])
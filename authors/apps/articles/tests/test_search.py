@@ -69,7 +69,7 @@ class CustomSearchTest(APITestCase):
             format="json"
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data['results']), 10)
 
     def test_get_articles_by_author(self):
         """
@@ -80,8 +80,9 @@ class CustomSearchTest(APITestCase):
             format="json"
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 10)
-        self.assertIn('dan', response.data[0].get('author').get('username'))
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertIn('dan', response.data['results'][0].get(
+            'author').get('username'))
 
     def test_unavailable_author(self):
         """
@@ -103,8 +104,8 @@ class CustomSearchTest(APITestCase):
             format="json"
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 10)
-        self.assertIn('rick', response.data[0].get('title'))
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertIn('rick', response.data['results'][0].get('title'))
 
     def test_search_non_title(self):
         """
@@ -126,9 +127,11 @@ class CustomSearchTest(APITestCase):
             format="json"
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 10)
-        self.assertIn('Lorem', response.data[0].get('body'))
-        self.assertIn('ipsum', response.data[0].get('body'))
+        self.assertEqual(len(response.data['results']), 10)
+        # lists carry the excerpt of each article instead of its body
+        self.assertIn('Lorem', response.data['results'][0].get('excerpt'))
+        self.assertIn('ipsum', response.data['results'][0].get('excerpt'))
+        self.assertNotIn('body', response.data['results'][0])
 
     def test_search_non_body(self):
         """
@@ -150,8 +153,8 @@ class CustomSearchTest(APITestCase):
             format="json"
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(len(response.data), 10)
-        self.assertTrue('News' in response.data[0].get('tags'))
+        self.assertEqual(len(response.data['results']), 10)
+        self.assertTrue('News' in response.data['results'][0].get('tags'))
 
     def test_search_non_tags(self):
         """
@@ -165,6 +168,66 @@ class CustomSearchTest(APITestCase):
         self.assertEqual(response.data.get(
             'message'), error_msgs['not_found'])
 
+    def test_search_pages(self):
+        """
+            Test GET /api/v1/articles?title=rick&page_size=4&page=<n>
+        """
+        response = self.client.get(
+            self.articles, {'title': 'rick', 'page_size': 4}, format="json")
+        self.assertEqual(len(response.data['results']), 4)
+        self.assertIsNone(response.data['previous'])
+        self.assertIn('page=2', response.data['next'])
+
+        response = self.client.get(
+            self.articles, {'title': 'rick', 'page_size': 4, 'page': 3},
+            format="json")
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIsNone(response.data['next'])
+        self.assertIn('page=2', response.data['previous'])
+
+    def test_search_tags_are_distinct(self):
+        """
+            Test an article with several matching tags is listed once
+        """
+        article = Article.objects.first()
+        article.tags.add(Tags.objects.create(tag="Newsroom"))
+        response = self.client.get(
+            (self.articles + '?tag=News'),
+            format="json"
+        )
+        slugs = [result['slug'] for result in response.data['results']]
+        self.assertEqual(len(slugs), len(set(slugs)))
+
+    def test_search_ranks_best_match_first(self):
+        """
+            Test GET /api/v1/articles?q=morty puts the closest match first
+        """
+        Article.objects.create(
+            title="Morty", body="morty morty", slug="morty",
+            author_id=self.user.id)
+        Article.objects.create(
+            title="Something else", body="a long body that mentions morty "
+            "once among many other words about nothing in particular",
+            slug="something-else", author_id=self.user.id)
+        response = self.client.get(self.articles + '?q=morty', format="json")
+        slugs = [result['slug'] for result in response.data['results']]
+        self.assertEqual(slugs, ['morty', 'something-else'])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        """
+            Test the index is kept current when articles change
+        """
+        article = Article.objects.first()
+        article.title = "Squanch"
+        article.save()
+        response = self.client.get(
+            self.articles + '?title=squanch', format="json")
+        self.assertEqual(len(response.data['results']), 1)
+        article.delete()
+        response = self.client.get(
+            self.articles + '?title=squanch', format="json")
+        self.assertEqual(response.status_code, 404)
+
     def tearDown(self):
         """
         This method is run after each test.
@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.db import IntegrityError
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+from ..models import Article
+from ..serializers import ArticleSerializer
+
+
+class SlugAllocationTest(APITestCase):
+    """
+        Unique slugs for articles sharing a title
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("articles:articles")
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.auth = {
+            "HTTP_AUTHORIZATION":
+                "Bearer " + JWTokens.create_token(self, user=self.author)
+        }
+        self.article = {"title": "Same Title", "body": "Lorem ipsum"}
+
+    def test_duplicate_titles_get_increasing_suffixes(self):
+        slugs = [
+            self.client.post(self.url, self.article, format="json",
+                             **self.auth).data['slug']
+            for _ in range(3)
+        ]
+        self.assertEqual(slugs, ["same-title", "same-title-1", "same-title-2"])
+
+    def test_next_slug_takes_one_query(self):
+        for i in range(20):
+            Article.objects.create(
+                title="Same Title", body="Lorem ipsum", author=self.author,
+                slug="same-title" if i == 0 else "same-title-{}".format(i))
+        Article.objects.create(
+            title="Same Title Again", body="Lorem ipsum", author=self.author,
+            slug="same-title-again")
+        with self.assertNumQueries(1):
+            slug = ArticleSerializer().create_slug("Same Title")
+        self.assertEqual(slug, "same-title-20")
+
+    def test_slug_collision_is_retried(self):
+        Article.objects.create(
+            title="Same Title", body="Lorem ipsum", author=self.author,
+            slug="same-title")
+        with mock.patch.object(ArticleSerializer, "create_slug",
+                               side_effect=["same-title", "same-title-1"]):
+            response = self.client.post(
+                self.url, self.article, format="json", **self.auth)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['slug'], "same-title-1")
+
+    def test_slug_is_unique_in_the_database(self):
+        Article.objects.create(
+            title="Same Title", body="Lorem ipsum", author=self.author,
+            slug="same-title")
+        with self.assertRaises(IntegrityError):
+            Article.objects.create(
+                title="Same Title", body="Lorem ipsum", author=self.author,
+                slug="same-title")
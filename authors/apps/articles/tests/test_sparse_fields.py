@@ -0,0 +1,80 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+from authors.apps.comments.models import Comments
+
+from ..models import Article
+from ..serializers import ArticleSerializer
+
+
+class SparseFieldsTest(APITestCase):
+    """
+        ?fields= and ?exclude= on the article, comment and profile
+        endpoints
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.writer = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                                JWTokens.create_token(self, user=self.writer))
+        self.article = Article.objects.create(
+            title="Sparse", body="Lorem ipsum " * 100, slug="sparse",
+            author=self.writer)
+        Comments.objects.create(article=self.article, body="Nice",
+                                author_profile=self.writer.profiles)
+
+    def get(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, [query['sql'] for query in queries.captured_queries]
+
+    def test_list_shows_only_the_fields_asked_for(self):
+        with mock.patch.object(ArticleSerializer, 'get_rating') as rating:
+            response, queries = self.get(
+                reverse("articles:articles"),
+                fields="slug,title,author.username,read_time")
+        article, = response.data['results']
+        self.assertEqual(dict(article), {
+            "slug": "sparse", "title": "Sparse",
+            "author": {"username": "writer"},
+            "read_time": article['read_time']})
+        rating.assert_not_called()
+        page = [sql for sql in queries if '"articles_article"."title"' in sql]
+        self.assertNotIn('"articles_article"."body"', page[0])
+        self.assertFalse(any('favorite' in sql for sql in queries))
+
+    def test_exclude_drops_nested_fields(self):
+        response, _ = self.get(reverse("articles:articles"),
+                               exclude="body,author.favorites,tags")
+        article, = response.data['results']
+        self.assertNotIn("body", article)
+        self.assertNotIn("tags", article)
+        self.assertEqual(set(article['author']), {"username", "email"})
+        self.assertIn("like_status", article)
+
+    def test_detail_applies_the_fieldset_to_the_cached_article(self):
+        url = reverse("articles:specific_article", args=["sparse"])
+        full, _ = self.get(url)
+        self.assertIn("body", full.data)
+        sparse, _ = self.get(url, fields="slug,my_rating")
+        self.assertEqual(sparse.data, {"slug": "sparse",
+                                       "my_rating": full.data['my_rating']})
+
+    def test_comments_and_profiles(self):
+        response, _ = self.get(
+            reverse("comments:comment", args=["sparse"]),
+            fields="body,author_profile.username")
+        self.assertEqual(response.data['comments'], [
+            {"body": "Nice", "author_profile": {"username": "writer"}}])
+        response, _ = self.get(
+            reverse("profile:profile", args=["writer"]), fields="username")
+        self.assertEqual(response.data[0], {"username": "writer"})
@@ -0,0 +1,67 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.models import User
+
+from ..models import Article, Tags
+
+
+class TagCloudTest(APITestCase):
+    """
+        GET /api/v1/tags/?sort=popular and the article counts behind it
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("articles:tags")
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.django, self.python, self.rust = [
+            Tags.objects.create(tag=name)
+            for name in ("Django", "Python", "Rust")]
+        self.articles = [Article.objects.create(
+            title="Article {}".format(i), body="Lorem ipsum",
+            slug="article-{}".format(i), author=self.author)
+            for i in range(3)]
+        for article in self.articles:
+            article.tags.add(self.python)
+        self.articles[0].tags.add(self.django)
+
+    def counts(self):
+        return dict(Tags.objects.values_list('tag', 'article_count'))
+
+    def test_links_are_counted(self):
+        self.assertEqual(self.counts(),
+                         {"Django": 1, "Python": 3, "Rust": 0})
+        self.articles[0].tags.remove(self.python, self.rust)
+        self.articles[1].tags.clear()
+        self.rust.article_set.add(self.articles[2])
+        self.assertEqual(self.counts(),
+                         {"Django": 1, "Python": 1, "Rust": 1})
+
+    def test_deleting_an_article_uncounts_its_tags(self):
+        self.articles[0].delete()
+        self.assertEqual(self.counts(),
+                         {"Django": 0, "Python": 2, "Rust": 0})
+
+    def test_popular_tags(self):
+        response = self.client.get(self.url, {"sort": "popular"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(list(response.data['results']), [
+            {"tag": "Python", "article_count": 3},
+            {"tag": "Django", "article_count": 1},
+        ])
+        response = self.client.get(
+            self.url, {"sort": "popular", "page_size": 1, "page": 2})
+        self.assertEqual(response.data['results'][0]['tag'], "Django")
+
+    def test_reconcile_fixes_drifted_counts(self):
+        Tags.objects.filter(pk=self.python.pk).update(article_count=9)
+        out = StringIO()
+        call_command("reconcile_counters", stdout=out)
+        self.assertIn("Checked 3 tags, corrected 1", out.getvalue())
+        self.assertEqual(self.counts()["Python"], 3)
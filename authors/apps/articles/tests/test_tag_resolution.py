@@ -0,0 +1,85 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+from .. import tags
+from ..models import Article, Tags
+
+
+class TagResolutionTest(APITestCase):
+    """
+        Tags are stored once per normalized name and resolved in batches
+    """
+
+    def setUp(self):
+        tags.cache.clear()
+        self.client = APIClient()
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                                JWTokens.create_token(self, user=self.author))
+        self.article = Article.objects.create(
+            title="Tagged", body="Lorem ipsum", slug="tagged",
+            author=self.author)
+        self.url = reverse("articles:specific_article",
+                           kwargs={"slug": "tagged"})
+
+    def tag(self, names):
+        return self.client.put(self.url, {"tags": names}, format="json")
+
+    def test_names_are_normalized_once(self):
+        Tags.objects.create(tag="Django")
+        response = self.tag(["django", "DJANGO", "web  apps"])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(sorted(t.tag for t in self.article.tags.all()),
+                         ["Django", "Web Apps"])
+        self.assertEqual(Tags.objects.count(), 2)
+
+    def test_empty_tags_clear_the_list(self):
+        self.tag(["django"])
+        self.tag([""])
+        self.assertFalse(self.article.tags.exists())
+
+    def test_queries_do_not_grow_with_the_number_of_tags(self):
+        def queries(names):
+            with CaptureQueriesContext(connection) as context:
+                tags.resolve(names)
+            return len(context.captured_queries)
+
+        self.assertEqual(queries(["One"]),
+                         queries(["Tag {}".format(i) for i in range(20)]))
+
+    def test_cached_names_skip_the_database(self):
+        tag = Tags.objects.create(tag="Django")
+        tags.cache.set_many({"Django": tag.pk})
+        with self.assertNumQueries(0):
+            self.assertEqual(tags.resolve(["Django"])[0].pk, tag.pk)
+
+    def test_lru_is_bounded(self):
+        lru = tags.LRUCache(2)
+        lru.set_many({"a": 1, "b": 2})
+        lru.get_many(["a"])
+        lru.set_many({"c": 3})
+        self.assertEqual(lru.get_many(["a", "b", "c"]), {"a": 1, "c": 3})
+
+    def test_dedupe_tags(self):
+        other = Article.objects.create(
+            title="Other", body="Lorem", slug="other", author=self.author)
+        kept = Tags.objects.create(tag="django")
+        duplicate = Tags.objects.create(tag="Django")
+        self.article.tags.add(kept, duplicate)
+        other.tags.add(duplicate)
+        out = StringIO()
+        call_command('dedupe_tags', stdout=out)
+        self.assertIn("Merged 1 tags", out.getvalue())
+        self.assertEqual(list(Tags.objects.values_list('pk', 'tag')),
+                         [(kept.pk, "Django")])
+        self.assertEqual(self.article.tags.count(), 1)
+        self.assertEqual(other.tags.get(), Tags.objects.get())
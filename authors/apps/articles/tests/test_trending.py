@@ -0,0 +1,70 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.models import User
+from authors.apps.rating.models import Rating
+from authors.apps.reading_stats.models import ReadStats
+
+from ..models import TRENDING_WEIGHTS, Article
+from ..serializers import ArticleSerializer
+
+
+class TrendingArticlesTest(APITestCase):
+    """
+        GET /api/v1/articles/trending/ and the scores behind it
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("articles:trending")
+        self.author = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.quiet, self.liked, self.read = [Article.objects.create(
+            title=title, body="Lorem ipsum", slug=title.lower(),
+            author=self.author) for title in ("Quiet", "Liked", "Read")]
+
+    def score(self, article):
+        article.refresh_from_db(fields=['trending_score'])
+        return article.trending_score
+
+    def test_events_raise_the_score(self):
+        self.liked.prefs.create(user=self.reader, pref=1)
+        Rating.objects.create(
+            user=self.reader, article=self.liked, your_rating=5)
+        ReadStats.objects.create(user=self.reader, article=self.read)
+        self.assertEqual(self.score(self.liked),
+                         TRENDING_WEIGHTS['like'] + TRENDING_WEIGHTS['rating'])
+        self.assertEqual(self.score(self.read), TRENDING_WEIGHTS['read'])
+        self.assertEqual(self.score(self.quiet), 0)
+
+    def test_dislikes_do_not_trend(self):
+        self.liked.prefs.create(user=self.reader, pref=-1)
+        self.assertEqual(self.score(self.liked), 0)
+
+    def test_trending_lists_the_top_articles(self):
+        self.liked.prefs.create(user=self.reader, pref=1)
+        ReadStats.objects.create(user=self.reader, article=self.read)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([a['slug'] for a in response.data['results']],
+                         ["liked", "read"])
+        response = self.client.get(self.url, {"limit": 1})
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_decay(self):
+        Article.objects.filter(pk=self.liked.pk).update(trending_score=8)
+        Article.objects.filter(pk=self.read.pk).update(trending_score=0.015)
+        out = StringIO()
+        call_command("decay_trending", "--hours=24", stdout=out)
+        self.assertEqual(self.score(self.liked), 4)
+        self.assertEqual(self.score(self.read), 0)
+        self.assertIn("Decayed 1 articles", out.getvalue())
+
+    def test_trending_slug_is_reserved(self):
+        self.assertEqual(
+            ArticleSerializer().create_slug("Trending"), "trending-1")
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+from .. import cache as article_cache
+from ..models import Article
+from ..view_counts import ViewCounter
+
+
+class ViewCountTest(APITestCase):
+    """
+        Article views are counted per worker and added in batches
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        writer = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.article, self.other = [Article.objects.create(
+            title=slug, body="Lorem ipsum", slug=slug, author=writer)
+            for slug in ("viral", "quiet")]
+        self.counter = ViewCounter(seconds=60)
+
+    def read(self, slug, status=200, **headers):
+        with mock.patch('authors.apps.articles.views.view_counter',
+                        self.counter), \
+                mock.patch('django.db.transaction.on_commit',
+                           lambda callback: callback()):
+            response = self.client.get(
+                reverse("articles:specific_article", args=[slug]),
+                **headers)
+        self.assertEqual(response.status_code, status)
+        return response
+
+    def test_reads_are_counted_in_memory(self):
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(3):
+                self.read("viral")
+        self.assertFalse(any(query['sql'].startswith('UPDATE')
+                             for query in queries.captured_queries))
+        self.assertEqual(self.counter.pending(), 3)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.view_count, 0)
+
+    def test_flush_adds_the_counts_in_one_statement(self):
+        for slug in ("viral", "viral", "quiet"):
+            self.read(slug)
+        version = article_cache.article_version("viral")
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.counter.flush(), 3)
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertEqual(dict(Article.objects.values_list(
+            'slug', 'view_count')), {"viral": 2, "quiet": 1})
+        # the cached payload is kept and served with the stored count
+        self.assertEqual(article_cache.article_version("viral"), version)
+        self.assertEqual(self.read("viral").data['view_count'], 2)
+
+    def test_counts_are_added_when_due(self):
+        with mock.patch('authors.apps.articles.view_counts.time') as clock:
+            clock.monotonic.return_value = 100
+            self.counter = ViewCounter(seconds=10)
+            self.read("viral")
+            clock.monotonic.return_value = 111
+            self.read("viral")
+        self.assertEqual(self.counter.pending(), 0)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.view_count, 2)
+
+    def test_failed_flush_keeps_the_counts(self):
+        self.read("viral")
+        with mock.patch.object(Article.objects, 'add_views',
+                               side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.counter.flush()
+        self.assertEqual(self.counter.pending(), 1)
+
+    @override_settings(ARTICLE_CACHE_ENABLED=True)
+    def test_revalidated_reads_are_counted(self):
+        reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                                JWTokens.create_token(self, user=reader))
+        with mock.patch('authors.apps.articles.views.read_buffer') as reads:
+            etag = self.read("viral")['ETag']
+            self.read("viral", status=304, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.counter.pending(), 2)
+        self.assertEqual(reads.record.call_args_list,
+                         [mock.call(reader.pk, self.article.pk)] * 2)
@@ -1,7 +1,8 @@
 from django.urls import path
 
-from .views import (ArticleAPIView, SearchView, ShareViaEmail,
-                    ShareViaFacebookAndTwitter, SpecificArticle, TagAPIView)
+from .views import (ArticleAPIView, ArticleExportView, SearchView,
+                    ShareViaEmail, ShareViaFacebookAndTwitter,
+                    SpecificArticle, TagAPIView, TrendingArticlesView)
 
 app_name = "articles"
 
@@ -9,6 +10,10 @@ urlpatterns = [
     path('articles/', ArticleAPIView.as_view(), name="articles"),
     path('tags/', TagAPIView.as_view(), name="tags"),
     path('articles', SearchView.as_view(), name="search-articles"),
+    path('articles/export.ndjson', ArticleExportView.as_view(),
+         name="export-articles"),
+    path('articles/trending/', TrendingArticlesView.as_view(),
+         name="trending"),
     path('articles/<str:slug>/', SpecificArticle.as_view(),
          name="specific_article"),
     path('tags/', TagAPIView.as_view(), name="tags"),
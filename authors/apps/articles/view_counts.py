@@ -0,0 +1,87 @@
+"""
+    Per-worker aggregation of article view counts.
+
+    Adding one to `view_count` on every read would make every reader of
+    a popular article wait on the same row. Each worker counts views in
+    memory instead and adds the summed counts of every article it served
+    with one UPDATE once VIEW_COUNT_FLUSH_SECONDS have passed since its
+    last flush or VIEW_COUNT_MAX_ARTICLES articles are waiting. Counts
+    still waiting are written when the worker exits. Shown counts lag by
+    up to the flush interval. Flushing leaves the cached payloads and
+    their ETags alone and only drops the cached counts, which the detail
+    view reads with each request.
+"""
+import atexit
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+
+from . import cache as article_cache
+from .models import Article
+
+FLUSH_SECONDS = getattr(settings, 'VIEW_COUNT_FLUSH_SECONDS', 10)
+MAX_ARTICLES = getattr(settings, 'VIEW_COUNT_MAX_ARTICLES', 1000)
+
+
+class ViewCounter:
+    """
+        Thread-safe view counts of one worker, added to the articles
+        periodically
+    """
+
+    def __init__(self, seconds=FLUSH_SECONDS, max_articles=MAX_ARTICLES):
+        self.seconds = seconds
+        self.max_articles = max_articles
+        self.counts = Counter()
+        self.flushed = time.monotonic()
+        self.lock = threading.Lock()
+
+    def record(self, article_id):
+        """
+            Count a view once the current transaction commits
+        """
+        transaction.on_commit(lambda: self.increment(article_id))
+
+    def increment(self, article_id):
+        """
+            Count a view, adding the counts when a threshold is reached
+        """
+        with self.lock:
+            self.counts[article_id] += 1
+            due = len(self.counts) >= self.max_articles or \
+                time.monotonic() - self.flushed >= self.seconds
+        if due:
+            self.flush()
+
+    def flush(self):
+        """
+            Add the waiting counts to the articles. Returns the number of
+            views added.
+        """
+        with self.lock:
+            counts, self.counts = self.counts, Counter()
+            self.flushed = time.monotonic()
+        if not counts:
+            return 0
+        try:
+            Article.objects.add_views(counts)
+        except Exception:
+            # keep the views for the next flush
+            with self.lock:
+                self.counts.update(counts)
+            raise
+        article_cache.forget_view_counts(counts)
+        return sum(counts.values())
+
+    def pending(self):
+        """
+            The number of views waiting to be added
+        """
+        return sum(self.counts.values())
+
+
+view_counter = ViewCounter()
+atexit.register(view_counter.flush)
@@ -6,29 +6,73 @@ import re
 from datetime import datetime, timedelta
 
 import django
-from django.core.mail import send_mail
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.template.defaultfilters import slugify
 from django.template.loader import render_to_string
 
 from authors.apps.authentication.utils import status_codes, swagger_body
-from authors.apps.core.pagination import PaginateContent
-from authors.apps.reading_stats.models import ReadStats
+from authors.apps.core.conditional import conditional, resource_state
+from authors.apps.core.fieldsets import Fieldset
+from authors.apps.core.pagination import (FeedCursorPagination,
+                                          PaginateContent,
+                                          PaginateWithoutCount)
+from authors.apps.jobs.mail import send_mail
+from authors.apps.reading_stats.buffer import read_buffer
 from drf_yasg import openapi
 from drf_yasg.inspectors import SwaggerAutoSchema
 from drf_yasg.utils import swagger_auto_schema, swagger_serializer_method
 from rest_framework import exceptions, generics, status
 from rest_framework.filters import OrderingFilter, SearchFilter
-from rest_framework.permissions import (AllowAny, IsAuthenticated,
+from rest_framework.permissions import (AllowAny, IsAdminUser,
+                                        IsAuthenticated,
                                         IsAuthenticatedOrReadOnly)
-from rest_framework.views import Response
+from rest_framework.views import APIView, Response
 
+from . import cache as article_cache
+from . import export
 from .filters import ArticleFilter
 from .messages import error_msgs, success_msg
 from .models import Article, Tags, User
 from .renderers import ArticleJSONRenderer
-from .serializers import ArticleSerializer, TagSerializers
+from .search import search_backend
+from .serializers import (ArticleSerializer, ArticleSummarySerializer,
+                          TagCountSerializer, TagSerializers)
+from .view_counts import view_counter
+
+
+# how many slugs to try when concurrent requests race for the same one
+SLUG_ATTEMPTS = 5
+
+
+def articles_state(view, request):
+    if not article_cache.enabled():
+        return None
+    # any write to any article changes the feed pages
+    version = article_cache.articles_version()
+    return resource_state(
+        'articles', version, request.user.pk, request.get_full_path(),
+        modified=[article_cache.version_time(version)])
+
+
+def article_state(view, request, slug):
+    if not article_cache.enabled():
+        return None
+    version = article_cache.article_version(slug)
+    author_id = article_cache.cached_author_id(
+        article_cache.article_key(slug))
+    if author_id is None:
+        author_id = Article.objects.filter(slug=slug).values_list(
+            'author_id', flat=True).first()
+        if author_id is None:
+            return None
+    author_version = article_cache.author_version(author_id)
+    return resource_state(
+        'article', request.get_full_path(), version, author_version,
+        request.user.pk,
+        modified=[article_cache.version_time(version),
+                  article_cache.version_time(author_version)])
 
 
 class ArticleAPIView(generics.ListCreateAPIView):
@@ -49,72 +93,160 @@ class ArticleAPIView(generics.ListCreateAPIView):
         """
         permission_classes = (IsAuthenticated,)
         context = {"request": request}
-        article = request.data.copy()
-        article['slug'] = ArticleSerializer(
-        ).create_slug(request.data['title'])
-        serializer = self.serializer_class(data=article, context=context)
-        if serializer.is_valid():
-            serializer.save(author=request.user)
+        serializer = self.serializer_class(data=request.data, context=context)
+        if not serializer.is_valid():
             return Response(
-                serializer.data,
-                status=status.HTTP_201_CREATED
+                serializer.errors,
+                status=status.HTTP_400_BAD_REQUEST
             )
+        for attempt in range(SLUG_ATTEMPTS):
+            slug = serializer.create_slug(
+                serializer.validated_data['title'])
+            try:
+                # a concurrent request may take the same slug first
+                with transaction.atomic():
+                    serializer.save(author=request.user, slug=slug)
+                break
+            except IntegrityError:
+                if attempt == SLUG_ATTEMPTS - 1:
+                    raise
         return Response(
-            serializer.errors,
-            status=status.HTTP_400_BAD_REQUEST
+            serializer.data,
+            status=status.HTTP_201_CREATED
         )
 
+    # view counts are left out of the versions, see cache.py
+    @conditional(articles_state, weak=True)
     def get(self, request):
         """
             GET /api/v1/articles/
+            GET /api/v1/articles/?pagination=cursor for keyset pages
         """
-        perform_pagination = PaginateContent()
+        if request.query_params.get('pagination') == 'cursor' or \
+                'cursor' in request.query_params:
+            perform_pagination = FeedCursorPagination()
+        else:
+            perform_pagination = PaginateContent()
+        fieldset = Fieldset.from_request(request)
         objs_per_page = perform_pagination.paginate_queryset(
-            self.queryset, request)
-        serializer = ArticleSerializer(
+            self.queryset.with_engagement(request.user, fieldset).order_by(
+                '-created_at', '-id'), request)
+        serializer = ArticleSummarySerializer(
             objs_per_page,
             context={
-                'request': request
+                'request': request,
+                'fieldset': fieldset
             },
             many=True
         )
         return perform_pagination.get_paginated_response(serializer.data)
 
 
+class TrendingArticlesView(generics.ListAPIView):
+    """
+        Articles with the highest trending score
+    """
+    permission_classes = (AllowAny,)
+    serializer_class = ArticleSummarySerializer
+    default_limit = 20
+    max_limit = 100
+
+    def get(self, request):
+        """
+            GET /api/v1/articles/trending/?limit=<n>
+        """
+        try:
+            limit = min(int(request.query_params.get(
+                'limit', self.default_limit)), self.max_limit)
+        except ValueError:
+            limit = self.default_limit
+        fieldset = Fieldset.from_request(request)
+        articles = Article.objects.with_engagement(
+            request.user, fieldset).filter(
+                trending_score__gt=0).order_by(
+                    '-trending_score', '-id')[:max(limit, 1)]
+        serializer = self.serializer_class(articles, context={
+            'request': request, 'fieldset': fieldset}, many=True)
+        return Response({"results": serializer.data}, status=200)
+
+
+def record_read(request, article_id):
+    # views are counted per worker and reads written in batches, see
+    # view_counts.py and reading_stats/buffer.py
+    view_counter.record(article_id)
+    if request.user.id:
+        read_buffer.record(request.user.id, article_id)
+
+
+def record_revalidated_read(view, request, slug):
+    # a reader revalidating their copy has still read the article
+    article_id = article_cache.cached_article_id(
+        article_cache.article_key(slug))
+    if article_id is None:
+        article_id = Article.objects.filter(slug=slug).values_list(
+            'pk', flat=True).first()
+    if article_id is not None:
+        record_read(request, article_id)
+
+
 class SpecificArticle(generics.RetrieveUpdateDestroyAPIView):
     """
         Specific article endpoint class
     """
     serializer_class = ArticleSerializer
 
+    @conditional(article_state, not_modified=record_revalidated_read,
+                 weak=True)
     def get(self, request, slug, *args, **kwargs):
         """
             GET /api/v1/articles/<slug>/
         """
-        try:
-            article = Article.objects.get(slug=slug)
-        except Article.DoesNotExist:
-            raise exceptions.NotFound({
-                "message": error_msgs['not_found']
-            })
-        # this checks if an istance of read exists
-        # if it doesn't then it creates a new one
-        if request.user.id:
-            if not ReadStats.objects.filter(user=request.user, article=article).exists():
-                user_stat = ReadStats(
-                    user=request.user,
-                    article=article
-                )
-                user_stat.article_read = True
-                user_stat.save()
-
-        serializer = ArticleSerializer(
-            article,
-            context={
-                'request': request
-            }
-        )
-        return Response(serializer.data, status=200)
+        # the whole article is cached and the fieldset applied to it
+        fieldset = Fieldset.from_request(request)
+        key = article_cache.article_key(slug)
+        data = article_cache.get_payload(key)
+        if data is None:
+            try:
+                article = Article.objects.select_related(
+                    'author', 'content').get(slug=slug)
+            except Article.DoesNotExist:
+                raise exceptions.NotFound({
+                    "message": error_msgs['not_found']
+                })
+            author_version = article_cache.author_version(article.author_id)
+            data = ArticleSerializer(
+                article,
+                context={
+                    'request': request
+                }
+            ).data
+            article_cache.set_payload(
+                key, article.author_id, author_version, data)
+            article_cache.set_view_count(article.pk, article.view_count)
+        else:
+            # only the reader's own like and rating come from the
+            # database, and the view count from its own cache entry
+            data = data.copy()
+            serializer = ArticleSerializer(context={'request': request})
+            article = Article(pk=data['id'])
+            if fieldset is None or fieldset.includes('like_status'):
+                data['like_status'] = serializer.get_like_status(article)
+            if fieldset is None or fieldset.includes('my_rating'):
+                data['my_rating'] = serializer.get_my_rating(article)
+            if fieldset is None or fieldset.includes('view_count'):
+                views = article_cache.get_view_count(data['id'])
+                if views is None:
+                    views = Article.objects.filter(
+                        pk=data['id']).values_list(
+                            'view_count', flat=True).first() or 0
+                    article_cache.set_view_count(data['id'], views)
+                data['view_count'] = views
+
+        record_read(request, data['id'])
+
+        if fieldset is not None:
+            data = fieldset.prune_data(data)
+        return Response(data, status=200)
 
     def delete(self, request, slug, *args, **kwargs):
         """
@@ -176,10 +308,13 @@ class TagAPIView(generics.ListAPIView):
     serializer_class = TagSerializers
     permission_classes = (IsAuthenticatedOrReadOnly,)
 
-    def get(self, *args):
+    def get(self, request):
         """
             GET /api/v1/tags/
+            GET /api/v1/tags/?sort=popular for the most used tags first
         """
+        if request.query_params.get('sort') == 'popular':
+            return self.popular(request)
         data = self.get_queryset()
         serializer = self.serializer_class(data, many=True)
 
@@ -193,6 +328,18 @@ class TagAPIView(generics.ListAPIView):
             'message': error_msgs['tags_not_found'],
         }, status=status.HTTP_404_NOT_FOUND)
 
+    def popular(self, request):
+        """
+            Tags in use with their article counts, read from the counter
+            stored on each tag
+        """
+        paginator = PaginateContent()
+        page = paginator.paginate_queryset(
+            Tags.objects.filter(article_count__gt=0).order_by(
+                '-article_count', 'tag'), request)
+        serializer = TagCountSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
 
 def get_article(slug):
     """
@@ -253,8 +400,7 @@ class ShareViaEmail(generics.CreateAPIView):
             from_email, [
                 to_email,
             ],
-            html_message=message,
-            fail_silently=False)
+            html_message=message)
 
         message = {
             'message':
@@ -300,54 +446,63 @@ class ShareViaFacebookAndTwitter(generics.CreateAPIView):
 
 class SearchView(generics.ListAPIView):
     permission_classes = (AllowAny,)
-    serializer_class = ArticleSerializer
+    serializer_class = ArticleSummarySerializer
     filter_class = ArticleFilter
     filter_backends = (SearchFilter, OrderingFilter,)
-    search_fields = ('title', 'body',
+    search_fields = ('title', 'content__text',
                      'author__username', 'tags__tag')
 
-    def get_queryset(self, request):
+    def get_queryset(self):
         """Overrides the get_queryset method"""
 
-        queryset = Article.objects.all()
-        author = self.request.query_params.get('author', None)
-        title = self.request.query_params.get('title', None)
-        body = self.request.query_params.get('body', None)
-        tag = self.request.query_params.get('tag', None)
-
-        if author:
-            queryset = queryset.filter(author__username__icontains=author)
-        if title:
-            queryset = queryset.filter(title__icontains=title)
-        if body:
-            queryset = queryset.filter(body__icontains=body)
-        if tag:
-            queryset = queryset.filter(tags__tag__icontains=tag)
-        if queryset:
-            return queryset
-        else:
+        params = self.request.query_params
+        terms = {
+            None: params.get('q', None),
+            'author': params.get('author', None),
+            'title': params.get('title', None),
+            'body': params.get('body', None),
+            'tags': params.get('tag', None),
+        }
+        return search_backend().search(Article.objects.with_engagement(
+            self.request.user, Fieldset.from_request(self.request)), terms)
+
+    def get(self, request):
+        """
+        Handles GET requests. Returns filtered results one page at a time
+        """
+        paginator = PaginateWithoutCount()
+        results = paginator.paginate_queryset(self.get_queryset(), request)
+        if not results and paginator.page_number == 1:
             raise exceptions.NotFound({
                 "message": error_msgs['not_found']
             })
+        serializer = self.serializer_class(
+            results, context={
+                'request': request,
+                'fieldset': Fieldset.from_request(request)
+            }, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+class ArticleExportView(APIView):
+    """
+        Export every article as newline delimited JSON
+    """
+    permission_classes = (IsAdminUser,)
 
     def get(self, request):
         """
-        Handles GET requests. Returns filtered results
+            GET /api/v1/articles/export.ndjson
+            GET /api/v1/articles/export.ndjson?updated_since=<ISO 8601>
         """
-
-        serializer = self.serializer_class(
-            self.get_queryset(request), context={
-                'request': request
-            }, many=True)
-        results = serializer.data
-        paginator = Paginator(results, 25)
-        page = request.GET.get('page')
-        try:
-            results = paginator.page(page)
-        except PageNotAnInteger:
-             # If page is not an integer, deliver first page.
-            results = paginator.page(1)
-        except EmptyPage:
-             # If page is out of range (e.g. 9999), deliver last page of results.
-            results = paginator.page(paginator.num_pages)
-        return Response(results.object_list)
+        updated_since = request.query_params.get('updated_since')
+        if updated_since:
+            try:
+                updated_since = export.parse_since(updated_since)
+            except ValueError:
+                raise exceptions.ValidationError({
+                    "message": error_msgs['invalid_datetime']
+                })
+        return StreamingHttpResponse(
+            export.ndjson(updated_since or None),
+            content_type='application/x-ndjson')
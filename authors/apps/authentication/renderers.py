@@ -1,6 +1,5 @@
-import json
-
-from rest_framework.renderers import JSONRenderer
+from authors.apps.core import codec
+from authors.apps.core.renderers import JSONRenderer
 
 
 class UserJSONRenderer(JSONRenderer):
@@ -19,6 +18,6 @@ class UserJSONRenderer(JSONRenderer):
             return super(UserJSONRenderer, self).render(data)
 
         # Finally, we can render our data under the "user" namespace.
-        return json.dumps({
+        return codec.dumps({
             'user': data
         })
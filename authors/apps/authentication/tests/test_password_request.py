@@ -3,6 +3,8 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from ..messages import error_msg, success_msg
 from django.core import mail
+from django.core.management import call_command
+from io import StringIO
 
 
 class TestResetPassword(TestCase):
@@ -92,6 +94,9 @@ class TestResetPassword(TestCase):
             response.data['Message'],
             success_msg['request_success'])
 
+        # the emails are sent by the job workers
+        self.assertEqual(len(mail.outbox), 0)
+        call_command('run_jobs', '--once', stdout=StringIO())
         self.assertEqual(len(mail.outbox), 2)
         self.assertNotIn("token", response.data)
 
@@ -5,7 +5,6 @@ from datetime import datetime, timedelta
 
 import django
 from django.contrib.sites.shortcuts import get_current_site
-from django.core.mail import send_mail
 from django.db import IntegrityError
 from django.template import context
 from django.template.loader import get_template, render_to_string
@@ -27,6 +26,8 @@ from social_core.backends.oauth import BaseOAuth1, BaseOAuth2
 from social_core.exceptions import AuthForbidden, AuthTokenError, MissingBackend
 from social_django.utils import load_backend, load_strategy
 
+from authors.apps.jobs.mail import send_mail
+
 from .backends import GetAuthentication, JWTokens
 from .messages import error_msg, success_msg
 from .models import User
@@ -84,7 +85,7 @@ class RegistrationAPIView(GenericAPIView):
                      }
         )
         send_mail(subject, "Verification mail", from_mail, [
-                  to_mail], fail_silently=False, html_message=html_page)
+                  to_mail], html_message=html_page)
         return Response({
             "message": success_msg['email_verify'],
             "username": serializer.data['username'],
@@ -252,8 +253,7 @@ class PasswordResetRequestAPIView(GenericAPIView):
                 from_email, [
                     to_email,
                 ],
-                html_message=message,
-                fail_silently=False)
+                html_message=message)
             message = {
                 'Message': success_msg['request_success'],
                 'Token': token
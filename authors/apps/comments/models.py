@@ -17,6 +17,11 @@ class Comments(models.Model):
     updated_at = models.DateTimeField(auto_now_add=True)
     prefs = GenericRelation(LikeDislike, related_query_name='comments')
 
+    class Meta:
+        # the comments of an article, listed oldest first
+        indexes = [models.Index(fields=['article', 'created_at'],
+                                name='comment_article_created_idx')]
+
     def __str__(self):
         return str(self.author_profile)
         
@@ -2,6 +2,7 @@ from django.contrib.contenttypes.models import ContentType
 from authors.apps.articles.serializers import ArticleSerializer
 from authors.apps.authentication.messages import statusmessage
 from authors.apps.authentication.serializers import UserSerializer
+from authors.apps.core.fieldsets import SparseFieldsMixin
 from authors.apps.like_dislike.models import LikeDislike
 from authors.apps.like_dislike.serializers import PreferenceSerializer
 from authors.apps.profiles.serializers import UserProfileSerializer
@@ -9,7 +10,7 @@ from rest_framework import serializers
 from .models import Comments
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
        Serializer class for comments
     """
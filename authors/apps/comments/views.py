@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework import generics
 from rest_framework import status
 from rest_framework.response import Response
@@ -6,11 +7,32 @@ from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnl
 from .serializers import CommentSerializer
 from .utils import Utils
 from .models import Comments
+from authors.apps.articles import cache as article_cache
 from authors.apps.articles.models import Article
+from authors.apps.core.conditional import conditional, resource_state
+from authors.apps.core.fieldsets import Fieldset
 from authors.apps.profiles.models import Profile
 from ..authentication.messages import error_msg, success_msg
 
 
+def comments_state(view, request, slug, *args, **kwargs):
+    if not article_cache.enabled():
+        return None
+    article_id = Article.objects.filter(slug=slug).values_list(
+        'id', flat=True).first()
+    if article_id is None:
+        return None
+    # each comment nests the article and the profiles of the authors
+    versions = [
+        article_cache.article_version(slug),
+        article_cache.authors_version(),
+        article_cache.comments_version(article_id),
+    ]
+    return resource_state(
+        'comments', request.get_full_path(), request.user.pk, *versions,
+        modified=[article_cache.version_time(v) for v in versions])
+
+
 class CreateCommentAPiView(generics.ListCreateAPIView):
     """
         View class to create and fetch comments
@@ -31,22 +53,32 @@ class CreateCommentAPiView(generics.ListCreateAPIView):
         })
         author_profile = Profile.objects.get(user=request.user)
         serializer.is_valid()
-        serializer.save(author_profile=author_profile,
-                        article_id=article.id,
-                        )
+        with transaction.atomic():
+            serializer.save(author_profile=author_profile,
+                            article_id=article.id,
+                            )
+            Article.objects.filter(pk=article.pk).update_counters(
+                comment_count=1)
         result = {"message": success_msg["added_comment"]}
         result.update(serializer.data)
         return Response(result,
                         status=status.HTTP_201_CREATED)
 
+    # each comment nests its article and the article's view count
+    @conditional(comments_state, weak=True)
     def get(self, request, *args, **kwargs):
         '''This method gets all comments for an article'''
         slug = self.kwargs['slug']
         article = self.util.check_article(slug)
-        comments = self.queryset.filter(article_id=article.id)
-        serializer = self.serializer_class(comments, context={'request':request}, many=True)
+        fieldset = Fieldset.from_request(request)
+        comments = self.queryset.filter(
+            article_id=article.id).order_by('created_at', 'pk')
+        if fieldset is not None:
+            comments = fieldset.defer(comments, 'body')
+        serializer = self.serializer_class(comments, context={
+            'request': request, 'fieldset': fieldset}, many=True)
         return Response({"comments": serializer.data,
-                         "commentsCount": comments.count()
+                         "commentsCount": article.comment_count
                          }, status=status.HTTP_200_OK)
 
 
@@ -79,7 +111,10 @@ class CommentApiView(generics.RetrieveUpdateDestroyAPIView):
         comment = self.util.check_comment(id)
 
         if request.user.pk == comment.author_profile.id:
-            self.perform_destroy(comment)
+            with transaction.atomic():
+                self.perform_destroy(comment)
+                Article.objects.filter(pk=comment.article_id).update_counters(
+                    comment_count=-1)
             msg = success_msg["deleted_comment"]
             return Response({
                 "message": msg
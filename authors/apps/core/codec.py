@@ -0,0 +1,60 @@
+"""
+    The JSON codec used by the API renderers and parser.
+
+    JSON_CODEC picks the implementation: 'orjson' (in requirements.txt),
+    'json' for the standard library, or 'auto' (the default) for the
+    fastest one available. Both write compact JSON bytes straight from
+    the serializer output, dicts and OrderedDicts alike, and hand
+    everything else (dates, times, decimals, UUIDs, lazy strings) to the
+    encoder of Django REST framework, so the output decodes to the same
+    data whichever is used. The standard library escapes non-ASCII
+    characters, which is the fastest way it has to write bytes.
+"""
+import json
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_CODEC = getattr(settings, 'JSON_CODEC', 'auto')
+
+default = JSONEncoder().default
+
+_encode = json.JSONEncoder(default=default, separators=(',', ':')).encode
+
+
+def _json_dumps(data):
+    return _encode(data).encode('ascii')
+
+
+def _orjson_dumps(data):
+    # let datetimes through to default so they are written as DRF does
+    return orjson.dumps(data, default=default, option=getattr(
+        orjson, 'OPT_PASSTHROUGH_DATETIME', 0))
+
+
+def _json_loads(data):
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+CODECS = {'json': (_json_dumps, _json_loads)}
+if orjson is not None:
+    CODECS['orjson'] = (_orjson_dumps, orjson.loads)
+
+if JSON_CODEC == 'auto':
+    name = 'orjson' if orjson is not None else 'json'
+elif JSON_CODEC in CODECS:
+    name = JSON_CODEC
+else:
+    raise ImproperlyConfigured(
+        "JSON_CODEC must be one of 'auto', {}".format(
+            ', '.join(repr(codec) for codec in sorted(CODECS))))
+
+dumps, loads = CODECS[name]
@@ -0,0 +1,60 @@
+"""
+    Conditional GET support for API views.
+"""
+import hashlib
+from calendar import timegm
+from functools import wraps
+
+from django.utils.cache import (get_conditional_response, patch_vary_headers,
+                                quote_etag)
+from django.utils.http import http_date
+
+
+def resource_state(*parts, modified=()):
+    """
+        The (etag, last_modified) pair of a response built from the given
+        versions. `parts` identify everything the payload depends on and
+        `modified` holds the datetimes it last changed at.
+    """
+    etag = hashlib.md5(
+        ':'.join(str(part) for part in parts).encode()).hexdigest()
+    return etag, max(modified) if modified else None
+
+
+def conditional(state, not_modified=None, weak=False):
+    """
+        Decorate a view method so that it emits ETag and Last-Modified
+        and answers a matching If-None-Match or If-Modified-Since with a
+        304 before the method runs. `state(view, request, *args, **kwargs)`
+        returns the (etag, last_modified) pair of the resource, or None
+        to serve the request unconditionally. `not_modified`, called with
+        the same arguments, does what the method would have done besides
+        building the response when a 304 is returned instead. A `weak`
+        ETag is sent for payloads holding values its state leaves out.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            current = state(view, request, *args, **kwargs)
+            if current is None:
+                return method(view, request, *args, **kwargs)
+            etag, last_modified = current
+            etag = quote_etag(etag)
+            if weak:
+                etag = 'W/' + etag
+            timestamp = last_modified and timegm(last_modified.utctimetuple())
+            response = get_conditional_response(
+                request, etag=etag, last_modified=timestamp)
+            if response is None:
+                response = method(view, request, *args, **kwargs)
+            elif not_modified is not None and response.status_code == 304:
+                not_modified(view, request, *args, **kwargs)
+            if response.status_code in (200, 304):
+                response['ETag'] = etag
+                if timestamp:
+                    response['Last-Modified'] = http_date(timestamp)
+            # the payloads depend on who is reading them
+            patch_vary_headers(response, ('Authorization',))
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,136 @@
+"""
+    Sparse fieldsets for API reads.
+
+    `?fields=slug,title,author.username` keeps only the named fields and
+    `?exclude=body,author.favorites` drops the named ones; dots reach
+    into nested serializers. Fields are removed from the serializer
+    before it runs, so the method fields and nested serializers left out
+    are never evaluated, and views use `includes()` to avoid loading what
+    is not going to be shown.
+"""
+from rest_framework import serializers
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def parse(value):
+    """
+        The tree of the comma separated, dotted field names in value
+    """
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for name in filter(None, path.strip().split('.')):
+            node = node.setdefault(name, {})
+    return tree
+
+
+class Fieldset:
+    """
+        The fields a request asked for, as trees of field names where an
+        empty node stands for the whole field
+    """
+
+    def __init__(self, only=None, exclude=None):
+        self.only = only
+        self.exclude = exclude or {}
+
+    @classmethod
+    def from_request(cls, request):
+        """
+            The fieldset of a read request, or None when it did not ask
+            for one
+        """
+        fields = request.query_params.get('fields')
+        exclude = request.query_params.get('exclude')
+        if request.method not in SAFE_METHODS or not (fields or exclude):
+            return None
+        return cls(parse(fields) if fields else None,
+                   parse(exclude) if exclude else None)
+
+    def includes(self, path):
+        """
+            Whether the field at the dotted path is shown
+        """
+        only, exclude = self.only, self.exclude
+        for name in path.split('.'):
+            if only is not None:
+                if name not in only:
+                    return False
+                only = only[name] or None
+            if name in exclude:
+                if not exclude[name]:
+                    return False
+                exclude = exclude[name]
+            else:
+                exclude = {}
+        return True
+
+    def prune(self, fields, only=None, exclude=None, top=True):
+        """
+            Remove the fields that are not shown from a serializer's
+            fields, recursing into nested serializers
+        """
+        if top:
+            only, exclude = self.only, self.exclude
+        for name in list(fields):
+            if (only is not None and name not in only) or \
+                    (name in exclude and not exclude[name]):
+                del fields[name]
+                continue
+            nested_only = only.get(name) or None if only else None
+            nested_exclude = exclude.get(name) or {}
+            if nested_only is None and not nested_exclude:
+                continue
+            nested = fields[name]
+            nested = getattr(nested, 'child', nested)
+            if isinstance(nested, serializers.BaseSerializer):
+                self.prune(nested.fields, nested_only, nested_exclude, False)
+
+    def prune_data(self, data, only=None, exclude=None, top=True):
+        """
+            Remove the fields that are not shown from serialized data
+        """
+        if top:
+            only, exclude = self.only, self.exclude
+        if isinstance(data, list):
+            return [self.prune_data(item, only, exclude, False)
+                    for item in data]
+        if not isinstance(data, dict):
+            return data
+        pruned = {}
+        for name, value in data.items():
+            if (only is not None and name not in only) or \
+                    (name in exclude and not exclude[name]):
+                continue
+            nested_only = only.get(name) or None if only else None
+            nested_exclude = exclude.get(name) or {}
+            if nested_only is not None or nested_exclude:
+                value = self.prune_data(
+                    value, nested_only, nested_exclude, False)
+            pruned[name] = value
+        return pruned
+
+    def defer(self, queryset, *names):
+        """
+            Defer the loading of the named model fields that are not shown
+        """
+        deferred = [name for name in names if not self.includes(name)]
+        return queryset.defer(*deferred) if deferred else queryset
+
+
+class SparseFieldsMixin:
+    """
+        Serializer that shows only the fields of the fieldset passed as
+        `fieldset` in its context, when it is not nested in another one
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        fieldset = self.context.get('fieldset')
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        if fieldset is not None and parent is None:
+            fieldset.prune(fields)
+        return fields
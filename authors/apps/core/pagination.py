@@ -1,4 +1,12 @@
-from rest_framework.pagination import PageNumberPagination
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (Cursor, CursorPagination,
+                                       PageNumberPagination)
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class PaginateContent(PageNumberPagination):
@@ -7,3 +15,171 @@ class PaginateContent(PageNumberPagination):
     """
     page_size = 12
     page_size_query_param = 'page_size'
+
+
+class PaginateWithoutCount(PageNumberPagination):
+    """
+        Page number pagination that slices the queryset in SQL and fetches
+        one extra row to know whether there is a next page, instead of
+        running a COUNT(*) over every match
+    """
+    page_size = 25
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        try:
+            self.page_number = max(
+                int(request.query_params.get(self.page_query_param, 1)), 1)
+        except (TypeError, ValueError):
+            self.page_number = 1
+        offset = (self.page_number - 1) * page_size
+        rows = list(queryset[offset:offset + page_size + 1])
+        self.has_next = len(rows) > page_size
+        return rows[:page_size]
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number == 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(
+            url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('previous', self.get_previous_link()),
+            ('results', data)
+        ]))
+
+
+class FeedCursorPagination(CursorPagination):
+    """
+        Keyset pagination over (created_at, id), newest first. Each page is
+        one indexed range scan from the position stored in the opaque
+        cursor, so deep pages cost the same as the first one and rows
+        inserted meanwhile do not shift the pages a client is walking.
+    """
+    page_size = 12
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        reverse = self.start(request)
+        results = list(self.seek(queryset, 'id', reverse)[
+            :self.page_size + 1])
+        return self.set_page(results, reverse)
+
+    def start(self, request):
+        """
+            Read the page size and cursor of the request. Returns whether
+            the client is walking backwards.
+        """
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        return self.cursor is not None and self.cursor.reverse
+
+    def seek(self, queryset, id_field, reverse):
+        """
+            Order queryset by (created_at, id_field) and start it at the
+            position of the cursor
+        """
+        if reverse:
+            queryset = queryset.order_by('created_at', id_field)
+        else:
+            queryset = queryset.order_by('-created_at', '-' + id_field)
+        if self.cursor is not None and self.cursor.position:
+            created_at, pk = self.parse_position(self.cursor.position)
+            # the bare range on created_at lets the database seek the
+            # index; the OR only breaks ties on the boundary timestamp
+            if reverse:
+                queryset = queryset.filter(
+                    Q(created_at__gt=created_at) |
+                    Q(**{id_field + '__gt': pk}),
+                    created_at__gte=created_at)
+            else:
+                queryset = queryset.filter(
+                    Q(created_at__lt=created_at) |
+                    Q(**{id_field + '__lt': pk}),
+                    created_at__lte=created_at)
+        return queryset
+
+    def set_page(self, results, reverse):
+        """
+            Keep one page of results, fetched with one extra row that
+            tells whether there is more
+        """
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+        return self.page
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor(Cursor(
+            offset=0, reverse=False, position=self.position(self.page[-1])))
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self.encode_cursor(Cursor(
+            offset=0, reverse=True, position=self.position(self.page[0])))
+
+    def position(self, instance):
+        return '{}|{}'.format(instance.created_at.isoformat(), instance.pk)
+
+    def parse_position(self, position):
+        try:
+            created_at, pk = position.rsplit('|', 1)
+            created_at, pk = parse_datetime(created_at), int(pk)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if created_at is None:
+            raise NotFound(self.invalid_cursor_message)
+        return created_at, pk
+
+
+class MergedFeedPagination(FeedCursorPagination):
+    """
+        Keyset pagination over the union of several sources of articles.
+        Each source is read with its own range scan from the cursor and
+        the sources are merged in memory, so the union never has to be
+        sorted by the database.
+    """
+
+    def paginate_sources(self, sources, request):
+        """
+            Paginate (queryset, id field) sources whose rows have a
+            created_at and the id of an article in id field. Returns the
+            ids of the articles on the page.
+        """
+        reverse = self.start(request)
+        rows = set()
+        for queryset, id_field in sources:
+            rows.update(self.seek(queryset, id_field, reverse).values_list(
+                'created_at', id_field)[:self.page_size + 1])
+        rows = sorted(rows, reverse=not reverse)[:self.page_size + 1]
+        return [pk for _, pk in self.set_page(rows, reverse)]
+
+    def position(self, instance):
+        created_at, pk = instance
+        return '{}|{}'.format(created_at.isoformat(), pk)
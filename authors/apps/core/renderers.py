@@ -0,0 +1,17 @@
+from rest_framework import renderers
+
+from . import codec
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+        Renders JSON with the project's codec. Indented output, as asked
+        for by the browsable API, is left to Django REST framework.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return bytes()
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return codec.dumps(data)
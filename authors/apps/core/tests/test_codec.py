@@ -0,0 +1,56 @@
+import datetime
+import json
+from collections import OrderedDict
+from decimal import Decimal
+from uuid import UUID
+
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APITestCase
+
+from .. import codec
+
+
+class CodecTest(APITestCase):
+    """
+        The JSON codec of the renderers and parser
+    """
+
+    def codecs(self):
+        """
+            Each codec in turn, whichever JSON_CODEC picked
+        """
+        for name in ('json', 'orjson'):
+            with self.subTest(codec=name):
+                if name not in codec.CODECS:
+                    self.skipTest("{} is not installed".format(name))
+                yield codec.CODECS[name]
+
+    def test_output_matches_rest_framework(self):
+        data = OrderedDict([
+            ('title', "Café"), ('rating', Decimal('4.50')),
+            ('created_at', datetime.datetime(
+                2019, 3, 1, 12, 30, tzinfo=timezone.utc)),
+            ('day', datetime.date(2019, 3, 1)),
+            ('id', UUID(int=1)), ('label', gettext_lazy("Article")),
+            ('tags', ["Django", "Python"]), ('author', None),
+        ])
+        expected = json.loads(JSONRenderer().render(data).decode())
+        for dumps, _ in self.codecs():
+            self.assertEqual(json.loads(dumps(data).decode()), expected)
+            self.assertIn('"created_at":"2019-03-01T12:30:00Z"',
+                          dumps(data).decode())
+
+    def test_round_trip(self):
+        data = {"user": {"username": "Zoë", "tags": [1, 2.5, True]}}
+        for dumps, loads in self.codecs():
+            self.assertEqual(loads(dumps(data)), data)
+            self.assertEqual(json.loads(dumps(data).decode('utf-8')), data)
+
+    def test_malformed_body_is_a_bad_request(self):
+        response = APIClient().post(reverse("auth:login"), '{"user": {',
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("JSON parse error", str(response.data))
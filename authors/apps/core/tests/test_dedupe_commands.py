@@ -0,0 +1,111 @@
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from authors.apps.articles.models import Article, Tags
+from authors.apps.authentication.models import User
+from authors.apps.favorite.models import Favorite
+from authors.apps.like_dislike.models import LikeDislike
+from authors.apps.rating.models import Rating
+from authors.apps.reading_stats.models import ReadStats
+
+# the columns of the tables the dedupe commands clean up, before the
+# migrations that add the counters and unique indexes
+OLD_COLUMNS = {
+    'articles_article': ('id', 'image_path', 'slug', 'title', 'body',
+                         'created_at', 'updated_at', 'favourites',
+                         'author_id'),
+    'articles_tags': ('id', 'tag'),
+    'rating_rating': ('id', 'user_id', 'article_id', 'your_rating'),
+    'favorite_favorite': ('id', 'article_url', 'article_title',
+                          'article_slug', 'user_id', 'favorited_date'),
+    'like_dislike_likedislike': ('id', 'pref', 'user_id', 'content_type_id',
+                                 'object_id'),
+    'reading_stats_readstats': ('id', 'user_id', 'article_id',
+                                'article_read', 'created_at', 'updated_at'),
+}
+
+
+class OldSchemaDedupeTest(TestCase):
+    """
+        The dedupe commands run before migrating, against tables without
+        the new columns and unique indexes
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.content_type = ContentType.objects.get_for_model(Article)
+        # the old tables are swapped in for the test's transaction only;
+        # the legacy mode leaves the foreign keys naming the old tables
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA legacy_alter_table = ON')
+            for table, columns in OLD_COLUMNS.items():
+                cursor.execute('ALTER TABLE {0} RENAME TO {0}__migrated'
+                               .format(table))
+                cursor.execute(
+                    'CREATE TABLE {0} AS SELECT {1} FROM {0}__migrated '
+                    'WHERE 0'.format(table, ', '.join(columns)))
+            cursor.execute('PRAGMA legacy_alter_table = OFF')
+        now = timezone.now()
+        for pk in (1, 2):
+            self.insert('articles_article', id=pk, slug="twice",
+                        title="Twice", body="Lorem ipsum", created_at=now,
+                        updated_at=now, favourites=False,
+                        author_id=self.user.pk)
+            self.insert('rating_rating', id=pk, user_id=self.user.pk,
+                        article_id=1, your_rating=pk)
+            self.insert('favorite_favorite', id=pk, article_slug="twice",
+                        user_id=self.user.pk, favorited_date=now)
+            self.insert('like_dislike_likedislike', id=pk, pref=str(pk),
+                        user_id=self.user.pk,
+                        content_type_id=self.content_type.pk, object_id=1)
+            self.insert('reading_stats_readstats', id=pk,
+                        user_id=self.user.pk, article_id=1,
+                        article_read=pk == 2, created_at=now, updated_at=now)
+        self.insert('articles_tags', id=1, tag="Django")
+        self.insert('articles_tags', id=2, tag="django")
+        self.insert(Article.tags.through._meta.db_table,
+                    article_id=1, tags_id=2)
+
+    def insert(self, table, **row):
+        with connection.cursor() as cursor:
+            cursor.execute('INSERT INTO {} ({}) VALUES ({})'.format(
+                table, ', '.join(row), ', '.join(['%s'] * len(row))),
+                list(row.values()))
+
+    def run_command(self, name):
+        out = StringIO()
+        call_command(name, stdout=out)
+        return out.getvalue()
+
+    def test_dedupe_before_migrating(self):
+        self.assertIn("Renamed 1 articles",
+                      self.run_command('dedupe_article_slugs'))
+        self.assertEqual(list(Article.objects.order_by('pk').values_list(
+            'slug', flat=True)), ["twice", "twice-1"])
+        self.assertIn("Merged 1 tags", self.run_command('dedupe_tags'))
+        self.assertEqual(list(Tags.objects.values_list('pk', 'tag')),
+                         [(1, "Django")])
+        self.assertEqual(list(Article.tags.through.objects.values_list(
+            'article_id', 'tags_id')), [(1, 1)])
+        self.assertIn("Removed 1 duplicated ratings",
+                      self.run_command('dedupe_ratings'))
+        self.assertEqual(list(Rating.objects.values_list(
+            'your_rating', flat=True)), [2])
+        self.assertIn("Removed 1 duplicated favorites",
+                      self.run_command('dedupe_favorites'))
+        self.assertEqual(list(Favorite.objects.values_list(
+            'pk', flat=True)), [1])
+        self.assertIn("Removed 1 duplicated likes and dislikes",
+                      self.run_command('dedupe_preferences'))
+        self.assertEqual(list(LikeDislike.objects.values_list(
+            'pref', flat=True)), ["2"])
+        self.assertIn("Removed 1 duplicated reads",
+                      self.run_command('dedupe_read_stats'))
+        self.assertEqual(list(ReadStats.objects.values_list(
+            'pk', 'article_read')), [(1, True)])
@@ -0,0 +1,82 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase
+
+from authors.apps.articles.models import Article
+from authors.apps.authentication.models import User
+from authors.apps.comments.models import Comments
+from authors.apps.favorite.models import Favorite
+from authors.apps.like_dislike.models import LikeDislike
+from authors.apps.profiles.models import Profile
+from authors.apps.rating.models import Rating
+from authors.apps.reading_stats.models import ReadStats
+
+
+class HotQueryPlanTest(TestCase):
+    """
+        The per-user lookups of the engagement views should be answered
+        from an index rather than by scanning their tables
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.article = Article.objects.create(
+            title="Planned", body="Lorem ipsum", slug="planned",
+            author=self.user)
+
+    def plan(self, queryset):
+        """
+            The steps of the SQLite query plan of a queryset
+        """
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assertUsesIndex(self, queryset, table, columns):
+        steps = self.plan(queryset)
+        searches = [step for step in steps if table in step.split()]
+        self.assertTrue(searches, steps)
+        for step in searches:
+            self.assertTrue(step.startswith('SEARCH'), steps)
+            self.assertIn('({})'.format(
+                ' AND '.join('{}=?'.format(column) for column in columns)),
+                step)
+        self.assertFalse([step for step in steps if 'TEMP B-TREE' in step],
+                         steps)
+
+    def test_rating_by_user_and_article(self):
+        self.assertUsesIndex(
+            Rating.objects.filter(user=self.user, article=self.article),
+            'rating_rating', ('user_id', 'article_id'))
+
+    def test_read_by_user_and_article(self):
+        self.assertUsesIndex(
+            ReadStats.objects.filter(user=self.user, article=self.article),
+            'reading_stats_readstats', ('user_id', 'article_id'))
+        self.assertUsesIndex(
+            ReadStats.objects.filter(user=self.user, article__slug="planned"),
+            'reading_stats_readstats', ('user_id', 'article_id'))
+
+    def test_favorite_by_user_and_slug(self):
+        self.assertUsesIndex(
+            Favorite.objects.filter(article_slug="planned", user=self.user),
+            'favorite_favorite', ('user_id', 'article_slug'))
+
+    def test_preference_by_item_and_user(self):
+        self.assertUsesIndex(
+            LikeDislike.objects.filter(
+                content_type=ContentType.objects.get_for_model(Article),
+                object_id=self.article.pk, user=self.user),
+            'like_dislike_likedislike',
+            ('content_type_id', 'object_id', 'user_id'))
+
+    def test_comments_of_an_article_in_order(self):
+        Comments.objects.create(
+            author_profile=Profile.objects.get(user=self.user),
+            article=self.article, body="First")
+        self.assertUsesIndex(
+            Comments.objects.filter(article_id=self.article.pk).order_by(
+                'created_at', 'pk'),
+            'comments_comments', ('article_id',))
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Min
+
+from authors.apps.favorite.models import Favorite
+
+
+class Command(BaseCommand):
+    """
+        Keep one favorite per user and article. Run it before migrating an
+        existing database to the unique index on Favorite (user,
+        article_slug); the oldest favorite of each pair is kept.
+    """
+    help = "Remove duplicated favorites"
+
+    def handle(self, *args, **options):
+        duplicated = Favorite.objects.values('user', 'article_slug').annotate(
+            total=Count('pk'), keep=Min('pk')).filter(total__gt=1)
+        removed = 0
+        for pair in duplicated:
+            with transaction.atomic():
+                removed += Favorite.objects.filter(
+                    user=pair['user'], article_slug=pair['article_slug']
+                ).exclude(pk=pair['keep']).delete()[0]
+        self.stdout.write("Removed {} duplicated favorites".format(removed))
@@ -15,3 +15,6 @@ class Favorite(models.Model):
     user = models.ForeignKey(
         User, related_name="favorites", on_delete=models.CASCADE)
     favorited_date = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('user', 'article_slug')
@@ -0,0 +1,169 @@
+"""
+    Feeds of the articles by the authors a user follows.
+
+    Most authors have few followers, so their new articles are copied
+    into a FeedEntry per follower when they are published (fan-out on
+    write) and a feed page is a single index range over the entries of
+    its owner. Copying the articles of an author with thousands of
+    followers would make publishing slow, so authors with more than
+    FEED_FANOUT_LIMIT followers are skipped and their articles are merged
+    into the feed when it is read (fan-out on read), see views.py. When
+    such an author drops back to the limit, their latest articles are
+    copied into the feeds of their followers, which missed what they
+    published and who followed them meanwhile.
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import models
+from django.db.models.signals import m2m_changed, post_save
+
+from authors.apps.articles.models import Article
+from authors.apps.authentication.models import User
+from authors.apps.profiles.models import Profile
+
+# authors with more followers are merged into feeds when they are read
+# instead of being copied into every follower's feed when they publish
+FEED_FANOUT_LIMIT = getattr(settings, 'FEED_FANOUT_LIMIT', 1000)
+# articles copied into a feed when its owner follows a new author
+FEED_BACKFILL = 50
+
+
+class FeedEntryQuerySet(models.QuerySet):
+    """
+        Fan-out of articles into the feeds of the followers of their
+        authors
+    """
+
+    def fan_out(self, *articles):
+        """
+            Copy new articles into their authors' followers' feeds,
+            skipping the authors with more than FEED_FANOUT_LIMIT
+            followers
+        """
+        authors = set(Profile.objects.filter(
+            user_id__in={article.author_id for article in articles},
+            follower_count__gt=0,
+            follower_count__lte=FEED_FANOUT_LIMIT).values_list(
+                'user_id', flat=True))
+        if not authors:
+            return 0
+        followers = defaultdict(list)
+        for user_id, author_id in Profile.is_following.through.objects.filter(
+                user_id__in=authors).values_list('profile__user_id',
+                                                 'user_id'):
+            followers[author_id].append(user_id)
+        entries = [
+            self.model(user_id=user_id, article_id=article.pk,
+                       author_id=article.author_id,
+                       created_at=article.created_at)
+            for article in articles
+            for user_id in followers[article.author_id]]
+        self.bulk_create(entries, batch_size=1000)
+        return len(entries)
+
+    def backfill(self, user_id, author_ids):
+        """
+            Copy the latest articles of newly followed authors into a feed
+        """
+        authors = list(Profile.objects.filter(
+            user_id__in=author_ids,
+            follower_count__lte=FEED_FANOUT_LIMIT).values_list(
+                'user_id', flat=True))
+        present = set(self.filter(user_id=user_id, author_id__in=authors)
+                      .values_list('article_id', flat=True))
+        entries = []
+        for author_id in authors:
+            entries.extend(
+                self.model(user_id=user_id, article_id=pk,
+                           author_id=author_id, created_at=created_at)
+                for pk, created_at in Article.objects.filter(
+                    author_id=author_id).order_by(
+                        '-created_at', '-id').values_list(
+                            'pk', 'created_at')[:FEED_BACKFILL]
+                if pk not in present)
+        self.bulk_create(entries)
+
+    def backfill_followers(self, author_ids):
+        """
+            Copy the latest articles of authors into the feeds of all
+            their followers
+        """
+        for author_id in author_ids:
+            articles = list(Article.objects.filter(
+                author_id=author_id).order_by(
+                    '-created_at', '-id').values_list(
+                        'pk', 'created_at')[:FEED_BACKFILL])
+            present = set(self.filter(
+                author_id=author_id,
+                article_id__in=[pk for pk, _ in articles]).values_list(
+                    'user_id', 'article_id'))
+            self.bulk_create([
+                self.model(user_id=user_id, article_id=pk,
+                           author_id=author_id, created_at=created_at)
+                for user_id in Profile.objects.filter(
+                    is_following=author_id).values_list('user_id', flat=True)
+                for pk, created_at in articles
+                if (user_id, pk) not in present], batch_size=1000)
+
+
+class FeedEntry(models.Model):
+    """
+        An article in the feed of a user following its author
+    """
+    user = models.ForeignKey(
+        User, related_name='feed_entries', on_delete=models.CASCADE)
+    article = models.ForeignKey(
+        Article, related_name='feed_entries', on_delete=models.CASCADE)
+    author = models.ForeignKey(
+        User, related_name='+', on_delete=models.CASCADE)
+    # copied from the article so a feed page is one index range
+    created_at = models.DateTimeField()
+
+    objects = FeedEntryQuerySet.as_manager()
+
+    class Meta:
+        unique_together = ('user', 'article')
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-article'],
+                         name='feed_entry_user_idx'),
+        ]
+
+
+def fan_out_article(sender, instance, created, **kwargs):
+    # new articles go to the feeds of their author's followers
+    if created:
+        FeedEntry.objects.fan_out(instance)
+
+
+def follow_feed(sender, instance, action, reverse, pk_set, **kwargs):
+    # following fills the feed with the author's articles and
+    # unfollowing takes them out
+    if reverse or action not in ('post_add', 'post_remove', 'pre_clear',
+                                 'post_clear'):
+        return
+    if action == 'post_add':
+        FeedEntry.objects.backfill(instance.user_id, pk_set)
+        return
+    if action == 'post_clear':
+        FeedEntry.objects.backfill_followers(_back_at_limit(instance))
+        return
+    entries = FeedEntry.objects.filter(user_id=instance.user_id)
+    if pk_set is not None:
+        entries = entries.filter(author_id__in=pk_set)
+    entries.delete()
+    if action == 'post_remove':
+        FeedEntry.objects.backfill_followers(_back_at_limit(instance))
+
+
+def _back_at_limit(profile):
+    # the authors the profile just unfollowed who are no longer merged
+    # in at read time; count_followers in profiles/models.py has already
+    # counted the unfollows
+    return Profile.objects.filter(
+        user_id__in=profile._unfollowed,
+        follower_count=FEED_FANOUT_LIMIT).values_list('user_id', flat=True)
+
+
+post_save.connect(fan_out_article, sender=Article)
+m2m_changed.connect(follow_feed, sender=Profile.is_following.through)
@@ -0,0 +1,106 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.articles.models import Article
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+from authors.apps.profiles.models import Profile
+
+from ..models import FeedEntry
+
+
+class FollowingFeedTest(APITestCase):
+    """
+        GET /api/v1/articles/feed/
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("feed:feed")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.writer = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.star = User.objects.create_user(
+            "star", "star@mail.com", "Star@2540")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                                JWTokens.create_token(self, user=self.reader))
+        self.publish(self.writer, "old")
+
+    def publish(self, author, slug):
+        return Article.objects.create(
+            title=slug, body="Lorem ipsum", slug=slug, author=author)
+
+    def slugs(self, response):
+        return [article['slug'] for article in response.data['results']]
+
+    def test_follower_counts(self):
+        self.reader.profiles.follow(self.writer)
+        self.star.profiles.follow(self.writer)
+        self.reader.profiles.unfollow(self.writer)
+        self.reader.profiles.unfollow(self.star)
+        self.assertEqual(Profile.objects.get(
+            user=self.writer).follower_count, 1)
+
+    def test_follow_backfills_and_publishing_fans_out(self):
+        self.reader.profiles.follow(self.writer)
+        self.publish(self.writer, "new")
+        self.publish(self.star, "unfollowed")
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.slugs(response), ["new", "old"])
+
+    def test_unfollow_empties_the_feed(self):
+        self.reader.profiles.follow(self.writer)
+        self.reader.profiles.unfollow(self.writer)
+        self.assertFalse(FeedEntry.objects.filter(user=self.reader).exists())
+        self.assertEqual(self.slugs(self.client.get(self.url)), [])
+
+    @mock.patch('authors.apps.feed.views.FEED_FANOUT_LIMIT', 0)
+    @mock.patch('authors.apps.feed.models.FEED_FANOUT_LIMIT', 0)
+    def test_popular_authors_are_merged_on_read(self):
+        self.reader.profiles.follow(self.star)
+        self.reader.profiles.follow(self.writer)
+        self.publish(self.star, "star-post")
+        self.publish(self.writer, "writer-post")
+        self.assertFalse(FeedEntry.objects.exists())
+        self.assertEqual(self.slugs(self.client.get(self.url)),
+                         ["writer-post", "star-post", "old"])
+
+    @mock.patch('authors.apps.feed.views.FEED_FANOUT_LIMIT', 1)
+    @mock.patch('authors.apps.feed.models.FEED_FANOUT_LIMIT', 1)
+    def test_pages_walk_both_sources(self):
+        self.reader.profiles.follow(self.writer)
+        self.reader.profiles.follow(self.star)
+        self.writer.profiles.follow(self.star)
+        for i in range(3):
+            self.publish(self.writer, "writer-{}".format(i))
+            self.publish(self.star, "star-{}".format(i))
+        first = self.client.get(self.url, {"page_size": 4})
+        self.assertEqual(self.slugs(first), [
+            "star-2", "writer-2", "star-1", "writer-1"])
+        second = self.client.get(first.data['next'])
+        self.assertEqual(self.slugs(second),
+                         ["star-0", "writer-0", "old"])
+        self.assertIsNone(second.data['next'])
+        back = self.client.get(second.data['previous'])
+        self.assertEqual(self.slugs(back), self.slugs(first))
+
+    @mock.patch('authors.apps.feed.views.FEED_FANOUT_LIMIT', 1)
+    @mock.patch('authors.apps.feed.models.FEED_FANOUT_LIMIT', 1)
+    def test_authors_back_at_the_limit_are_fanned_out(self):
+        self.writer.profiles.follow(self.star)
+        self.reader.profiles.follow(self.star)
+        self.publish(self.star, "star-post")
+        self.assertFalse(FeedEntry.objects.exists())
+        self.writer.profiles.unfollow(self.star)
+        self.assertEqual(list(FeedEntry.objects.values_list(
+            'user__username', 'article__slug')), [("reader", "star-post")])
+        self.assertEqual(self.slugs(self.client.get(self.url)),
+                         ["star-post"])
+
+    def test_feed_requires_login(self):
+        self.client.credentials()
+        self.assertEqual(self.client.get(self.url).status_code, 401)
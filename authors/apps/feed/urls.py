@@ -0,0 +1,9 @@
+from django.urls import path
+
+from .views import FollowingFeedView
+
+app_name = "feed"
+
+urlpatterns = [
+    path('articles/feed/', FollowingFeedView.as_view(), name="feed"),
+]
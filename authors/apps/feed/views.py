@@ -0,0 +1,39 @@
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+
+from authors.apps.articles.models import Article
+from authors.apps.articles.serializers import ArticleSummarySerializer
+from authors.apps.authentication.models import User
+from authors.apps.core.fieldsets import Fieldset
+from authors.apps.core.pagination import MergedFeedPagination
+
+from .models import FEED_FANOUT_LIMIT, FeedEntry
+
+
+class FollowingFeedView(generics.ListAPIView):
+    """
+        Articles by the authors the user follows, newest first
+    """
+    permission_classes = (IsAuthenticated,)
+    serializer_class = ArticleSummarySerializer
+
+    def get(self, request):
+        """
+            GET /api/v1/articles/feed/
+        """
+        paginator = MergedFeedPagination()
+        # authors with too many followers are not fanned out on write
+        popular = User.objects.filter(
+            followers__user=request.user,
+            profiles__follower_count__gt=FEED_FANOUT_LIMIT)
+        pks = paginator.paginate_sources([
+            (FeedEntry.objects.filter(user=request.user), 'article_id'),
+            (Article.objects.filter(author__in=popular), 'id'),
+        ], request)
+        fieldset = Fieldset.from_request(request)
+        articles = Article.objects.with_engagement(
+            request.user, fieldset).in_bulk(pks)
+        serializer = self.serializer_class(
+            [articles[pk] for pk in pks if pk in articles],
+            context={'request': request, 'fieldset': fieldset}, many=True)
+        return paginator.get_paginated_response(serializer.data)
@@ -0,0 +1,6 @@
+from django.contrib import admin
+
+from authors.apps.jobs import models
+
+# failed jobs are kept here with the traceback of their last attempt
+admin.site.register(models.Job)
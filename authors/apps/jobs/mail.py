@@ -0,0 +1,125 @@
+"""
+    Email sent by the workers instead of the request.
+
+    The SMTP session (connect, STARTTLS, login) costs more than sending a
+    message over it, so a worker keeps one email connection open for as
+    long as it runs and sends every email job of a claimed batch over it.
+    A connection the server dropped is reopened once before the message
+    is given back to the queue to retry.
+"""
+import smtplib
+import time
+from collections import deque, namedtuple
+
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+
+from .models import Job
+
+# what one call to Mailer.send did
+Batch = namedtuple('Batch', ('sent', 'failed', 'connects', 'seconds'))
+
+
+def send_mail(subject, message, from_email, recipient_list,
+              html_message=None):
+    """
+        Queue an email. Takes the arguments of django.core.mail.send_mail.
+    """
+    return Job.objects.enqueue(
+        deliver, subject=subject, message=message, from_email=from_email,
+        recipient_list=list(recipient_list), html_message=html_message)
+
+
+def email(subject, message, from_email, recipient_list, html_message=None):
+    """
+        The message django.core.mail.send_mail would send
+    """
+    message = EmailMultiAlternatives(
+        subject, message, from_email, recipient_list)
+    if html_message:
+        message.attach_alternative(html_message, 'text/html')
+    return message
+
+
+class Mailer:
+    """
+        Sends emails over one long lived connection of the configured
+        email backend
+    """
+
+    def __init__(self, history=100):
+        self.connection = None
+        # the latest batches, newest last
+        self.batches = deque(maxlen=history)
+        # called with every Batch once it is sent
+        self.on_batch = None
+
+    def connect(self):
+        if self.connection is None:
+            self.connection = mail.get_connection(fail_silently=False)
+        self.connection.open()
+
+    def close(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.connection = None
+
+    def send(self, messages):
+        """
+            Send the messages in order and return the error each of them
+            raised, or None for the ones that were sent
+        """
+        start, connects, errors = time.perf_counter(), 0, []
+        for message in messages:
+            error = None
+            for attempt in range(2):
+                try:
+                    if self.connection is None or attempt:
+                        self.close()
+                        self.connect()
+                        connects += 1
+                    self.connection.send_messages([message])
+                    error = None
+                    break
+                except smtplib.SMTPServerDisconnected as lost:
+                    # the server dropped the session; reconnect once
+                    error = lost
+                except smtplib.SMTPException as refused:
+                    error = refused
+                    break
+                except OSError as lost:
+                    error = lost
+            errors.append(error)
+        failed = sum(error is not None for error in errors)
+        batch = Batch(len(errors) - failed, failed, connects,
+                      time.perf_counter() - start)
+        self.batches.append(batch)
+        if self.on_batch is not None:
+            self.on_batch(batch)
+        return errors
+
+
+mailer = Mailer()
+
+
+def deliver(**kwargs):
+    """
+        Send a queued email, raising when it cannot be sent so that it
+        is retried
+    """
+    error, = deliver_many([kwargs])
+    if error is not None:
+        raise error
+
+
+def deliver_many(payloads):
+    """
+        Send many queued emails over the worker's connection
+    """
+    return mailer.send([email(**payload) for payload in payloads])
+
+
+deliver.many = deliver_many
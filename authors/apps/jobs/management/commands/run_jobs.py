@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.jobs import worker
+from authors.apps.jobs.mail import mailer
+
+
+class Command(BaseCommand):
+    """
+        Run queued jobs. Start as many workers as needed; they never
+        claim the same job. With --once the worker exits as soon as no
+        job is due, which suits running it from cron. At verbosity 2 the
+        timing of every batch of emails is written out.
+    """
+    help = "Run queued background jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=10,
+            help="Number of jobs claimed at a time")
+        parser.add_argument(
+            '--sleep', type=float, default=1.0,
+            help="Seconds to wait when no job is due")
+        parser.add_argument(
+            '--once', action='store_true',
+            help="Exit when no job is due")
+
+    def report(self, batch):
+        self.stdout.write(
+            "Sent {} emails, {} failed, {} connections, {:.1f} ms".format(
+                batch.sent, batch.failed, batch.connects,
+                batch.seconds * 1000))
+
+    def handle(self, *args, **options):
+        if options['verbosity'] > 1:
+            mailer.on_batch = self.report
+        try:
+            succeeded, failed = worker.work(
+                worker.name(), options['batch_size'], options['sleep'],
+                options['once'])
+        except KeyboardInterrupt:
+            return
+        finally:
+            mailer.close()
+            mailer.on_batch = None
+        self.stdout.write("Ran {} jobs, {} failed".format(
+            succeeded + failed, failed))
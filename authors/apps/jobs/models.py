@@ -0,0 +1,125 @@
+"""
+    A job queue kept in the database, so slow side effects such as
+    sending email can leave the request without an outside broker.
+
+    A job names a module level function by its dotted path and stores the
+    keyword arguments to call it with as JSON. Workers (`manage.py
+    run_jobs`) claim due jobs, run them and delete the ones that succeed.
+    A job that raises is retried with exponential backoff until it has
+    run JOB_MAX_ATTEMPTS times, then kept as failed for inspection.
+"""
+import json
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+JOB_MAX_ATTEMPTS = getattr(settings, 'JOB_MAX_ATTEMPTS', 5)
+# seconds before the first retry, doubled on every further attempt
+JOB_RETRY_DELAY = getattr(settings, 'JOB_RETRY_DELAY', 30)
+JOB_MAX_RETRY_DELAY = getattr(settings, 'JOB_MAX_RETRY_DELAY', 3600)
+# seconds after which a job claimed by a worker that died is run again
+JOB_LOCK_TIMEOUT = getattr(settings, 'JOB_LOCK_TIMEOUT', 600)
+
+
+class JobQuerySet(models.QuerySet):
+    """
+        Enqueueing and claiming of jobs
+    """
+
+    def enqueue(self, task, delay=0, **kwargs):
+        """
+            Queue a call to task, a function or its dotted path, with the
+            given keyword arguments, to run in delay seconds
+        """
+        if callable(task):
+            task = '{}.{}'.format(task.__module__, task.__qualname__)
+        return self.create(
+            task=task, payload=json.dumps(kwargs, cls=DjangoJSONEncoder),
+            run_at=timezone.now() + timedelta(seconds=delay))
+
+    def due(self):
+        """
+            Jobs ready to run and jobs whose worker stopped answering
+        """
+        now = timezone.now()
+        return self.filter(
+            Q(status=Job.QUEUED, run_at__lte=now) |
+            Q(status=Job.RUNNING,
+              locked_at__lt=now - timedelta(seconds=JOB_LOCK_TIMEOUT))
+        ).order_by('run_at', 'id')
+
+    def claim(self, worker, limit=10):
+        """
+            Lock up to limit due jobs for worker and return them
+        """
+        claimed = {'status': Job.RUNNING, 'locked_by': worker,
+                   'locked_at': timezone.now(), 'attempts': F('attempts') + 1}
+        if connections[self.db].features.has_select_for_update_skip_locked:
+            # rows locked by another worker's claim are passed over
+            # instead of waited on
+            with transaction.atomic(using=self.db):
+                pks = list(self.due().select_for_update(
+                    skip_locked=True).values_list('pk', flat=True)[:limit])
+                self.filter(pk__in=pks).update(**claimed)
+        else:
+            # sqlite runs one writer at a time, so only one worker's
+            # update can still find the job as it was read
+            pks = [pk for pk, status, locked_at in self.due().values_list(
+                'pk', 'status', 'locked_at')[:limit]
+                if self.filter(pk=pk, status=status,
+                               locked_at=locked_at).update(**claimed)]
+        return list(self.filter(pk__in=pks).order_by('run_at', 'id'))
+
+
+class Job(models.Model):
+    """
+        A call to a function to be made by a worker
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUSES = ((QUEUED, 'Queued'), (RUNNING, 'Running'), (FAILED, 'Failed'))
+
+    task = models.CharField(max_length=255)
+    payload = models.TextField(default='{}')
+    status = models.CharField(
+        max_length=10, choices=STATUSES, default=QUEUED)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = JobQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # serves JobQuerySet.due
+            models.Index(fields=['status', 'run_at'], name='job_due_idx'),
+        ]
+
+    def __str__(self):
+        return '{} ({})'.format(self.task, self.status)
+
+    def retry(self, error):
+        """
+            Record the error of the last attempt and run the job again
+            after a backoff, or give up after JOB_MAX_ATTEMPTS attempts
+        """
+        self.last_error = ''.join(traceback.format_exception(
+            type(error), error, error.__traceback__))
+        self.locked_by, self.locked_at = '', None
+        if self.attempts >= JOB_MAX_ATTEMPTS:
+            self.status = self.FAILED
+        else:
+            self.status = self.QUEUED
+            self.run_at = timezone.now() + timedelta(seconds=min(
+                JOB_RETRY_DELAY * 2 ** (self.attempts - 1),
+                JOB_MAX_RETRY_DELAY))
+        self.save()
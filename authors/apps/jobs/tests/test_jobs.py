@@ -0,0 +1,78 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from ..models import JOB_MAX_ATTEMPTS, Job
+from ..worker import run
+
+calls = []
+
+
+def record(**kwargs):
+    calls.append(kwargs)
+
+
+def explode(**kwargs):
+    raise ConnectionError("SMTP server went away")
+
+
+class JobQueueTest(APITestCase):
+    """
+        Job enqueueing, claiming, retries and the run_jobs command
+    """
+
+    def setUp(self):
+        calls.clear()
+
+    def run_jobs(self):
+        out = StringIO()
+        call_command('run_jobs', '--once', stdout=out)
+        return out.getvalue()
+
+    def test_worker_runs_and_deletes_jobs(self):
+        Job.objects.enqueue(record, greeting="hello")
+        self.assertIn("Ran 1 jobs, 0 failed", self.run_jobs())
+        self.assertEqual(calls, [{'greeting': "hello"}])
+        self.assertFalse(Job.objects.exists())
+
+    def test_jobs_are_claimed_once(self):
+        Job.objects.enqueue(record)
+        self.assertEqual(len(Job.objects.claim("one")), 1)
+        self.assertEqual(Job.objects.claim("two"), [])
+
+    def test_abandoned_jobs_are_claimed_again(self):
+        Job.objects.enqueue(record)
+        Job.objects.claim("dead")
+        Job.objects.update(locked_at=timezone.now() - timedelta(days=1))
+        job, = Job.objects.claim("alive")
+        self.assertEqual((job.locked_by, job.attempts), ("alive", 2))
+
+    def test_failures_back_off_then_give_up(self):
+        Job.objects.enqueue(explode)
+        job, = Job.objects.claim("worker")
+        self.assertEqual(run([job]), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertIn("SMTP server went away", job.last_error)
+        self.assertGreater(job.run_at, timezone.now())
+        self.assertEqual(Job.objects.claim("worker"), [])
+
+        Job.objects.update(attempts=JOB_MAX_ATTEMPTS - 1,
+                           run_at=timezone.now())
+        self.assertIn("Ran 1 jobs, 1 failed", self.run_jobs())
+        self.assertEqual(Job.objects.get().status, Job.FAILED)
+
+    def test_registration_queues_the_verification_email(self):
+        response = APIClient().post(reverse("auth:register"), {
+            "user": {"username": "writer", "email": "writer@mail.com",
+                     "password": "Writer@254"}}, format="json")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(mail.outbox), 0)
+        self.run_jobs()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["writer@mail.com"])
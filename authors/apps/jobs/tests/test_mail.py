@@ -0,0 +1,138 @@
+import asyncore
+import smtpd
+import smtplib
+import threading
+from io import StringIO
+
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from ..mail import mailer, send_mail
+from ..models import Job
+
+
+class CountingBackend(locmem.EmailBackend):
+    """
+        The locmem backend, counting the connections it opens and
+        dropping the first one when a test asks it to
+    """
+    opened = 0
+    drop = False
+
+    def open(self):
+        CountingBackend.opened += 1
+
+    def send_messages(self, messages):
+        if CountingBackend.drop:
+            CountingBackend.drop = False
+            raise smtplib.SMTPServerDisconnected("Connection closed")
+        if any('nobody@mail.com' in message.to for message in messages):
+            raise smtplib.SMTPRecipientsRefused({"nobody": (550, b"")})
+        return super().send_messages(messages)
+
+
+class SinkServer(smtpd.SMTPServer):
+    """
+        SMTP server keeping the messages it receives and counting the
+        sessions it accepts
+    """
+
+    def __init__(self):
+        self.map, self.messages, self.sessions = {}, [], 0
+        super().__init__(('127.0.0.1', 0), None, map=self.map,
+                         decode_data=True)
+        self.running = True
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.start()
+
+    @property
+    def port(self):
+        return self.socket.getsockname()[1]
+
+    def serve(self):
+        while self.running:
+            asyncore.loop(timeout=0.05, count=1, map=self.map)
+
+    def handle_accepted(self, conn, addr):
+        self.sessions += 1
+        smtpd.SMTPChannel(self, conn, addr, map=self.map, decode_data=True)
+
+    def process_message(self, peer, mailfrom, rcpttos, data, **kwargs):
+        self.messages.append(rcpttos)
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+        asyncore.close_all(map=self.map)
+
+
+@override_settings(
+    EMAIL_BACKEND='authors.apps.jobs.tests.test_mail.CountingBackend')
+class MailBatchTest(TestCase):
+    """
+        Queued email is sent in batches over one connection
+    """
+
+    def setUp(self):
+        CountingBackend.opened, CountingBackend.drop = 0, False
+
+    def queue(self, *recipients):
+        for recipient in recipients:
+            send_mail("Hello", "Hello", "haven@mail.com", [recipient],
+                      html_message="<p>Hello</p>")
+
+    def run_jobs(self):
+        out = StringIO()
+        call_command('run_jobs', '--once', verbosity=2, stdout=out)
+        return out.getvalue()
+
+    def test_batch_shares_one_connection(self):
+        self.queue("a@mail.com", "b@mail.com", "c@mail.com")
+        self.assertIn("Sent 3 emails, 0 failed, 1 connections",
+                      self.run_jobs())
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual([message.to for message in mail.outbox],
+                         [["a@mail.com"], ["b@mail.com"], ["c@mail.com"]])
+        self.assertEqual(mail.outbox[0].alternatives,
+                         [("<p>Hello</p>", "text/html")])
+
+    def test_dropped_connection_is_reopened(self):
+        self.queue("a@mail.com", "b@mail.com")
+        CountingBackend.drop = True
+        self.assertIn("Sent 2 emails, 0 failed, 2 connections",
+                      self.run_jobs())
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertFalse(Job.objects.exists())
+
+    def test_refused_message_is_retried_alone(self):
+        self.queue("a@mail.com", "nobody@mail.com", "b@mail.com")
+        self.assertIn("Ran 3 jobs, 1 failed", self.run_jobs())
+        self.assertEqual(len(mail.outbox), 2)
+        job = Job.objects.get()
+        self.assertEqual(job.status, Job.QUEUED)
+        self.assertIn("SMTPRecipientsRefused", job.last_error)
+
+
+class SMTPBatchTest(TestCase):
+    """
+        The batching against a local SMTP server
+    """
+
+    def setUp(self):
+        self.server = SinkServer()
+        self.addCleanup(self.server.stop)
+
+    def test_one_session_per_batch(self):
+        for recipient in ("a@mail.com", "b@mail.com", "c@mail.com"):
+            send_mail("Hello", "Hello", "haven@mail.com", [recipient])
+        with self.settings(
+                EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+                EMAIL_HOST='127.0.0.1', EMAIL_PORT=self.server.port,
+                EMAIL_USE_TLS=False, EMAIL_HOST_PASSWORD=''):
+            call_command('run_jobs', '--once', stdout=StringIO())
+        self.assertIsNone(mailer.connection)
+        self.assertEqual(self.server.messages, [
+            ["a@mail.com"], ["b@mail.com"], ["c@mail.com"]])
+        self.assertEqual(self.server.sessions, 1)
@@ -0,0 +1,84 @@
+"""
+    Running claimed jobs.
+
+    A task may have a batched form, set as its `many` attribute, that
+    takes the payloads of several jobs and returns the error each of them
+    raised or None. The claimed jobs of such a task run in one call.
+"""
+import json
+import os
+import socket
+import time
+from collections import OrderedDict
+
+from django.utils.module_loading import import_string
+
+from .models import Job
+
+
+def name():
+    """
+        Identifies this worker process in the locks it takes
+    """
+    return '{}:{}'.format(socket.gethostname(), os.getpid())
+
+
+def call(task, job):
+    try:
+        task(**json.loads(job.payload))
+    except Exception as error:
+        return error
+
+
+def run(jobs):
+    """
+        Run claimed jobs. Jobs that succeed are deleted and jobs that
+        raise are retried later. Returns the number of jobs that failed.
+    """
+    tasks = OrderedDict()
+    for job in jobs:
+        tasks.setdefault(job.task, []).append(job)
+    failed = 0
+    for path, group in tasks.items():
+        try:
+            task = import_string(path)
+        except ImportError as error:
+            errors = [error] * len(group)
+        else:
+            many = getattr(task, 'many', None)
+            if many is not None and len(group) > 1:
+                try:
+                    errors = many(
+                        [json.loads(job.payload) for job in group])
+                except Exception as error:
+                    errors = [error] * len(group)
+            else:
+                errors = [call(task, job) for job in group]
+        done = []
+        for job, error in zip(group, errors):
+            if error is None:
+                done.append(job.pk)
+            else:
+                job.retry(error)
+                failed += 1
+        Job.objects.filter(pk__in=done).delete()
+    return failed
+
+
+def work(worker, batch_size=10, sleep=1.0, once=False):
+    """
+        Claim and run jobs until interrupted, or until no job is due
+        when once is set. Returns the number of jobs that succeeded and
+        failed.
+    """
+    succeeded = failed = 0
+    while True:
+        jobs = Job.objects.claim(worker, batch_size)
+        if jobs:
+            errors = run(jobs)
+            succeeded += len(jobs) - errors
+            failed += errors
+        elif once:
+            return succeeded, failed
+        else:
+            time.sleep(sleep)
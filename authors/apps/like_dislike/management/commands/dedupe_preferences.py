@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Max
+
+from authors.apps.like_dislike.models import LikeDislike
+
+
+class Command(BaseCommand):
+    """
+        Keep one like or dislike per user and item. Run it before
+        migrating an existing database to the unique index on LikeDislike
+        (content_type, object_id, user); the latest preference of each
+        user is kept. Run `manage.py reconcile_counters` after migrating
+        to fix the like counters of the articles.
+    """
+    help = "Remove duplicated likes and dislikes"
+
+    def handle(self, *args, **options):
+        duplicated = LikeDislike.objects.values(
+            'content_type', 'object_id', 'user').annotate(
+                total=Count('pk'), keep=Max('pk')).filter(total__gt=1)
+        removed = 0
+        for item in duplicated:
+            with transaction.atomic():
+                removed += LikeDislike.objects.filter(
+                    content_type=item['content_type'],
+                    object_id=item['object_id'], user=item['user']).exclude(
+                        pk=item['keep']).delete()[0]
+        self.stdout.write(
+            "Removed {} duplicated likes and dislikes".format(removed))
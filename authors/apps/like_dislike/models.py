@@ -51,3 +51,7 @@ class LikeDislike(models.Model):
     content_object = GenericForeignKey()
 
     objects = LikeDislikeManager()
+
+    class Meta:
+        # one preference per user and item, looked up by item first
+        unique_together = ('content_type', 'object_id', 'user')
@@ -1,6 +1,5 @@
-import json
-
-from rest_framework.renderers import JSONRenderer
+from authors.apps.core import codec
+from authors.apps.core.renderers import JSONRenderer
 
 
 class LikeDislikeJSONRenderer(JSONRenderer):
@@ -14,6 +13,6 @@ class LikeDislikeJSONRenderer(JSONRenderer):
             return super(LikeDislikeJSONRenderer, self).render(data)
 
         # Finally, we can render our data under the "message" namespace.
-        return json.dumps({
+        return codec.dumps({
             'message': data
         })
@@ -1,3 +1,5 @@
+from unittest import mock
+
 from ..messages import success, statusmessage
 from django.urls import reverse
 from rest_framework.test import APIClient, APITestCase
@@ -8,6 +10,7 @@ from authors.apps.authentication.backends import JWTokens
 from authors.apps.authentication.models import User
 from authors.apps.profiles.models import Profile
 from authors.apps.comments.models import Comments
+from authors.apps.like_dislike.models import LikeDislike
 
 
 class LikeDislikeTest(APITestCase):
@@ -90,6 +93,29 @@ class LikeDislikeTest(APITestCase):
         self.assertEqual(response.data['result'], success['Null'])
         self.assertEqual(response.data['status'], statusmessage['Null'])
 
+    def test_double_submitted_like(self):
+        """
+        Tests a like that another request created between the lookup
+        and the insert.
+
+        The request takes the update path instead of failing.
+        """
+
+        self.client.post(
+            self.like_url, content_type='application/json',
+            HTTP_AUTHORIZATION='Bearer ' + self.token)
+        lookups = [LikeDislike.objects.none(),
+                   LikeDislike.objects.select_for_update()]
+        with mock.patch.object(LikeDislike.objects, 'select_for_update',
+                               side_effect=lookups):
+            response = self.client.post(
+                self.like_url, content_type='application/json',
+                HTTP_AUTHORIZATION='Bearer ' + self.token)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['result'], success['Null'])
+        self.assertEqual(response.data['like_count'], 0)
+        self.assertFalse(self.article.prefs.exists())
+
     def test_un_dislike_article(self):
         """
         Tests undoing a dislike
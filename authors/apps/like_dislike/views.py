@@ -1,6 +1,7 @@
 import json
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import IntegrityError, transaction
 from django.http import HttpResponse
 from django.views import View
 
@@ -49,29 +50,57 @@ class PreferenceView(generics.GenericAPIView):
             item = queryset.get(slug=slug)
         elif self.model is Comments:
             item = queryset.get(pk=pk)
-        try:
-            obj = LikeDislike.objects.get(
-                content_type=ContentType.objects.get_for_model(item),
-                object_id=item.id,
-                user=request.user)
-            if int(obj.pref) != pref_status:
-                obj.pref = pref_status
-                obj.save(update_fields=['pref'])
-                result, like_status = success.get(
-                    self.pref), statusmessage.get(self.pref)
-            else:
-                obj.delete()
-                result, like_status = success.get(
-                    'Null'), statusmessage.get('Null')
-        except LikeDislike.DoesNotExist:
-            item.prefs.create(
-                user=request.user, pref=pref_status)
-            result, like_status = success.get(
-                self.pref), statusmessage.get(self.pref)
+        # counter deltas applied to the article when the preference changes
+        counters = {1: 'like_count', -1: 'dislike_count'}
+        deltas = {}
+        lookup = {
+            'content_type': ContentType.objects.get_for_model(item),
+            'object_id': item.id,
+            'user': request.user,
+        }
+        with transaction.atomic():
+            # locked so that concurrent requests of the user take turns
+            obj = LikeDislike.objects.select_for_update().filter(
+                **lookup).first()
+            if obj is None:
+                try:
+                    with transaction.atomic():
+                        item.prefs.create(
+                            user=request.user, pref=pref_status)
+                except IntegrityError:
+                    # a double submit created it first, change it instead
+                    obj = LikeDislike.objects.select_for_update().get(
+                        **lookup)
+                else:
+                    deltas = {counters[pref_status]: 1}
+                    result, like_status = success.get(
+                        self.pref), statusmessage.get(self.pref)
+            if obj is not None:
+                if int(obj.pref) != pref_status:
+                    deltas = {counters[int(obj.pref)]: -1,
+                              counters[pref_status]: 1}
+                    obj.pref = pref_status
+                    obj.save(update_fields=['pref'])
+                    result, like_status = success.get(
+                        self.pref), statusmessage.get(self.pref)
+                else:
+                    deltas = {counters[pref_status]: -1}
+                    obj.delete()
+                    result, like_status = success.get(
+                        'Null'), statusmessage.get('Null')
+            if self.model is Article:
+                Article.objects.filter(pk=item.pk).update_counters(**deltas)
+
+        if self.model is Article:
+            item.refresh_from_db(fields=Article.COUNTERS)
+            like_count, dislike_count = item.like_count, item.dislike_count
+        else:
+            like_count = item.prefs.count('likes')
+            dislike_count = item.prefs.count('dislikes')
         return Response({
             "result": result,
             "status": like_status,
-            "like_count": item.prefs.count('likes'),
-            "dislike_count": item.prefs.count('dislikes')
+            "like_count": like_count,
+            "dislike_count": dislike_count
         }, status=status.HTTP_201_CREATED
         )
@@ -1,5 +1,6 @@
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_save
 from cloudinary.models import CloudinaryField
 
 # local import
@@ -26,6 +27,8 @@ class Profile(models.Model):
     location = models.CharField(max_length=100, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # number of profiles following this user, kept by count_followers
+    follower_count = models.PositiveIntegerField(default=0, db_index=True)
 
     # returns string representation of object
 
@@ -65,3 +68,33 @@ def create_profile(sender, instance, created, **kwargs):
 
 # this saves the user profile created
 post_save.connect(create_profile, sender=User)
+
+
+def count_followers(sender, instance, action, reverse, pk_set, **kwargs):
+    # keeps Profile.follower_count in step with the follow graph
+    if action in ('pre_remove', 'pre_clear'):
+        # pk_set may name users the profile does not follow
+        follows = sender.objects.filter(
+            **{'user' if reverse else 'profile': instance})
+        if pk_set is not None:
+            follows = follows.filter(
+                **{'profile__in' if reverse else 'user__in': pk_set})
+        instance._unfollowed = list(follows.values_list(
+            'profile_id' if reverse else 'user_id', flat=True))
+        return
+    if action == 'post_add':
+        changed, delta = pk_set, 1
+    elif action in ('post_remove', 'post_clear'):
+        changed, delta = instance._unfollowed, -1
+    else:
+        return
+    if not changed:
+        return
+    followed = Profile.objects.filter(user=instance) if reverse else \
+        Profile.objects.filter(user__in=changed)
+    followed.update(
+        follower_count=F('follower_count') + delta * (
+            len(changed) if reverse else 1))
+
+
+m2m_changed.connect(count_followers, sender=Profile.is_following.through)
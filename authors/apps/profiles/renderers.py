@@ -1,4 +1,4 @@
-import json
+from authors.apps.core import codec
 
 from ..authentication.renderers import UserJSONRenderer
 
@@ -11,7 +11,7 @@ class ProfileJSONRenderer(UserJSONRenderer):
         """
         overide UserJSONRenderer to render our data under the "profile" namespace.
         """
-        return json.dumps({
+        return codec.dumps({
             'profile': data
         })
         
\ No newline at end of file
@@ -2,10 +2,12 @@ from rest_framework import serializers
 from rest_framework.response import Response
 from rest_framework.views import status
 
+from authors.apps.core.fieldsets import SparseFieldsMixin
+
 from .models import Profile
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """ 
      Here we serialize the data 
      helps convert queryset into datatypes so that we can render them as json
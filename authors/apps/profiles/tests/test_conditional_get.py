@@ -0,0 +1,46 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+
+@override_settings(ARTICLE_CACHE_ENABLED=True)
+class ProfileConditionalGetTest(APITestCase):
+    """
+        GET /api/v1/profiles/<username>/ answers revalidation with 304
+        until the profile or the reader's follows change
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.writer = User.objects.create_user(
+            "writer", "writer@mail.com", "Writer@254")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.url = reverse("prof:profile", kwargs={"username": "writer"})
+        token = JWTokens.create_token(self, user=self.reader)
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + token)
+
+    def revalidate(self, response):
+        return self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def test_not_modified(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.revalidate(response).status_code, 304)
+
+    def test_profile_update_changes_etag(self):
+        response = self.client.get(self.url)
+        profile = self.writer.profiles
+        profile.bio = "Writes things"
+        profile.save()
+        self.assertEqual(self.revalidate(response).status_code, 200)
+
+    def test_following_changes_etag(self):
+        response = self.client.get(self.url)
+        self.reader.profiles.follow(self.writer)
+        self.assertEqual(self.revalidate(response).status_code, 200)
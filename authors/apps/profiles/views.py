@@ -7,7 +7,28 @@ from rest_framework.views import status
 from .models import Profile
 from .serializers import UserProfileSerializer, UpdateUserProfileSerializer
 from .renderers import ProfileJSONRenderer
+from authors.apps.articles import cache as article_cache
 from authors.apps.authentication.messages import error_msg, success_msg
+from authors.apps.core.conditional import conditional, resource_state
+from authors.apps.core.fieldsets import Fieldset
+
+
+def profile_state(view, request, username, **kwargs):
+    if not article_cache.enabled():
+        return None
+    profile = Profile.objects.filter(user__username=username).values_list(
+        'user_id', 'updated_at').first()
+    if profile is None:
+        return None
+    user_id, updated_at = profile
+    # the reader's own follows decide the `following` flag
+    versions = [article_cache.author_version(user_id)]
+    if request.user.is_authenticated:
+        versions.append(article_cache.author_version(request.user.pk))
+    return resource_state(
+        'profile', request.get_full_path(), request.user.pk, *versions,
+        modified=[updated_at] + [
+            article_cache.version_time(v) for v in versions])
 
 
 class UserProfileView(RetrieveAPIView):
@@ -29,9 +50,11 @@ class UserProfileView(RetrieveAPIView):
 
             raise NotFound(error_msg['profile_not_there'])
 
+    @conditional(profile_state)
     def retrieve(self, request, **kwargs):
         data = self.get_queryset()
-        serializer = self.serializer_class(data, context={'request': request})
+        serializer = self.serializer_class(data, context={
+            'request': request, 'fieldset': Fieldset.from_request(request)})
 
         return Response((serializer.data,
                          {"message": success_msg['profil_success']}),
@@ -51,8 +74,10 @@ class AuthorsProfileListAPIView(ListAPIView):
     def get(self, request, *args, **kwargs):
         # here  we filter
         # we filter so that the user doesnot see his profile in the list
-        data = Profile.objects.all().exclude(user=self.request.user)
-        serializer = self.serializer_class(data, many=True)
+        data = Profile.objects.select_related('user').exclude(
+            user=self.request.user)
+        serializer = self.serializer_class(data, many=True, context={
+            'fieldset': Fieldset.from_request(request)})
         return Response((serializer.data,
                          {"message": success_msg['profil_success']}),
                         status=status.HTTP_200_OK)
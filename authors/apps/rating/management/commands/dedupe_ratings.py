@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Max
+
+from authors.apps.rating.models import Rating
+
+
+class Command(BaseCommand):
+    """
+        Keep one rating per user and article. Run it before migrating an
+        existing database to the unique index on Rating (user, article);
+        the latest rating of each pair is kept. Run `manage.py
+        reconcile_counters` after migrating to fix the rating counters of
+        the articles.
+    """
+    help = "Remove duplicated ratings"
+
+    def handle(self, *args, **options):
+        duplicated = Rating.objects.values('user', 'article').annotate(
+            total=Count('pk'), keep=Max('pk')).filter(total__gt=1)
+        removed = 0
+        for pair in duplicated:
+            with transaction.atomic():
+                removed += Rating.objects.filter(
+                    user=pair['user'], article=pair['article']).exclude(
+                        pk=pair['keep']).delete()[0]
+        self.stdout.write("Removed {} duplicated ratings".format(removed))
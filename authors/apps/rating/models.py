@@ -19,3 +19,7 @@ class Rating(models.Model):
     )
 
     your_rating = models.FloatField(null=False)
+
+    class Meta:
+        # one rating per reader; also serves the rating lookups by reader
+        unique_together = ('user', 'article')
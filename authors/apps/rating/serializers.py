@@ -2,7 +2,6 @@ from rest_framework import serializers
 from .messages import error_msg
 from django.core.validators import MinValueValidator, MaxValueValidator
 from .models import Rating
-from django.db.models import Avg
 
 
 class RatingSerializer(serializers.ModelSerializer):
@@ -35,9 +34,7 @@ class RatingSerializer(serializers.ModelSerializer):
         """
             Returns rating average
         """
-        average = Rating.objects.filter(
-            article=obj.article.id).aggregate(Avg('your_rating'))
-        return average['your_rating__avg']
+        return obj.article.average_rating
 
     def get_article(self, obj):
         """
@@ -49,9 +46,7 @@ class RatingSerializer(serializers.ModelSerializer):
         """
             Gets article rate count
         """
-        count = Rating.objects.filter(
-            article=obj.article.id).count()
-        return count
+        return obj.article.rating_count
 
     class Meta:
         model = Rating
@@ -12,7 +12,7 @@ from rest_framework.response import Response
 from .messages import error_msg, success_msg
 from django.shortcuts import get_object_or_404
 from rest_framework import serializers, status
-from django.db.models import Avg
+from django.db import transaction
 
 
 class RatingAPIView(GenericAPIView):
@@ -53,20 +53,31 @@ class RatingAPIView(GenericAPIView):
             raise ValidationError(
                 detail={'message': error_msg['own_rating']})
 
-        # updates a user's rating if it already exists
-        try:
-            # Update Rating if Exists
-            current_rating = Rating.objects.get(
-                user=request.user.id,
-                article=article.id
-            )
-            serializer = self.serializer_class(current_rating, data=rating)
-        except Rating.DoesNotExist:
-            #  Create rating if not founds
-            serializer = self.serializer_class(data=rating)
-
-        serializer.is_valid(raise_exception=True)
-        serializer.save(user=request.user, article=article)
+        with transaction.atomic():
+            # updates a user's rating if it already exists
+            try:
+                # Update Rating if Exists
+                current_rating = Rating.objects.get(
+                    user=request.user.id,
+                    article=article.id
+                )
+                previous = current_rating.your_rating
+                serializer = self.serializer_class(
+                    current_rating, data=rating)
+            except Rating.DoesNotExist:
+                #  Create rating if not founds
+                previous = None
+                serializer = self.serializer_class(data=rating)
+
+            serializer.is_valid(raise_exception=True)
+            saved = serializer.save(user=request.user, article=article)
+            if previous is None:
+                Article.objects.filter(pk=article.pk).update_counters(
+                    rating_sum=saved.your_rating, rating_count=1)
+            else:
+                Article.objects.filter(pk=article.pk).update_counters(
+                    rating_sum=saved.your_rating - previous)
+        article.refresh_from_db(fields=Article.COUNTERS)
 
         return Response({
             'message': success_msg['rate_success'],
@@ -92,15 +103,8 @@ class RatingAPIView(GenericAPIView):
                 pass
 
         if rating is None:
-            avg = Rating.objects.filter(
-                article=article).aggregate(Avg('your_rating'))
-
-            average = avg['your_rating__avg']
-            count = Rating.objects.filter(
-                article=article.id).count()
-
-            if avg['your_rating__avg'] is None:
-                average = 0
+            average = article.average_rating
+            count = article.rating_count
 
             if request.user.is_authenticated:
                 return Response({
@@ -138,7 +142,10 @@ class RatingAPIView(GenericAPIView):
             elif article.author != request.user:
                 # get user rating and delete
                 rating = self.get_rating(user=request.user, article=article)
-                rating.delete()
+                with transaction.atomic():
+                    rating.delete()
+                    Article.objects.filter(pk=article.pk).update_counters(
+                        rating_sum=-rating.your_rating, rating_count=-1)
                 return Response(
                     {'message': success_msg['delete_success']},
                     status=status.HTTP_200_OK
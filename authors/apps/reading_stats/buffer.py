@@ -0,0 +1,129 @@
+"""
+    Write-behind buffering of article reads.
+
+    Reading an article records a (user, article) read. Instead of
+    checking for and inserting a ReadStats row on every request, each
+    worker collects the reads in memory and writes them in one batch once
+    READ_BUFFER_SIZE distinct reads are waiting or the oldest has waited
+    READ_BUFFER_SECONDS. Reads already stored are skipped against the
+    unique (user, article) index. A read is only buffered once the
+    transaction of its request commits. Whatever is left is written when
+    the worker exits, and views that list reads flush first so that
+    readers see their own reads.
+"""
+import atexit
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+
+from authors.apps.articles.models import TRENDING_WEIGHTS, Article
+from authors.apps.authentication.models import User
+
+from .models import ReadStats
+
+BUFFER_SIZE = getattr(settings, 'READ_BUFFER_SIZE', 100)
+BUFFER_SECONDS = getattr(settings, 'READ_BUFFER_SECONDS', 5)
+
+
+def write(reads):
+    """
+        Store the (user_id, article_id) reads that are not stored yet,
+        skipping those of deleted users and articles, and raise the
+        trending score of the articles read as the ReadStats signals
+        would. Returns the number of reads stored.
+    """
+    user_ids = {user_id for user_id, _ in reads}
+    article_ids = {article_id for _, article_id in reads}
+    with transaction.atomic():
+        users = set(User.objects.filter(pk__in=user_ids).values_list(
+            'pk', flat=True))
+        articles = set(Article.objects.filter(
+            pk__in=article_ids).values_list('pk', flat=True))
+        stored = set(ReadStats.objects.filter(
+            user__in=users, article__in=articles).values_list(
+                'user_id', 'article_id'))
+        new = [(user_id, article_id) for user_id, article_id in reads
+               if user_id in users and article_id in articles and
+               (user_id, article_id) not in stored]
+        try:
+            with transaction.atomic():
+                _insert(new)
+        except IntegrityError:
+            # another worker stored some of the same reads meanwhile
+            inserted = []
+            for read in new:
+                try:
+                    with transaction.atomic():
+                        _insert([read])
+                except IntegrityError:
+                    continue
+                inserted.append(read)
+            new = inserted
+        # bulk_create skips the signal that trends each read
+        counts = Counter(article_id for _, article_id in new)
+        by_count = {}
+        for article_id, count in counts.items():
+            by_count.setdefault(count, []).append(article_id)
+        for count, ids in by_count.items():
+            Article.objects.filter(pk__in=ids).bump_trending(
+                TRENDING_WEIGHTS['read'] * count)
+    return len(new)
+
+
+def _insert(reads):
+    ReadStats.objects.bulk_create([
+        ReadStats(user_id=user_id, article_id=article_id, article_read=True)
+        for user_id, article_id in reads])
+
+
+class ReadBuffer:
+    """
+        Thread-safe collection of the reads of one worker, written out in
+        batches by size and age
+    """
+
+    def __init__(self, size=BUFFER_SIZE, seconds=BUFFER_SECONDS):
+        self.size = size
+        self.seconds = seconds
+        self.reads = OrderedDict()
+        self.started = None
+        self.lock = threading.Lock()
+
+    def record(self, user_id, article_id):
+        """
+            Add a read once the current transaction commits
+        """
+        transaction.on_commit(lambda: self.add(user_id, article_id))
+
+    def add(self, user_id, article_id):
+        """
+            Record a read, writing the batch when a threshold is reached
+        """
+        with self.lock:
+            if not self.reads:
+                self.started = time.monotonic()
+            self.reads[user_id, article_id] = None
+            full = len(self.reads) >= self.size or \
+                time.monotonic() - self.started >= self.seconds
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+            Write the waiting reads. Returns the number stored.
+        """
+        with self.lock:
+            reads, self.reads = list(self.reads), OrderedDict()
+        if not reads:
+            return 0
+        return write(reads)
+
+    def __len__(self):
+        return len(self.reads)
+
+
+read_buffer = ReadBuffer()
+atexit.register(read_buffer.flush)
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Max, Min
+
+from authors.apps.reading_stats.models import ReadStats
+
+
+class Command(BaseCommand):
+    """
+        Keep one read per user and article. Run it before migrating an
+        existing database to the unique index on ReadStats (user,
+        article); the oldest read of each pair is kept, marked read if
+        any of the pair was.
+    """
+    help = "Merge duplicated article reads"
+
+    def handle(self, *args, **options):
+        duplicated = ReadStats.objects.values('user', 'article').annotate(
+            total=Count('pk'), keep=Min('pk'),
+            read=Max('article_read')).filter(total__gt=1)
+        removed = 0
+        for pair in duplicated:
+            with transaction.atomic():
+                reads = ReadStats.objects.filter(
+                    user=pair['user'], article=pair['article'])
+                reads.filter(pk=pair['keep']).update(
+                    article_read=bool(pair['read']))
+                removed += reads.exclude(pk=pair['keep']).delete()[0]
+        self.stdout.write("Removed {} duplicated reads".format(removed))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from authors.apps.reading_stats import rollups
+
+
+class Command(BaseCommand):
+    """
+        Add the reads stored since the last run to the daily rollups
+        served by the read stats dashboards. Run it periodically, e.g.
+        from cron every few minutes.
+    """
+    help = "Roll up new article reads into daily totals"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=rollups.BATCH_SIZE,
+            help="Number of reads added per transaction")
+        parser.add_argument(
+            '--lag', type=int, default=rollups.LAG,
+            help="Seconds a read waits before it is rolled up")
+
+    def handle(self, *args, **options):
+        added = rollups.roll_up(options['batch_size'], options['lag'])
+        self.stdout.write("Rolled up {} reads".format(added))
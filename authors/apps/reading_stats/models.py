@@ -16,5 +16,63 @@ class ReadStats(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # one read per reader and article, see buffer.py and
+        # `manage.py dedupe_read_stats`
+        unique_together = ('user', 'article')
+
     def __str__(self):
         return self.article.title
+
+
+class DailyReads(models.Model):
+    """
+        Reads of one day and the minutes they are estimated to have taken
+        from the read time of the articles, rolled up from ReadStats by
+        `manage.py rollup_reads`
+    """
+    day = models.DateField()
+    reads = models.PositiveIntegerField(default=0)
+    minutes = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class DailyUserReads(DailyReads):
+    """
+        Reads per reader and day
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    class Meta:
+        unique_together = ('user', 'day')
+
+
+class DailyArticleReads(DailyReads):
+    """
+        Reads per article and day
+    """
+    article = models.ForeignKey(Article, on_delete=models.CASCADE)
+
+    class Meta:
+        unique_together = ('article', 'day')
+
+
+class DailyAuthorReads(DailyReads):
+    """
+        Reads of an author's articles per day
+    """
+    author = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    class Meta:
+        unique_together = ('author', 'day')
+
+
+class RollupWatermark(models.Model):
+    """
+        The last ReadStats row rolled up into the daily tables
+    """
+    name = models.CharField(max_length=50, unique=True)
+    position = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
@@ -0,0 +1,84 @@
+"""
+    Daily rollups of article reads.
+
+    `manage.py rollup_reads` adds the ReadStats rows stored since its
+    last run to daily totals per reader, per article and per author, so
+    that dashboards read one row per day instead of every read. Its
+    position is the highest ReadStats id rolled up, kept in a
+    RollupWatermark row that is locked while a batch is added. Reads
+    younger than ROLLUP_LAG seconds are left for the next run so that a
+    row committed after a newer one is not skipped. Minutes are
+    estimated from the read time stored on the articles.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import (DailyArticleReads, DailyAuthorReads, DailyUserReads,
+                     ReadStats, RollupWatermark)
+
+WATERMARK = 'daily_reads'
+LAG = getattr(settings, 'ROLLUP_LAG', 60)
+BATCH_SIZE = 5000
+
+# rollup model -> the ReadStats value it is keyed on
+ROLLUPS = (
+    (DailyUserReads, 'user_id', 'user_id'),
+    (DailyArticleReads, 'article_id', 'article_id'),
+    (DailyAuthorReads, 'author_id', 'article__author_id'),
+)
+
+
+def roll_up(batch_size=BATCH_SIZE, lag=LAG):
+    """
+        Add the reads stored since the watermark to the daily rollups,
+        one transaction per batch. Returns the number of reads added.
+    """
+    RollupWatermark.objects.get_or_create(name=WATERMARK)
+    until = timezone.now() - timedelta(seconds=lag)
+    added = 0
+    while True:
+        with transaction.atomic():
+            watermark = RollupWatermark.objects.select_for_update().get(
+                name=WATERMARK)
+            reads = list(ReadStats.objects.filter(
+                pk__gt=watermark.position, created_at__lt=until).order_by(
+                    'pk').values_list(
+                        'pk', 'created_at', 'article__read_time',
+                        *[path for _, _, path in ROLLUPS])[:batch_size])
+            if not reads:
+                return added
+            for index, (model, field, _) in enumerate(ROLLUPS):
+                totals = defaultdict(lambda: [0, 0])
+                for read in reads:
+                    key = (read[3 + index], timezone.localdate(read[1]))
+                    totals[key][0] += 1
+                    totals[key][1] += read[2] // timedelta(minutes=1)
+                _add(model, field, totals)
+            watermark.position = reads[-1][0]
+            watermark.save()
+        added += len(reads)
+
+
+def _add(model, field, totals):
+    """
+        Add {(key, day): [reads, minutes]} to the rows of a rollup model,
+        creating the rows that do not exist yet
+    """
+    rows = model.objects.filter(**{
+        field + '__in': {key for key, _ in totals},
+        'day__in': {day for _, day in totals},
+    }).values_list(field, 'day', 'pk')
+    existing = {(key, day): pk for key, day, pk in rows}
+    for (key, day), (reads, minutes) in totals.items():
+        if (key, day) in existing:
+            model.objects.filter(pk=existing[key, day]).update(
+                reads=F('reads') + reads, minutes=F('minutes') + minutes)
+    model.objects.bulk_create([
+        model(day=day, reads=reads, minutes=minutes, **{field: key})
+        for (key, day), (reads, minutes) in totals.items()
+        if (key, day) not in existing])
@@ -20,3 +20,12 @@ class ReadStatsSerializers(serializers.ModelSerializer):
             "article": stats.article.title,
             "slug": stats.article.slug
         }
+
+
+class DailyReadsSerializer(serializers.Serializer):
+    """
+        One day of a daily reads rollup
+    """
+    day = serializers.DateField()
+    reads = serializers.IntegerField()
+    minutes = serializers.IntegerField()
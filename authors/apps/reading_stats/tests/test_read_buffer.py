@@ -0,0 +1,85 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.articles.models import TRENDING_WEIGHTS, Article
+from authors.apps.articles.view_counts import ViewCounter
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+from ..buffer import ReadBuffer
+from ..models import ReadStats
+
+
+class ReadBufferTest(APITestCase):
+    """
+        Article reads are buffered and written in batches
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                                JWTokens.create_token(self, user=self.reader))
+        self.articles = [Article.objects.create(
+            title="Read {}".format(i), body="Lorem ipsum",
+            slug="read-{}".format(i), author=self.reader) for i in range(3)]
+        self.buffer = ReadBuffer(size=3, seconds=60)
+
+    def stored(self):
+        return set(ReadStats.objects.values_list('user_id', 'article_id'))
+
+    def test_reads_are_written_when_the_buffer_fills(self):
+        first, second, third = self.articles
+        self.buffer.add(self.reader.pk, first.pk)
+        self.buffer.add(self.reader.pk, first.pk)
+        self.buffer.add(self.reader.pk, second.pk)
+        self.assertEqual(len(self.buffer), 2)
+        self.assertEqual(self.stored(), set())
+        self.buffer.add(self.reader.pk, third.pk)
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(self.stored(), {(self.reader.pk, article.pk)
+                                         for article in self.articles})
+        first.refresh_from_db()
+        self.assertEqual(first.trending_score, TRENDING_WEIGHTS['read'])
+
+    def test_reads_are_written_when_the_oldest_is_due(self):
+        with mock.patch('authors.apps.reading_stats.buffer.time') as clock:
+            clock.monotonic.return_value = 100
+            self.buffer.add(self.reader.pk, self.articles[0].pk)
+            clock.monotonic.return_value = 161
+            self.buffer.add(self.reader.pk, self.articles[1].pk)
+        self.assertEqual(len(self.stored()), 2)
+
+    def test_stored_and_deleted_reads_are_skipped(self):
+        ReadStats.objects.create(user=self.reader, article=self.articles[0],
+                                 article_read=True)
+        self.buffer.add(self.reader.pk, self.articles[0].pk)
+        self.buffer.add(self.reader.pk, self.articles[1].pk)
+        self.articles[1].delete()
+        self.assertEqual(self.buffer.flush(), 0)
+        self.assertEqual(self.stored(),
+                         {(self.reader.pk, self.articles[0].pk)})
+
+    def test_reading_an_article_does_not_write(self):
+        url = reverse("articles:specific_article", args=["read-0"])
+        with mock.patch('authors.apps.articles.views.read_buffer',
+                        self.buffer), \
+                mock.patch('authors.apps.articles.views.view_counter',
+                           ViewCounter()), \
+                mock.patch('django.db.transaction.on_commit',
+                           lambda callback: callback()), \
+                CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200)
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertFalse(any('reading_stats' in query['sql']
+                             for query in queries.captured_queries))
+        self.assertEqual(len(self.buffer), 1)
+        with mock.patch('authors.apps.reading_stats.views.read_buffer',
+                        self.buffer):
+            response = self.client.get(reverse("read:user_read_stats"))
+        self.assertEqual(response.data['count'], 1)
@@ -0,0 +1,116 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient, APITestCase
+
+from authors.apps.articles.models import Article
+from authors.apps.authentication.backends import JWTokens
+from authors.apps.authentication.models import User
+
+from ..models import (DailyArticleReads, DailyAuthorReads, DailyUserReads,
+                      ReadStats, RollupWatermark)
+from ..rollups import WATERMARK, roll_up
+
+
+class ReadRollupTest(APITestCase):
+    """
+        Daily rollups of the reads and the dashboards served from them
+    """
+
+    def setUp(self):
+        self.client = APIClient()
+        self.author = User.objects.create_user(
+            "author", "author@mail.com", "Author@254")
+        self.reader = User.objects.create_user(
+            "reader", "reader@mail.com", "Reader@254")
+        # 450 words take three minutes to read
+        self.long, self.short = [Article.objects.create(
+            title=slug, slug=slug, body=" ".join(["word"] * words),
+            author=self.author)
+            for slug, words in (("long", 450), ("short", 10))]
+        self.today = timezone.localdate()
+
+    def read(self, user, article, days_ago=0):
+        read = ReadStats.objects.create(user=user, article=article,
+                                        article_read=True)
+        ReadStats.objects.filter(pk=read.pk).update(
+            created_at=timezone.now() - timedelta(days=days_ago))
+        return read
+
+    def login(self, user):
+        self.client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                                JWTokens.create_token(self, user=user))
+
+    def test_reads_are_rolled_up_per_day(self):
+        self.read(self.reader, self.long, days_ago=1)
+        self.read(self.reader, self.short)
+        self.read(self.author, self.long)
+        self.assertEqual(roll_up(lag=0), 3)
+        yesterday = self.today - timedelta(days=1)
+        self.assertEqual(set(DailyUserReads.objects.values_list(
+            'user__username', 'day', 'reads', 'minutes')), {
+                ("reader", yesterday, 1, 3), ("reader", self.today, 1, 1),
+                ("author", self.today, 1, 3)})
+        self.assertEqual(set(DailyArticleReads.objects.values_list(
+            'article__slug', 'day', 'reads', 'minutes')), {
+                ("long", yesterday, 1, 3), ("long", self.today, 1, 3),
+                ("short", self.today, 1, 1)})
+        self.assertEqual(set(DailyAuthorReads.objects.values_list(
+            'author__username', 'day', 'reads', 'minutes')), {
+                ("author", yesterday, 1, 3), ("author", self.today, 2, 4)})
+
+    def test_only_new_reads_are_rolled_up(self):
+        self.read(self.reader, self.long)
+        self.assertEqual(roll_up(lag=0), 1)
+        self.assertEqual(roll_up(lag=0), 0)
+        last = self.read(self.author, self.long)
+        out = StringIO()
+        call_command('rollup_reads', '--lag=0', stdout=out)
+        self.assertIn("Rolled up 1 reads", out.getvalue())
+        self.assertEqual(RollupWatermark.objects.get(
+            name=WATERMARK).position, last.pk)
+        self.assertEqual(DailyArticleReads.objects.get().reads, 2)
+
+    def test_recent_reads_wait_for_the_lag(self):
+        self.read(self.reader, self.long)
+        self.assertEqual(roll_up(lag=60), 0)
+        self.assertFalse(DailyUserReads.objects.exists())
+
+    def test_dashboards(self):
+        self.read(self.reader, self.long)
+        self.read(self.reader, self.short, days_ago=1)
+        self.read(self.author, self.long, days_ago=40)
+        roll_up(lag=0)
+        self.login(self.reader)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("read:user_daily_reads"), {"days": 7})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['reads'], response.data['minutes']),
+                         (2, 4))
+        self.assertEqual([row['day'] for row in response.data['results']], [
+            str(self.today - timedelta(days=1)), str(self.today)])
+        self.assertLessEqual(len(queries.captured_queries), 3)
+        url = reverse("read:article_daily_reads", args=["long"])
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.login(self.author)
+        self.assertEqual(self.client.get(url).data['reads'], 1)
+        self.assertEqual(self.client.get(
+            reverse("read:author_daily_reads"), {"days": 60}).data['reads'], 3)
+        self.assertEqual(self.client.get(reverse(
+            "read:article_daily_reads", args=["missing"])).status_code, 404)
+
+    def test_read_stats_list_loads_the_articles_with_the_reads(self):
+        self.read(self.reader, self.long)
+        self.read(self.reader, self.short)
+        self.login(self.reader)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("read:user_read_stats"))
+        self.assertEqual(response.data['count'], 2)
+        self.assertFalse(any('FROM "articles_article" WHERE' in query['sql']
+                             for query in queries.captured_queries))
@@ -1,6 +1,8 @@
 from django.urls import path
 
-from .views import UserReadStatsView, UserCompleteStatView 
+from .views import (ArticleDailyReadsView, AuthorDailyReadsView,
+                    UserCompleteStatView, UserDailyReadsView,
+                    UserReadStatsView)
 
 
 
@@ -9,4 +11,10 @@ app_name = "read"
 urlpatterns = [
     path("read-stats/", UserReadStatsView.as_view(), name="user_read_stats"),
     path("read/<str:slug>/", UserCompleteStatView.as_view(), name="article_read"),
+    path("read-stats/daily/", UserDailyReadsView.as_view(),
+         name="user_daily_reads"),
+    path("read-stats/authored/", AuthorDailyReadsView.as_view(),
+         name="author_daily_reads"),
+    path("read-stats/articles/<str:slug>/", ArticleDailyReadsView.as_view(),
+         name="article_daily_reads"),
 ]
\ No newline at end of file
@@ -1,9 +1,18 @@
-from rest_framework import status
+from datetime import timedelta
+
+from django.db.models import Sum
+from django.utils import timezone
+from rest_framework import exceptions, status
 from rest_framework.permissions import IsAuthenticated
-from .serializers import ReadStatsSerializers
-from .models import ReadStats
+from rest_framework.views import APIView
+from .buffer import read_buffer
+from .serializers import DailyReadsSerializer, ReadStatsSerializers
+from .models import (DailyArticleReads, DailyAuthorReads, DailyUserReads,
+                     ReadStats)
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.response import Response
+from authors.apps.articles.messages import error_msgs
+from authors.apps.articles.models import Article
 from authors.apps.authentication.messages import read_stats_message
 
 
@@ -14,7 +23,10 @@ class UserReadStatsView(ListAPIView):
         """"
             This gets all the articles the user has read
         """
-        return ReadStats.objects.filter(user=self.request.user)
+        # include the reads this worker has not written yet
+        read_buffer.flush()
+        return ReadStats.objects.filter(
+            user=self.request.user).select_related('article').order_by('pk')
 
 
 class UserCompleteStatView(RetrieveAPIView):
@@ -27,8 +39,10 @@ class UserCompleteStatView(RetrieveAPIView):
            article__slug specidies that the slug is from the articles object
            if a no article with such slug exists then it throws an error
         """
+        read_buffer.flush()
         try:
-            user_stat = ReadStats.objects.get(article__slug=slug)
+            user_stat = ReadStats.objects.get(
+                user=request.user, article__slug=slug)
         except ReadStats.DoesNotExist:
             return Response({
                 "message": read_stats_message['read_error']},
@@ -46,3 +60,71 @@ class UserCompleteStatView(RetrieveAPIView):
                 "message": read_stats_message['read_status']
             }, status.HTTP_200_OK
         )
+
+
+class DailyReadsView(APIView):
+    """
+        Reads per day over the last `?days=` days, served from the daily
+        rollups kept by `manage.py rollup_reads`
+    """
+    permission_classes = (IsAuthenticated,)
+    default_days = 30
+    max_days = 366
+
+    def rollup(self, request, **kwargs):
+        """
+            The rollup rows to serve
+        """
+        raise NotImplementedError
+
+    def get(self, request, **kwargs):
+        try:
+            days = min(max(int(request.query_params.get(
+                'days', self.default_days)), 1), self.max_days)
+        except ValueError:
+            days = self.default_days
+        since = timezone.localdate() - timedelta(days=days - 1)
+        rows = self.rollup(request, **kwargs).filter(
+            day__gte=since).order_by('day')
+        totals = rows.aggregate(reads=Sum('reads'), minutes=Sum('minutes'))
+        return Response({
+            "days": days,
+            "reads": totals['reads'] or 0,
+            "minutes": totals['minutes'] or 0,
+            "results": DailyReadsSerializer(rows, many=True).data,
+        }, status=status.HTTP_200_OK)
+
+
+class UserDailyReadsView(DailyReadsView):
+    """
+        GET /api/v1/read-stats/daily/
+    """
+
+    def rollup(self, request):
+        return DailyUserReads.objects.filter(user=request.user)
+
+
+class AuthorDailyReadsView(DailyReadsView):
+    """
+        GET /api/v1/read-stats/authored/, reads of the user's articles
+    """
+
+    def rollup(self, request):
+        return DailyAuthorReads.objects.filter(author=request.user)
+
+
+class ArticleDailyReadsView(DailyReadsView):
+    """
+        GET /api/v1/read-stats/articles/<slug>/, for the article's author
+    """
+
+    def rollup(self, request, slug):
+        article = Article.objects.filter(slug=slug).values(
+            'pk', 'author_id').first()
+        if article is None:
+            raise exceptions.NotFound({
+                "message": read_stats_message['read_error']})
+        if article['author_id'] != request.user.id:
+            raise exceptions.PermissionDenied({
+                "message": error_msgs['article_owner_error']})
+        return DailyArticleReads.objects.filter(article_id=article['pk'])
@@ -54,6 +54,7 @@ INSTALLED_APPS = [
 
     'authors.apps.authentication',
     'authors.apps.articles',
+    'authors.apps.article_bodies',
     'authors.apps.rating',
 
     'authors.apps.like_dislike',
@@ -62,6 +63,8 @@ INSTALLED_APPS = [
     "authors.apps.favorite",
     'authors.apps.profiles',
     'authors.apps.reading_stats',
+    'authors.apps.feed',
+    'authors.apps.jobs',
     'rest_framework_swagger',
     'drf_yasg',
     'social_django',
@@ -116,6 +119,29 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/2.1/topics/cache/
+# Point CACHE_BACKEND and CACHE_LOCATION at a cache shared by every
+# worker (e.g. memcached) to cache article payloads and answer
+# conditional GETs. Invalidations of a per-process cache would not reach
+# the other workers, so the article cache is off with one.
+
+CACHE_BACKEND = os.getenv(
+    'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+ARTICLE_CACHE_ENABLED = CACHE_BACKEND not in (
+    'django.core.cache.backends.dummy.DummyCache',
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+ARTICLE_CACHE_TIMEOUT = int(os.getenv('ARTICLE_CACHE_TIMEOUT', 60 * 60))
+
 # Password validation
 # https://docs.djangoproject.com/en/2.1.4/ref/settings/#auth-password-validators
 
@@ -171,10 +197,23 @@ REST_FRAMEWORK = {
         'rest_framework_jwt.authentication.JSONWebTokenAuthentication',
     ),
 
+    'DEFAULT_RENDERER_CLASSES': (
+        'authors.apps.core.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'authors.apps.core.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
+
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 12
 }
 
+# 'auto', 'orjson' or 'json', see authors/apps/core/codec.py
+JSON_CODEC = os.getenv('JSON_CODEC', 'auto')
+
 # Django Rest Framework Jwt settings
 JWT_AUTH = {
     'JWT_ENCODE_HANDLER':
@@ -48,6 +48,8 @@ urlpatterns = [
     path('api/v1/', include('authors.apps.authentication.urls'), name='apiv1'),
     path('api/v1/', include('authors.apps.profiles.urls',
                             namespace='profile'), name='apiv1'),
+    # before the articles, whose slugs would shadow articles/feed/
+    path('api/v1/', include('authors.apps.feed.urls')),
     path('api/v1/', include('authors.apps.articles.urls')),
     path('api/v1/', include('authors.apps.rating.urls')),
     path('api/v1/', include('authors.apps.comments.urls')),
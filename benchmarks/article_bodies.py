@@ -0,0 +1,96 @@
+"""
+    Database size and list query latency with article bodies still in
+    the articles table, as they are after migrating, after `manage.py
+    move_article_bodies` has moved them into ArticleBody, and with the
+    moved bodies zlib-compressed.
+
+        python benchmarks/article_bodies.py [--articles 2000] [--words 1000]
+"""
+import argparse
+import random
+from io import StringIO
+from unittest import mock
+
+from common import report, test_database, timed
+
+from django.core.management import call_command  # noqa: E402
+from django.db.models import Sum  # noqa: E402
+
+PAGE_SIZE = 20
+
+
+def bodies(count, words):
+    """
+        Bodies of random words from a vocabulary, which compress about as
+        well as prose
+    """
+    rng = random.Random(0)
+    vocabulary = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz')
+                          for _ in range(rng.randint(2, 9)))
+                  for _ in range(3000)]
+    return [' '.join(rng.choice(vocabulary) for _ in range(words))[:8000]
+            for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=2000)
+    parser.add_argument('--words', type=int, default=1000)
+    args = parser.parse_args()
+
+    from authors.apps.article_bodies.models import ArticleBody
+    from authors.apps.articles.models import Article
+    from authors.apps.authentication.models import User
+
+    with test_database() as connection:
+        author = User.objects.create_user(
+            "bench", "bench@mail.com", "Bench@254")
+        # bulk_create skips save(), leaving the bodies where they used to be
+        Article.objects.bulk_create([
+            Article(title="Article {}".format(i), slug="article-{}".format(i),
+                    body=body, excerpt=body[:200], author=author)
+            for i, body in enumerate(bodies(args.articles, args.words))])
+        slug = "article-{}".format(args.articles // 2)
+
+        def size():
+            with connection.cursor() as cursor:
+                cursor.execute('VACUUM')
+                cursor.execute('PRAGMA page_count')
+                pages = cursor.fetchone()[0]
+                cursor.execute('PRAGMA page_size')
+                return pages * cursor.fetchone()[0] / 1024 / 1024
+
+        def page():
+            list(Article.objects.with_engagement().order_by(
+                '-created_at', '-id')[:PAGE_SIZE])
+
+        def scan():
+            Article.objects.aggregate(Sum('word_count'))
+
+        def detail():
+            Article.objects.select_related('content').get(slug=slug).body_text
+
+        def measure(name):
+            rows.append((name, '{:.1f}'.format(size()),
+                         '{:.2f}'.format(timed(page, repeat=20)),
+                         '{:.2f}'.format(timed(scan, repeat=20)),
+                         '{:.3f}'.format(timed(detail, repeat=20))))
+
+        rows = []
+        measure("bodies in articles")
+        call_command('move_article_bodies', stdout=StringIO())
+        measure("moved to ArticleBody")
+        with mock.patch(
+                'authors.apps.article_bodies.models.BODY_COMPRESS_AT', 1024):
+            packed = [ArticleBody(article_id=stored.article_id,
+                                  **ArticleBody.pack(stored.body))
+                      for stored in ArticleBody.objects.all()]
+        ArticleBody.objects.all().delete()
+        ArticleBody.objects.bulk_create(packed)
+        measure("moved and compressed")
+        report("{} articles of {} words".format(args.articles, args.words),
+               rows, ("layout", "DB MiB", "page ms", "scan ms", "detail ms"))
+
+
+if __name__ == '__main__':
+    main()
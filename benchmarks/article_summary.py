@@ -0,0 +1,73 @@
+"""
+    Bytes read from the database, payload size and latency of a page of
+    articles serialized with full bodies, as the article list used to
+    be, and with excerpts.
+
+        python benchmarks/article_summary.py [--articles 100]
+"""
+import argparse
+
+from common import report, test_database, timed
+
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=100)
+    args = parser.parse_args()
+
+    from authors.apps.article_bodies.models import ArticleBody
+    from authors.apps.articles.models import Article
+    from authors.apps.articles.serializers import (
+        ArticleSerializer, ArticleSummarySerializer)
+    from authors.apps.authentication.models import User
+    from authors.apps.core import codec
+    from django.db import connection
+
+    with test_database():
+        author = User.objects.create_user(
+            "bench", "bench@mail.com", "Bench@254")
+        Article.objects.bulk_create([
+            Article(title="Article {}".format(i), slug="article-{}".format(i),
+                    excerpt=("Lorem ipsum dolor sit amet. " * 8)[:200],
+                    author=author)
+            for i in range(args.articles)])
+        ArticleBody.objects.bulk_create([
+            ArticleBody(article_id=pk,
+                        text=("Lorem ipsum dolor sit amet. " * 300)[:8000])
+            for pk in Article.objects.values_list('pk', flat=True)])
+        request = Request(APIRequestFactory().get('/api/v1/articles/'))
+
+        summary = Article.objects.with_engagement().order_by(
+            '-created_at', '-id')[:args.articles]
+        full = Article.objects.with_engagement().select_related(
+            'content').order_by('-created_at', '-id')[:args.articles]
+
+        def page(queryset, serializer):
+            return lambda: codec.dumps({'articles': serializer(
+                queryset.all(), many=True,
+                context={'request': request}).data})
+
+        def bytes_read(queryset):
+            sql, params = queryset.query.sql_with_params()
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                return sum(len(str(value)) for row in cursor.fetchall()
+                           for value in row)
+
+        rows = []
+        for name, queryset, serializer in (
+                ("full bodies", full, ArticleSerializer),
+                ("excerpts", summary, ArticleSummarySerializer)):
+            render = page(queryset, serializer)
+            rows.append((name, '{:.1f}'.format(bytes_read(queryset) / 1024),
+                         '{:.1f}'.format(len(render()) / 1024),
+                         '{:.1f}'.format(timed(render))))
+        report("{} articles of 8000 characters, one page".format(
+            args.articles), rows, ("page", "KiB read", "KiB sent", "ms"))
+
+
+if __name__ == '__main__':
+    main()
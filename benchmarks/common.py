@@ -0,0 +1,62 @@
+"""
+    Helpers shared by the benchmark scripts in this directory.
+
+    Every benchmark runs against a throwaway test database created from
+    the project settings, so it never touches real data:
+
+        python benchmarks/<name>.py
+"""
+import contextlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "authors.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+
+@contextlib.contextmanager
+def test_database():
+    """
+        Create the test database, run the migrations and drop it afterwards
+    """
+    from django.db import connection
+    from django.test.utils import (setup_test_environment,
+                                   teardown_test_environment)
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield connection
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def timed(func, repeat=5):
+    """
+        Best wall-clock time of `repeat` calls to func, in milliseconds
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def report(title, rows, headers):
+    """
+        Print the results as a plain text table
+    """
+    widths = [max(len(str(value)) for value in column)
+              for column in zip(headers, *rows)]
+    print(title)
+    for row in [headers] + list(rows):
+        print("  ".join(str(value).rjust(width)
+                        for value, width in zip(row, widths)))
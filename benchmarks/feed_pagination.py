@@ -0,0 +1,83 @@
+"""
+    Latency of GET /api/v1/articles/ on page 1 and on a deep page, with
+    page number (OFFSET) pagination and with keyset cursor pagination.
+
+        python benchmarks/feed_pagination.py [--page 10000] [--page-size 12]
+"""
+import argparse
+import datetime
+from urllib.parse import parse_qs, urlparse
+
+from common import report, test_database, timed
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.pagination import Cursor  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+
+def populate(pages, page_size):
+    """
+        Bulk insert enough articles for `pages` pages, one second apart
+    """
+    from authors.apps.articles.models import Article
+    from authors.apps.authentication.models import User
+
+    author = User.objects.create_user(
+        "bench", "bench@mail.com", "Bench@254")
+    created_at = Article._meta.get_field('created_at')
+    created_at.auto_now_add = False
+    start = timezone.now() - datetime.timedelta(days=365)
+    total = pages * page_size
+    for offset in range(0, total, 5000):
+        Article.objects.bulk_create([
+            Article(title="Article {}".format(i), body="Lorem ipsum",
+                    slug="article-{}".format(i), author=author,
+                    created_at=start + datetime.timedelta(seconds=i))
+            for i in range(offset, min(offset + 5000, total))
+        ])
+    created_at.auto_now_add = True
+    return total
+
+
+def cursor_for_page(page, page_size):
+    """
+        The cursor a client holds after walking to the given page
+    """
+    from authors.apps.articles.models import Article
+    from authors.apps.core.pagination import FeedCursorPagination
+
+    if page == 1:
+        return ''
+    last = Article.objects.order_by('-created_at', '-id')[
+        (page - 1) * page_size - 1]
+    pagination = FeedCursorPagination()
+    pagination.base_url = 'http://testserver/'
+    link = pagination.encode_cursor(Cursor(
+        offset=0, reverse=False, position=pagination.position(last)))
+    return parse_qs(urlparse(link).query)['cursor'][0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--page', type=int, default=10000)
+    parser.add_argument('--page-size', type=int, default=12)
+    args = parser.parse_args()
+
+    with test_database():
+        total = populate(args.page, args.page_size)
+        client = APIClient()
+        rows = []
+        for page in (1, args.page):
+            offset = timed(lambda: client.get('/api/v1/articles/', {
+                'page': page, 'page_size': args.page_size}))
+            cursor = cursor_for_page(page, args.page_size)
+            keyset = timed(lambda: client.get('/api/v1/articles/', {
+                'cursor': cursor, 'page_size': args.page_size}))
+            rows.append((page, '{:.1f}'.format(offset),
+                         '{:.1f}'.format(keyset)))
+        report("{} articles, {} per page".format(total, args.page_size),
+               rows, ("page", "page number ms", "cursor ms"))
+
+
+if __name__ == '__main__':
+    main()
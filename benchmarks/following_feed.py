@@ -0,0 +1,93 @@
+"""
+    Latency of the first page of a following feed for a reader who
+    follows many authors: the join of the follow graph with the articles
+    against the fanned-out FeedEntry range, and GET /api/v1/articles/feed/.
+
+        python benchmarks/following_feed.py [--follows 10000] [--articles 5]
+"""
+import argparse
+import datetime
+
+from common import report, test_database, timed
+
+from django.utils import timezone  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+PAGE_SIZE = 12
+
+
+def populate(follows, articles):
+    """
+        A reader following `follows` authors of `articles` articles each,
+        with the feed entries fan-out on write would have created
+    """
+    from authors.apps.articles.models import Article
+    from authors.apps.authentication.models import User
+    from authors.apps.feed.models import FeedEntry
+    from authors.apps.profiles.models import Profile
+
+    reader = User.objects.create_user(
+        "reader", "reader@mail.com", "Reader@254")
+    # bulk inserts skip the signals that create profiles and fan out
+    User.objects.bulk_create([
+        User(username="author{}".format(i),
+             email="author{}@mail.com".format(i))
+        for i in range(follows)])
+    authors = list(User.objects.exclude(pk=reader.pk).values_list(
+        'pk', flat=True))
+    Profile.objects.bulk_create([
+        Profile(user_id=pk, follower_count=1) for pk in authors])
+    Profile.is_following.through.objects.bulk_create([
+        Profile.is_following.through(profile=reader.profiles, user_id=pk)
+        for pk in authors])
+    created_at = Article._meta.get_field('created_at')
+    created_at.auto_now_add = False
+    start = timezone.now() - datetime.timedelta(days=365)
+    Article.objects.bulk_create([
+        Article(title="Article", body="Lorem ipsum",
+                slug="article-{}-{}".format(pk, i), author_id=pk,
+                created_at=start + datetime.timedelta(
+                    seconds=i * follows + n))
+        for n, pk in enumerate(authors) for i in range(articles)])
+    created_at.auto_now_add = True
+    FeedEntry.objects.bulk_create([
+        FeedEntry(user=reader, article_id=pk, author_id=author_id,
+                  created_at=created)
+        for pk, author_id, created in Article.objects.values_list(
+            'pk', 'author_id', 'created_at')])
+    return reader
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--follows', type=int, default=10000)
+    parser.add_argument('--articles', type=int, default=5)
+    args = parser.parse_args()
+
+    from authors.apps.articles.models import Article
+    from authors.apps.authentication.backends import JWTokens
+    from authors.apps.feed.models import FeedEntry
+
+    with test_database():
+        reader = populate(args.follows, args.articles)
+        join = timed(lambda: list(Article.objects.filter(
+            author__in=reader.profiles.is_following.all()).order_by(
+                '-created_at', '-id').values_list('id', flat=True)[
+                    :PAGE_SIZE]))
+        entries = timed(lambda: list(FeedEntry.objects.filter(
+            user=reader).order_by('-created_at', '-article').values_list(
+                'article_id', flat=True)[:PAGE_SIZE]))
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION="Bearer " +
+                           JWTokens.create_token(None, user=reader))
+        endpoint = timed(lambda: client.get('/api/v1/articles/feed/'))
+        report("{} follows, {} articles each, first page of {}".format(
+            args.follows, args.articles, PAGE_SIZE), [
+                ("follow graph join", '{:.1f}'.format(join)),
+                ("feed entries", '{:.1f}'.format(entries)),
+                ("GET articles/feed/", '{:.1f}'.format(endpoint)),
+            ], ("query", "ms"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+    Time to serialize a page of articles and to render it to JSON with
+    the renderer of Django REST framework, as the API used to, with a
+    bare json.dumps, and with each codec of authors/apps/core/codec.py
+    available here.
+
+        python benchmarks/json_rendering.py [--articles 100]
+"""
+import argparse
+import json
+
+from common import report, test_database, timed
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--articles', type=int, default=100)
+    args = parser.parse_args()
+
+    from authors.apps.articles.models import Article, Tags
+    from authors.apps.articles.serializers import ArticleSerializer
+    from authors.apps.authentication.models import User
+    from authors.apps.core import codec
+    from rest_framework.request import Request
+
+    with test_database():
+        author = User.objects.create_user(
+            "bench", "bench@mail.com", "Bench@254")
+        tags = [Tags.objects.create(tag="Tag {}".format(i)) for i in range(5)]
+        for i in range(args.articles):
+            article = Article.objects.create(
+                title="Article {}".format(i), slug="article-{}".format(i),
+                body="Lorem ipsum dolor sit amet. " * 200, author=author)
+            article.tags.set(tags)
+        articles = list(Article.objects.with_engagement(
+            author).prefetch_related('tags').select_related(
+                'author', 'content')[:args.articles])
+        request = Request(APIRequestFactory().get('/api/v1/articles/'))
+        request.user = author
+
+        def serialize():
+            return ArticleSerializer(articles, many=True,
+                                     context={'request': request}).data
+
+        data = serialize()
+        rows = [("serialize", '{:.2f}'.format(timed(serialize)))]
+        rows.append(("render with rest_framework", '{:.2f}'.format(
+            timed(lambda: JSONRenderer().render({'articles': data})))))
+        rows.append(("render with json.dumps", '{:.2f}'.format(
+            timed(lambda: json.dumps({'articles': data}).encode()))))
+        for name, (dumps, _) in sorted(codec.CODECS.items()):
+            rows.append(("render with codec " + name, '{:.2f}'.format(
+                timed(lambda: dumps({'articles': data})))))
+        report("{} articles, one page".format(args.articles), rows,
+               ("step", "ms"))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+    Time to send emails to a local SMTP server with one connection per
+    email, as django.core.mail.send_mail does, and over the connection
+    the job workers keep open.
+
+        python benchmarks/mail_batching.py [--emails 200] [--batch-size 10]
+"""
+import argparse
+import asyncore
+import smtpd
+import threading
+
+from common import report, timed
+
+from django.core.mail import send_mail  # noqa: E402
+from django.test.utils import override_settings  # noqa: E402
+
+
+class Sink(smtpd.SMTPServer):
+    """
+        SMTP server that accepts every message and throws it away
+    """
+
+    def __init__(self):
+        self.map = {}
+        super().__init__(('127.0.0.1', 0), None, map=self.map,
+                         decode_data=True)
+        self.running = True
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        while self.running:
+            asyncore.loop(timeout=0.05, count=1, map=self.map)
+
+    def handle_accepted(self, conn, addr):
+        smtpd.SMTPChannel(self, conn, addr, map=self.map, decode_data=True)
+
+    def process_message(self, *args, **kwargs):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--emails', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=10)
+    args = parser.parse_args()
+
+    from authors.apps.jobs.mail import email, mailer
+
+    sink = Sink()
+    payloads = [dict(subject="Hello", message="Hello",
+                     from_email="haven@mail.com",
+                     recipient_list=["reader{}@mail.com".format(i)])
+                for i in range(args.emails)]
+
+    def one_connection_each():
+        for payload in payloads:
+            send_mail(fail_silently=False, **payload)
+
+    def batched():
+        for start in range(0, len(payloads), args.batch_size):
+            mailer.send([email(**payload) for payload in
+                         payloads[start:start + args.batch_size]])
+        mailer.close()
+
+    with override_settings(
+            EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            EMAIL_HOST='127.0.0.1', EMAIL_PORT=sink.socket.getsockname()[1],
+            EMAIL_USE_TLS=False, EMAIL_HOST_PASSWORD=''):
+        each = timed(one_connection_each, repeat=3)
+        pooled = timed(batched, repeat=3)
+    sink.running = False
+    report("{} emails, batches of {}, plain SMTP on localhost".format(
+        args.emails, args.batch_size), [
+            ("connection per email", '{:.1f}'.format(each),
+             '{:.2f}'.format(each / args.emails)),
+            ("worker connection", '{:.1f}'.format(pooled),
+             '{:.2f}'.format(pooled / args.emails)),
+        ], ("sending", "total ms", "ms per email"))
+
+
+if __name__ == '__main__':
+    main()
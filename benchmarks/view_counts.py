@@ -0,0 +1,98 @@
+"""
+    Load test of concurrent reads of a single article: throughput of
+    GET /api/v1/articles/<slug>/ from several threads when every read
+    adds one to the view count with its own UPDATE, and when the views
+    are counted in memory and added by the periodic flush. Runs against
+    a file database so that the threads share it the way workers do.
+
+        python benchmarks/view_counts.py [--threads 8] [--reads 250]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from common import report, test_database
+
+from django.db import connection, connections  # noqa: E402
+from django.db.models import F  # noqa: E402
+from django.test import Client  # noqa: E402
+
+SLUG = "viral"
+
+
+def load(threads, reads):
+    """
+        Reads per second of `threads` clients reading the article `reads`
+        times each, and the number of reads that failed
+    """
+    failed = []
+
+    def reader():
+        client = Client()
+        try:
+            for _ in range(reads):
+                response = client.get('/api/v1/articles/{}/'.format(SLUG))
+                if response.status_code != 200:
+                    failed.append(response.status_code)
+        finally:
+            connections.close_all()
+
+    workers = [threading.Thread(target=reader) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * reads / (time.perf_counter() - start), len(failed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--reads', type=int, default=250)
+    args = parser.parse_args()
+
+    from authors.apps.articles.models import Article
+    from authors.apps.articles.view_counts import ViewCounter
+    from authors.apps.authentication.models import User
+
+    directory = tempfile.mkdtemp()
+    connection.settings_dict['TEST']['NAME'] = os.path.join(
+        directory, 'views.sqlite3')
+    with test_database():
+        author = User.objects.create_user(
+            "bench", "bench@mail.com", "Bench@254")
+        article = Article.objects.create(
+            title="Viral", slug=SLUG, body="Lorem ipsum " * 500,
+            author=author)
+        connection.close()
+        views = Article.objects.filter(pk=article.pk)
+
+        class RowPerRead:
+            # what a naive counter does on every read
+            def record(self, article_id):
+                Article.objects.filter(pk=article_id).update(
+                    view_count=F('view_count') + 1)
+
+        counter = ViewCounter(seconds=1)
+        rows = []
+        for name, recorder in (("UPDATE per read", RowPerRead()),
+                               ("counted in memory", counter)):
+            views.update(view_count=0)
+            with mock.patch('authors.apps.articles.views.view_counter',
+                            recorder):
+                throughput, failed = load(args.threads, args.reads)
+            counter.flush()
+            rows.append((name, '{:.0f}'.format(throughput), failed,
+                         views.values_list('view_count', flat=True).get()))
+        report("{} threads reading one article {} times each".format(
+            args.threads, args.reads), rows,
+            ("views", "reads/s", "failed", "counted"))
+    os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()